@@ -1,6 +1,88 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
-from .models import User, Subject, TutorSubject, LessonRequest
+from django.core.paginator import Paginator
+from django.db import DatabaseError, connections, router
+from django.utils.functional import cached_property
+from .models import User, Subject, TutorSubject, LessonRequest, ArchivedLessonRequest
+
+
+def estimated_row_count(model):
+    """
+    Tablonun satır sayısını veritabanı istatistiğinden okur; istatistik yoksa None
+    """
+    connection = connections[router.db_for_read(model)]
+    table = model._meta.db_table
+    try:
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute('SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass', [table])
+            elif connection.vendor == 'sqlite':
+                # sqlite_stat1 yalnızca ANALYZE çalıştırıldıktan sonra vardır
+                cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+                if cursor.fetchone() is None:
+                    return None
+                cursor.execute("SELECT CAST(stat AS INTEGER) FROM sqlite_stat1 WHERE tbl = %s LIMIT 1", [table])
+            elif connection.vendor == 'mysql':
+                cursor.execute(
+                    'SELECT table_rows FROM information_schema.tables '
+                    'WHERE table_schema = DATABASE() AND table_name = %s', [table]
+                )
+            else:
+                return None
+            row = cursor.fetchone()
+    except DatabaseError:
+        return None
+    return row[0] if row and row[0] and row[0] > 0 else None
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Büyük tablolarda COUNT(*) yapmayan admin paginator'ı
+
+    Sayım en fazla EXACT_COUNT_LIMIT satırla sınırlı bir alt sorguyla
+    yapılır. Sınır aşılırsa filtresiz listede tablo istatistiğindeki tahmin,
+    filtreli listede sınır değeri kullanılır.
+    """
+    EXACT_COUNT_LIMIT = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        limit = self.EXACT_COUNT_LIMIT
+        count = queryset.order_by()[:limit + 1].count()
+        if count <= limit:
+            return count
+        if not queryset.query.has_filters():
+            estimate = estimated_row_count(queryset.model)
+            if estimate:
+                return max(estimate, count)
+        return count
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """
+    Milyonlarca satırlı tablolar için ortak ayarlar: tahmini sayım, tam
+    sonuç sayısı gösterilmez
+    """
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
+class IdSearchMixin:
+    """
+    Yalnızca rakamlardan oluşan aramayı birincil anahtarla eşler
+
+    '=id' araması id sütununu metne çevirip karşılaştırdığından indeks
+    kullanılamaz. Diğer aramalar search_fields'taki önek aramalarıyla yapılır.
+    """
+    MAX_ID = 2 ** 63 - 1
+
+    def get_search_results(self, request, queryset, search_term):
+        term = search_term.strip()
+        if term.isascii() and term.isdigit():
+            pk = int(term)
+            return (queryset.filter(pk=pk) if pk <= self.MAX_ID else queryset.none()), False
+        return super().get_search_results(request, queryset, search_term)
 
 
 @admin.register(User)
@@ -8,10 +90,14 @@ class CustomUserAdmin(UserAdmin):
     """
     Özel kullanıcı admin paneli
     """
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     list_display = ('username', 'email', 'role', 'rating', 'total_lessons', 'is_active')
     list_filter = ('role', 'is_active', 'grade_level')
-    search_fields = ('username', 'email', 'first_name', 'last_name')
-    
+    # Önek araması (LIKE 'x%'); otomatik tamamlama widget'ları da bunu kullanır
+    search_fields = ('^username', '^email', '^first_name', '^last_name')
+    search_help_text = 'Kullanıcı adı, e-posta, ad veya soyadının başıyla arar'
+
     fieldsets = UserAdmin.fieldsets + (
         ('Ek Bilgiler', {
             'fields': ('role', 'bio', 'grade_level', 'rating', 'total_lessons')
@@ -30,22 +116,48 @@ class SubjectAdmin(admin.ModelAdmin):
 
 
 @admin.register(TutorSubject)
-class TutorSubjectAdmin(admin.ModelAdmin):
+class TutorSubjectAdmin(LargeTableAdmin):
     """
     Öğretmen-Ders ilişkisi admin paneli
     """
     list_display = ('tutor', 'subject', 'experience_years')
     list_filter = ('subject', 'experience_years')
-    search_fields = ('tutor__username', 'subject__name')
+    list_select_related = ('tutor', 'subject')
+    autocomplete_fields = ('tutor', 'subject')
+    search_fields = ('^tutor__username',)
 
 
 @admin.register(LessonRequest)
-class LessonRequestAdmin(admin.ModelAdmin):
+class LessonRequestAdmin(IdSearchMixin, LargeTableAdmin):
     """
     Ders talepleri admin paneli
     """
     list_display = ('student', 'tutor', 'subject', 'status', 'preferred_date', 'created_at')
-    list_filter = ('status', 'subject', 'created_at')
-    search_fields = ('student__username', 'tutor__username', 'subject__name')
+    list_filter = ('status', 'subject')
+    list_select_related = ('student', 'tutor', 'subject')
+    autocomplete_fields = ('student', 'tutor', 'subject')
+    # created_at indeksli (lessonreq_created_idx)
+    date_hierarchy = 'created_at'
+    search_fields = ('^student__username', '^tutor__username')
+    search_help_text = 'Talep no ya da öğrenci/öğretmen kullanıcı adının başıyla arar'
     readonly_fields = ('created_at', 'updated_at')
     ordering = ('-created_at',)
+
+
+@admin.register(ArchivedLessonRequest)
+class ArchivedLessonRequestAdmin(IdSearchMixin, LargeTableAdmin):
+    """
+    Arşivlenmiş ders talepleri (salt okunur)
+    """
+    list_display = ('id', 'student', 'tutor', 'subject', 'status', 'created_at', 'archived_at')
+    list_filter = ('status',)
+    list_select_related = ('student', 'tutor', 'subject')
+    search_fields = ('^student__username', '^tutor__username')
+    search_help_text = 'Talep no ya da öğrenci/öğretmen kullanıcı adının başıyla arar'
+    ordering = ('-created_at',)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
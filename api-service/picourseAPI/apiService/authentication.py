@@ -0,0 +1,114 @@
+"""
+Doğrulanmış JWT'leri süreç içinde önbelleğe alan kimlik doğrulama
+
+Erişim token'ı 24 saat geçerli ve istemci her istekte aynı token'ı
+gönderir; JWTAuthentication ise her seferinde base64 çözme, HMAC doğrulama
+ve JSON ayrıştırmayı baştan yapar. İmzası doğrulanmış token'lar
+sha256(token) -> token nesnesi olarak sınırlı bir LRU önbellekte tutulur;
+tekrar gelen token için doğrulama bir sözlük okumasına iner.
+
+Önbellekteki token 'exp' süresi dolduğunda kullanılmaz ve atılır; süresi
+dolmuş token normal doğrulamaya düşer ve her zamanki hatayı alır.
+Kullanıcı kontrolleri (aktif mi, var mı) her istekte get_user'da yapılmaya
+devam eder.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+
+class TokenCache:
+    """
+    Süre farkındalıklı, sınırlı LRU önbellek: anahtar -> (değer, son geçerlilik)
+    """
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, now=None):
+        now = time.time() if now is None else now
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at = entry
+            if expires_at <= now:
+                del self.entries[key]
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, expires_at, now=None):
+        if self.max_size <= 0:
+            return
+        now = time.time() if now is None else now
+        with self.lock:
+            self.entries[key] = (value, expires_at)
+            self.entries.move_to_end(key)
+            if len(self.entries) > self.max_size:
+                self.evict(now)
+
+    def evict(self, now):
+        # Önce süresi dolanlar, yetmezse en uzun süredir kullanılmayanlar atılır
+        expired = [key for key, (_, expires_at) in self.entries.items() if expires_at <= now]
+        for key in expired:
+            del self.entries[key]
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def discard(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self):
+        return len(self.entries)
+
+
+token_cache = TokenCache(getattr(settings, 'JWT_VERIFICATION_CACHE_SIZE', 10000))
+
+
+def token_digest(raw_token):
+    if isinstance(raw_token, str):
+        raw_token = raw_token.encode()
+    return hashlib.sha256(raw_token).digest()
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    Doğrulanmış token'ları token_cache'ten okuyan JWTAuthentication
+    """
+    cache = token_cache
+
+    def get_validated_token(self, raw_token):
+        key = token_digest(raw_token)
+        validated_token = self.cache.get(key)
+        if validated_token is not None:
+            return validated_token
+
+        validated_token = super().get_validated_token(raw_token)
+        expires_at = validated_token.get('exp')
+        if expires_at is not None:
+            leeway = validated_token.get_token_backend().get_leeway()
+            self.cache.set(key, validated_token, expires_at + leeway.total_seconds())
+        return validated_token
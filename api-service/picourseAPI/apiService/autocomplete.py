@@ -0,0 +1,158 @@
+"""
+Öğretmen adı ve ders adı için bellek içi önek (prefix) araması
+
+Aranabilir her metin (ad soyad, soyad, kullanıcı adı, ders adı ve ders
+adındaki her kelimeden başlayan kısım) Türkçe küçük harfe çevrilip
+(anahtar, (tür, id)) olarak sıralı bir listede tutulur. Sorgu bisect ile
+önekin ilk konumunu bulur ve önek uyduğu sürece ilerler; veritabanına
+gidilmez.
+
+Dizin süreç başına ilk kullanımda (wsgi.py'de açılışta) kurulur,
+kayıt/silme sinyalleriyle commit sonrasında güncellenir. Diğer
+süreçlerdeki değişiklikler için AUTOCOMPLETE_REBUILD_SECONDS üst sınırdır.
+Güncellemeler listenin kopyası üzerinde yapılıp tek atamayla
+yayımlandığı için okumalar kilit almaz. Süresi dolan dizini tek bir
+istek yeniden kurar; kurulum sürerken diğer istekler eski dizinden okur.
+"""
+import threading
+import time
+from bisect import bisect_left, insort
+
+from django.conf import settings
+
+from .models import Subject, User
+
+TURKISH_UPPER = str.maketrans({'I': 'ı', 'İ': 'i'})
+
+# Tek istekte dönebilecek en fazla sonuç
+MAX_RESULTS = 20
+
+
+def fold(text):
+    """
+    Türkçe kurallarıyla küçük harf: I -> ı, İ -> i
+    """
+    return ' '.join(text.translate(TURKISH_UPPER).lower().split())
+
+
+def search_keys(*texts):
+    """
+    Metinlerin kendisi ve her kelimeden başlayan son kısımları
+    """
+    keys = set()
+    for text in texts:
+        words = fold(text or '').split()
+        for index in range(len(words)):
+            keys.add(' '.join(words[index:]))
+    return keys
+
+
+def tutor_item(user):
+    label = user.get_full_name() or user.username
+    keys = search_keys(label, user.username)
+    return ('tutor', user.pk), {'type': 'tutor', 'id': user.pk, 'label': label}, keys
+
+
+def subject_item(subject):
+    keys = search_keys(subject.name)
+    return ('subject', subject.pk), {'type': 'subject', 'id': subject.pk, 'label': subject.name}, keys
+
+
+class PrefixIndex:
+    def __init__(self):
+        self.entries = None
+        self.items = {}
+        self.keys = {}
+        self.built_at = 0.0
+        self.lock = threading.Lock()
+        self.build_lock = threading.Lock()
+
+    def build(self):
+        items, keys, entries = {}, {}, []
+        tutors = User.objects.filter(role='tutor', is_active=True).only(
+            'id', 'username', 'first_name', 'last_name'
+        )
+        for obj_key, item, item_keys in [tutor_item(user) for user in tutors] + [
+            subject_item(subject) for subject in Subject.objects.only('id', 'name')
+        ]:
+            items[obj_key] = item
+            keys[obj_key] = item_keys
+            entries.extend((key, obj_key) for key in item_keys)
+        entries.sort()
+        with self.lock:
+            self.items, self.keys, self.entries = items, keys, entries
+            self.built_at = time.monotonic()
+
+    def is_stale(self):
+        timeout = getattr(settings, 'AUTOCOMPLETE_REBUILD_SECONDS', 600)
+        return time.monotonic() - self.built_at > timeout
+
+    def ensure_built(self):
+        if self.entries is None:
+            # Okunacak dizin yok; herkes kurulumu bekler, yalnızca ilki kurar
+            with self.build_lock:
+                if self.entries is None:
+                    self.build()
+        elif self.is_stale() and self.build_lock.acquire(blocking=False):
+            # Kilidi alamayanlar kurulum bitene kadar eski dizinden okur
+            try:
+                if self.is_stale():
+                    self.build()
+            finally:
+                self.build_lock.release()
+
+    def update(self, obj_key, item=None, item_keys=()):
+        """
+        Nesnenin anahtarlarını değiştirir; item None ise nesneyi çıkarır
+        """
+        if self.entries is None or (item is None and obj_key not in self.keys):
+            return
+        with self.lock:
+            entries = list(self.entries)
+            for key in self.keys.pop(obj_key, ()):
+                index = bisect_left(entries, (key, obj_key))
+                if index < len(entries) and entries[index] == (key, obj_key):
+                    del entries[index]
+            items = dict(self.items)
+            items.pop(obj_key, None)
+            if item is not None:
+                items[obj_key] = item
+                self.keys[obj_key] = item_keys
+                for key in item_keys:
+                    insort(entries, (key, obj_key))
+            self.items, self.entries = items, entries
+
+    def search(self, query, limit=10):
+        self.ensure_built()
+        prefix = fold(query)
+        if not prefix:
+            return []
+        entries, items = self.entries, self.items
+        results, seen = [], set()
+        index = bisect_left(entries, (prefix,))
+        while index < len(entries) and len(results) < limit:
+            key, obj_key = entries[index]
+            if not key.startswith(prefix):
+                break
+            if obj_key not in seen and obj_key in items:
+                seen.add(obj_key)
+                results.append(items[obj_key])
+            index += 1
+        return results
+
+    def reset(self):
+        with self.lock:
+            self.entries = None
+            self.items, self.keys = {}, {}
+
+
+prefix_index = PrefixIndex()
+
+
+def tutor_update(user):
+    """
+    Kullanıcı kaydı için dizin güncellemesinin argümanları; öğretmen değilse çıkarma
+    """
+    if user.role == 'tutor' and user.is_active:
+        return tutor_item(user)
+    return (('tutor', user.pk),)
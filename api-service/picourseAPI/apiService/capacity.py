@@ -0,0 +1,232 @@
+"""
+Öğretmen kapasite sınırları (bekleyen talep sayısı, haftalık onaylı saat)
+
+Sınırlar her yazmada COUNT(*)/SUM yerine sayaç satırlarında tek bir
+koşullu UPDATE ile kontrol edilir:
+
+    UPDATE ... SET pending_count = pending_count + 1
+    WHERE tutor_id = %s AND pending_count <= cap - 1
+
+Etkilenen satır yoksa sınır doludur. Kontrol ve artırma tek ifadede
+olduğu için eşzamanlı isteklerde sınır aşılamaz. Sayaç satırı ilk
+ihtiyaçta kaynak tablodan sayılarak oluşturulur.
+
+Sayaçlar default veritabanındadır. Talep de default'taysa sayaç ve talep
+tek transaction'da yazılır. Talep bir shard'daysa iki veritabanı tek
+transaction'a alınamaz; adımlar ayrı ayrı ve sayaçların yalnızca fazla
+sayabileceği sırayla commit edilir:
+
+- yer ayırma (artırma) talep yazılmadan önce yapılır, talep yazılamazsa
+  ayrılan yer geri verilir;
+- yer bırakma (azaltma) talep yazıldıktan sonra yapılır.
+
+Arada süreç ölürse veya default'a yazılamazsa sayaç fazla kalır: sınır
+aşılmaz, yalnızca öğretmen olduğundan erken dolu görünür. Bu kayma
+`python manage.py rebuild_tutor_capacity` ile düzeltilir; shard'lı
+kurulumda komut düzenli (ör. gece cron ile) çalıştırılmalıdır.
+"""
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import Count, F, Sum
+from django.utils import timezone
+
+from .models import LessonRequest, TutorCapacity, TutorWeeklyLoad
+from .sharding import lesson_request_aliases, shard_for_tutor
+
+
+class CapacityExceeded(Exception):
+    pass
+
+
+def week_start(moment):
+    """
+    Verilen anın (yerel saatle) haftasının pazartesi günü
+    """
+    day = timezone.localtime(moment).date()
+    return day - timedelta(days=day.weekday())
+
+
+def _increment(model, lookup, field, amount, cap, initial):
+    """
+    Sayaç satırını sınırı aşmıyorsa artırır; satır yoksa initial() ile oluşturur
+    """
+    available = model.objects.filter(**lookup, **{f'{field}__lte': cap - amount})
+    if available.update(**{field: F(field) + amount}):
+        return True
+    # Satır varsa sınır doludur; kaynak tablo yalnızca satır yoksa sayılır
+    if model.objects.filter(**lookup).exists():
+        return False
+    # Arada başka bir istek oluşturmuş olabilir; koşullu artırma bir kez daha denenir
+    model.objects.get_or_create(**lookup, defaults={field: initial()})
+    return bool(available.update(**{field: F(field) + amount}))
+
+
+def _decrement(model, lookup, field, amount):
+    # Satır yoksa ilk oluşturulduğunda kaynak tablodan doğru değerle sayılır
+    model.objects.filter(**lookup, **{f'{field}__gte': amount}).update(**{field: F(field) - amount})
+
+
+def reserve_pending_slot(tutor_id):
+    """
+    Yeni bekleyen talep için öğretmende yer ayırır; sınır doluysa CapacityExceeded
+
+    Talebin eklendiği transaction içinde çağrılmalıdır.
+    """
+    cap = settings.TUTOR_MAX_PENDING_REQUESTS
+    reserved = _increment(
+        TutorCapacity, {'tutor_id': tutor_id}, 'pending_count', 1, cap,
+        lambda: LessonRequest.objects.for_tutor(tutor_id).filter(status='pending').count()
+    )
+    if not reserved:
+        raise CapacityExceeded(f'Öğretmenin bekleyen talep sınırı ({cap}) dolu.')
+
+
+def release_pending_slot(tutor_id):
+    _decrement(TutorCapacity, {'tutor_id': tutor_id}, 'pending_count', 1)
+
+
+def create_pending_request(tutor_id, create):
+    """
+    Öğretmende yer ayırıp talebi create() ile yazar; sınır doluysa CapacityExceeded
+    """
+    database = shard_for_tutor(tutor_id)
+    if database == DEFAULT_DB_ALIAS:
+        with transaction.atomic():
+            reserve_pending_slot(tutor_id)
+            return create()
+
+    # Shard'daki talep: yer önce ayrılıp commit edilir (bkz. modül açıklaması)
+    with transaction.atomic():
+        reserve_pending_slot(tutor_id)
+    try:
+        with transaction.atomic(using=database):
+            return create()
+    except BaseException:
+        release_pending_slot(tutor_id)
+        raise
+
+
+def reserve_weekly_hours(tutor_id, preferred_date, hours):
+    cap = settings.TUTOR_MAX_WEEKLY_HOURS
+    start = week_start(preferred_date)
+
+    def initial():
+        week_from = timezone.make_aware(datetime.combine(start, time.min))
+        return LessonRequest.objects.for_tutor(tutor_id).filter(
+            status='approved',
+            preferred_date__gte=week_from,
+            preferred_date__lt=week_from + timedelta(days=7),
+        ).aggregate(total=Sum('duration_hours'))['total'] or 0
+
+    reserved = _increment(
+        TutorWeeklyLoad, {'tutor_id': tutor_id, 'week_start': start}, 'booked_hours',
+        hours, cap, initial
+    )
+    if not reserved:
+        raise CapacityExceeded(f'Öğretmenin {start} haftası için ders saati sınırı ({cap}) dolu.')
+
+
+def apply_status_change(lesson_request, new_status, version=None):
+    """
+    Talebin durumunu sayaçlarla birlikte değiştirir
+
+    Durum, okunduğu değerden (ve version verildiyse updated_at'ten) koşullu
+    UPDATE ile değiştirilir. Talep arada değiştiyse sayaçlar değişmez ve
+    False döner; sınır doluysa CapacityExceeded fırlatılır. Talep shard'daysa
+    adımlar ayrı commit edilir (bkz. modül açıklaması).
+    """
+    old_status = lesson_request.status
+    tutor_id = lesson_request.tutor_id
+    hours = lesson_request.duration_hours
+    week = {'tutor_id': tutor_id, 'week_start': week_start(lesson_request.preferred_date)}
+    reserves_hours = old_status != 'approved' and new_status == 'approved'
+    updated_at = timezone.now()
+
+    lookup = {'pk': lesson_request.pk, 'status': old_status}
+    if version is not None:
+        lookup['updated_at'] = version
+    database = lesson_request._state.db or shard_for_tutor(tutor_id)
+    changed = LessonRequest.objects.using(database).filter(**lookup)
+
+    if database == DEFAULT_DB_ALIAS:
+        with transaction.atomic():
+            # Sayaç durum değişmeden önce ayarlanır; ilk kez oluşturulan
+            # sayaç bu talebi henüz eski durumuyla sayar
+            if reserves_hours:
+                reserve_weekly_hours(tutor_id, lesson_request.preferred_date, hours)
+            if not changed.update(status=new_status, updated_at=updated_at):
+                transaction.set_rollback(True)
+                return False
+            _release_counters(old_status, new_status, tutor_id, week, hours)
+    else:
+        if reserves_hours:
+            with transaction.atomic():
+                reserve_weekly_hours(tutor_id, lesson_request.preferred_date, hours)
+        updated = 0
+        try:
+            updated = changed.update(status=new_status, updated_at=updated_at)
+        finally:
+            if not updated and reserves_hours:
+                _decrement(TutorWeeklyLoad, week, 'booked_hours', hours)
+        if not updated:
+            return False
+        _release_counters(old_status, new_status, tutor_id, week, hours)
+
+    lesson_request.status = new_status
+    lesson_request.updated_at = updated_at
+    return True
+
+
+def _release_counters(old_status, new_status, tutor_id, week, hours):
+    """
+    Durum değiştikten sonra eski durumun tuttuğu yerleri bırakır
+    """
+    if old_status == 'pending' and new_status != 'pending':
+        release_pending_slot(tutor_id)
+    if old_status == 'approved' and new_status != 'approved':
+        _decrement(TutorWeeklyLoad, week, 'booked_hours', hours)
+
+
+def rebuild_counters():
+    """
+    Sayaçları tüm shard'lardaki taleplerden yeniden hesaplar
+
+    Elle yapılan silmelerden ve shard'lı kurulumda sayaçlarda kalan
+    fazlalıktan sonra çalıştırılır. Satırlar silinmeden yerinde güncellenir
+    (upsert), böylece trafik altındayken sayaç hiçbir an boş görünmez. Komut çalışırken yarıda olan bir yazma sayacı bir eksik
+    bırakabileceği için trafiğin az olduğu saatlerde çalıştırılması önerilir.
+    """
+    # Bir öğretmenin talepleri tek shard'da olduğundan shard sonuçları çakışmaz
+    pending, loads = {}, {}
+    for database in lesson_request_aliases():
+        # Açık talepler (öğretmensiz) hiçbir öğretmenin sayacına girmez
+        counts = (
+            LessonRequest.objects.using(database).filter(status='pending', tutor__isnull=False)
+            .values('tutor_id').annotate(total=Count('id')).order_by()
+        )
+        pending.update((row['tutor_id'], row['total']) for row in counts)
+        approved = LessonRequest.objects.using(database).filter(status='approved').values_list(
+            'tutor_id', 'preferred_date', 'duration_hours'
+        )
+        for tutor_id, preferred_date, hours in approved.iterator():
+            key = (tutor_id, week_start(preferred_date))
+            loads[key] = loads.get(key, 0) + hours
+
+    # Sayılan talebi olmayan sayaçlar sıfırda kalır; diğerleri aynı transaction'da yazılır
+    with transaction.atomic():
+        TutorCapacity.objects.update(pending_count=0)
+        TutorWeeklyLoad.objects.update(booked_hours=0)
+        TutorCapacity.objects.bulk_create(
+            [TutorCapacity(tutor_id=tutor_id, pending_count=total) for tutor_id, total in pending.items()],
+            update_conflicts=True, unique_fields=['tutor'], update_fields=['pending_count'],
+        )
+        TutorWeeklyLoad.objects.bulk_create(
+            [
+                TutorWeeklyLoad(tutor_id=tutor_id, week_start=start, booked_hours=hours)
+                for (tutor_id, start), hours in loads.items()
+            ],
+            update_conflicts=True, unique_fields=['tutor', 'week_start'], update_fields=['booked_hours'],
+        )
+    return len(pending), len(loads)
@@ -0,0 +1,138 @@
+import hashlib
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import serializers, status
+from rest_framework.response import Response
+
+from .models import IdempotencyKey
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+MAX_KEY_LENGTH = 255
+
+
+def get_ttl():
+    return getattr(settings, 'IDEMPOTENCY_KEY_TTL', timedelta(hours=24))
+
+
+def get_claim_timeout():
+    return getattr(settings, 'IDEMPOTENCY_CLAIM_TIMEOUT', timedelta(seconds=30))
+
+
+def request_fingerprint(request):
+    """
+    Aynı anahtarın farklı bir gövdeyle tekrar kullanılmasını yakalamak için
+    istek gövdesinin özeti
+    """
+    payload = json.dumps(request.data, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def replay(stored, fingerprint):
+    if stored.request_fingerprint != fingerprint:
+        return Response(
+            {'error': 'Bu Idempotency-Key farklı bir istek için kullanılmış.'},
+            status=status.HTTP_422_UNPROCESSABLE_ENTITY
+        )
+    if stored.response_status is None:
+        return Response(
+            {'error': 'Bu Idempotency-Key ile yapılan istek henüz tamamlanmadı.'},
+            status=status.HTTP_409_CONFLICT
+        )
+    response = Response(stored.response_body, status=stored.response_status)
+    response['Idempotent-Replayed'] = 'true'
+    return response
+
+
+def idempotent_create(request, perform):
+    """
+    perform() çağrısını Idempotency-Key başlığına göre tek seferlik yapar.
+
+    perform (status, body) döndürür. Anahtar, perform'dan önce kendi
+    transaction'ında yanıtsız olarak eklenip commit edilir; aynı anahtarla
+    eşzamanlı gelen ikinci istek unique kısıtına takılır ve ilk istek
+    bitmediyse 409, bittiyse onun yanıtını alır. Oluşturulan satır başka
+    bir veritabanına (shard) yazılsa da anahtarı tek istek alabildiği için
+    çift kayıt oluşmaz.
+
+    perform hata verirse anahtar silinir ve aynı anahtarla tekrar
+    denenebilir. Süreç yanıtı yazamadan ölürse anahtar
+    IDEMPOTENCY_CLAIM_TIMEOUT sonra yeniden kullanılabilir.
+    """
+    key = request.headers.get(IDEMPOTENCY_HEADER)
+    if not key:
+        response_status, body = perform()
+        return Response(body, status=response_status)
+    if len(key) > MAX_KEY_LENGTH:
+        return Response(
+            {'error': f'Idempotency-Key en fazla {MAX_KEY_LENGTH} karakter olabilir.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    now = timezone.now()
+    fingerprint = request_fingerprint(request)
+    stored = IdempotencyKey.objects.filter(user=request.user, key=key).first()
+    if stored is not None:
+        if stored.expires_at > now:
+            return replay(stored, fingerprint)
+        # Süresi dolmuş anahtar yeniden kullanılabilir
+        stored.delete()
+
+    try:
+        with transaction.atomic():
+            claim = IdempotencyKey.objects.create(
+                user=request.user,
+                key=key,
+                request_fingerprint=fingerprint,
+                expires_at=now + get_claim_timeout()
+            )
+    except IntegrityError:
+        stored = IdempotencyKey.objects.filter(user=request.user, key=key).first()
+        if stored is None:
+            raise
+        return replay(stored, fingerprint)
+
+    try:
+        response_status, body = perform()
+    except BaseException:
+        IdempotencyKey.objects.filter(pk=claim.pk).delete()
+        raise
+    # Anahtar arada süresi dolup silindiyse güncelleme hiçbir şey yapmaz
+    IdempotencyKey.objects.filter(pk=claim.pk).update(
+        response_status=response_status,
+        response_body=body,
+        expires_at=timezone.now() + get_ttl()
+    )
+    return Response(body, status=response_status)
+
+
+def purge_expired_keys(now=None):
+    """
+    Süresi dolmuş anahtarları toplu olarak siler
+    """
+    deleted, _ = IdempotencyKey.objects.filter(expires_at__lte=now or timezone.now()).delete()
+    return deleted
+
+
+def make_version_etag(updated_at):
+    """
+    updated_at değerini API'nin döndürdüğü biçimde ETag olarak kodlar
+    """
+    return '"%s"' % serializers.DateTimeField().to_representation(updated_at)
+
+
+def parse_version_etag(value):
+    """
+    If-Match başlığındaki sürümü datetime'a çevirir; geçersizse None döner
+    """
+    value = value.strip()
+    if value.startswith('W/'):
+        value = value[2:]
+    try:
+        return parse_datetime(value.strip('"'))
+    except ValueError:
+        return None
@@ -0,0 +1,236 @@
+"""
+API dokümantasyonu (OpenAPI şeması ve Swagger UI) view'ları
+
+drf_spectacular'ın şema üretici ve view modülleri ağırdır ve nadiren
+kullanılır; bu modül onları yalnızca ilk istekte import eder.
+
+Şema her istekte üretilmez. settings.OPENAPI_SCHEMA_FILE yolunda YAML ve
+JSON çıktıları ile URLconf/serializer kaynaklarının özeti tutulur. Özet
+değişmemişse dosya sunulur, değişmişse şema bir kez yeniden üretilip
+diske yazılır. Özete apiService'in tüm modülleri, settings modülü ve
+DRF/SimpleJWT ayarları girer. İçerik süreç içinde bellekte tutulur ve ETag ile sunulur.
+"""
+import hashlib
+import importlib.util
+import logging
+import os
+import threading
+from functools import cache
+from pathlib import Path
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+# Özete girmeyen kaynaklar: şemayı etkilemezler
+SCHEMA_IGNORED_SOURCES = {'tests.py'}
+
+# Şemayı etkileyen ayarlar; imza anahtarları özete girmez
+SCHEMA_SETTINGS = {
+    'REST_FRAMEWORK': (),
+    'SIMPLE_JWT': ('SIGNING_KEY', 'VERIFYING_KEY'),
+    'SPECTACULAR_SETTINGS': (),
+}
+
+SCHEMA_FORMATS = {
+    'yaml': ('drf_spectacular.renderers.OpenApiYamlRenderer', 'application/vnd.oai.openapi'),
+    'json': ('drf_spectacular.renderers.OpenApiJsonRenderer', 'application/vnd.oai.openapi+json'),
+}
+
+
+def lazy_view(dotted_path, **initkwargs):
+    """
+    Class-based view'ı ilk istekte import edip oluşturan view
+    """
+    view = None
+
+    def wrapper(request, *args, **kwargs):
+        nonlocal view
+        if view is None:
+            view = import_string(dotted_path).as_view(**initkwargs)
+        return view(request, *args, **kwargs)
+
+    # DRF view'ları CSRF kontrolünden muaftır
+    wrapper.csrf_exempt = True
+    return wrapper
+
+
+@cache
+def schema_fingerprint():
+    """
+    URLconf, settings ve apiService kaynakları ile DRF, SimpleJWT ve
+    drf-spectacular ayarlarının özeti
+
+    Elle tutulan bir modül listesi yerine proje ve uygulamanın tüm kaynakları
+    okunur; yeni bir modül (ör. kimlik doğrulama sınıfı) şemayı etkilediğinde
+    özet kendiliğinden değişir. Kod değişikliği süreci yeniden başlattığı
+    için özet süreç başına bir kez hesaplanır.
+    """
+    from importlib.metadata import version
+
+    # Proje paketi (URLconf ve settings modülleri) ile apiService'in kaynakları;
+    # yollar yerine göreli adlar özete girer, özet makineden bağımsız kalır
+    app_directory = Path(__file__).resolve().parent
+    project_directory = Path(importlib.util.find_spec(settings.ROOT_URLCONF).origin).resolve().parent
+    sources = []
+    for directory in (project_directory, app_directory):
+        sources += [
+            (f'{directory.name}/{path.relative_to(directory).as_posix()}', path)
+            for path in sorted(directory.rglob('*.py'))
+            if path.name not in SCHEMA_IGNORED_SOURCES and 'migrations' not in path.parts
+        ]
+
+    digest = hashlib.sha256()
+    for name, path in sources:
+        digest.update(name.encode())
+        digest.update(path.read_bytes())
+    digest.update(version('drf-spectacular').encode())
+    for name, secret_keys in SCHEMA_SETTINGS.items():
+        values = {
+            key: value for key, value in getattr(settings, name, {}).items() if key not in secret_keys
+        }
+        digest.update(f'{name}={sorted(values.items())!r}'.encode())
+    return digest.hexdigest()
+
+
+def schema_paths():
+    """
+    {format: dosya yolu} ve özet dosyasının yolu; şema dosyası ayarlı değilse None
+    """
+    path = getattr(settings, 'OPENAPI_SCHEMA_FILE', None)
+    if not path:
+        return None, None
+    path = Path(path)
+    files = {'yaml': path, 'json': path.with_suffix('.json')}
+    return files, path.with_suffix('.sha256')
+
+
+def generate_schema():
+    """
+    Şemayı üretir ve {format: bayt} olarak döner
+    """
+    from drf_spectacular.settings import spectacular_settings
+
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS()
+    schema = generator.get_schema(request=None, public=True)
+    return {
+        fmt: import_string(renderer)().render(schema, renderer_context={})
+        for fmt, (renderer, _) in SCHEMA_FORMATS.items()
+    }
+
+
+def write_schema_files(contents, fingerprint):
+    """
+    Şema dosyalarını ve özeti atomik olarak (geçici dosya + rename) yazar
+    """
+    files, fingerprint_file = schema_paths()
+    outputs = [(files[fmt], data) for fmt, data in contents.items()]
+    # Özet en son yazılır; yarım kalan yazım bir sonraki istekte tekrarlanır
+    outputs.append((fingerprint_file, fingerprint.encode()))
+    for path, data in outputs:
+        tmp_path = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+
+def schema_is_fresh():
+    files, fingerprint_file = schema_paths()
+    if files is None:
+        return False
+    try:
+        stored = fingerprint_file.read_text().strip()
+    except OSError:
+        return False
+    return stored == schema_fingerprint() and all(path.is_file() for path in files.values())
+
+
+def build_schema():
+    """
+    Şemayı üretir; dosya ayarlıysa diske yazar. {format: bayt} döner
+    """
+    contents = generate_schema()
+    files, _ = schema_paths()
+    if files is not None:
+        try:
+            write_schema_files(contents, schema_fingerprint())
+        except OSError:
+            # Salt okunur dağıtımlarda şema yalnızca bellekten sunulur
+            logger.warning('OpenAPI şeması diske yazılamadı', exc_info=True)
+    return contents
+
+
+def load_schema():
+    """
+    Güncel şemayı {format: (bayt, etag)} olarak döner: diskte güncelse dosyadan,
+    değilse yeniden üreterek
+    """
+    if schema_is_fresh():
+        files, _ = schema_paths()
+        contents = {fmt: path.read_bytes() for fmt, path in files.items()}
+    else:
+        contents = build_schema()
+    return {
+        fmt: (data, '"%s"' % hashlib.blake2b(data, digest_size=16).hexdigest())
+        for fmt, data in contents.items()
+    }
+
+
+_schema_cache = {}
+_schema_lock = threading.Lock()
+
+
+def get_schema():
+    """
+    Süreç içinde önbelleğe alınmış şema; aynı anda gelen istekler tek üretim bekler
+    """
+    schema = _schema_cache.get('schema')
+    if schema is None:
+        with _schema_lock:
+            schema = _schema_cache.get('schema')
+            if schema is None:
+                schema = _schema_cache['schema'] = load_schema()
+    return schema
+
+
+def clear_schema_cache():
+    _schema_cache.clear()
+    schema_fingerprint.cache_clear()
+
+
+def requested_format(request):
+    fmt = request.GET.get('format')
+    if fmt in ('json', 'openapi-json'):
+        return 'json'
+    if fmt in ('yaml', 'openapi'):
+        return 'yaml'
+    if fmt is None and 'json' in request.META.get('HTTP_ACCEPT', ''):
+        return 'json'
+    return 'yaml' if fmt is None else None
+
+
+_generated_schema_view = lazy_view('drf_spectacular.views.SpectacularAPIView')
+
+
+def schema_view(request, *args, **kwargs):
+    """
+    Önbellekteki şemayı ETag ile sunar; dil (lang) gibi özel istekler dinamik üretilir
+    """
+    fmt = requested_format(request)
+    if fmt is None or request.GET.get('lang') or request.method not in ('GET', 'HEAD'):
+        return _generated_schema_view(request, *args, **kwargs)
+
+    content, etag = get_schema()[fmt]
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = HttpResponse(content, content_type=SCHEMA_FORMATS[fmt][1])
+    response.headers['ETag'] = etag
+    patch_cache_control(response, public=True, no_cache=True)
+    return response
+
+
+schema_view.csrf_exempt = True
+
+swagger_view = lazy_view('drf_spectacular.views.SpectacularSwaggerView', url_name='schema')
@@ -0,0 +1,48 @@
+"""
+Testler için model fabrikaları
+"""
+from datetime import timedelta
+from itertools import count
+
+from django.utils import timezone
+
+from .models import User, Subject, TutorSubject, LessonRequest
+from .tutor_cards import refresh_tutor_cards
+
+_sequence = count(1)
+
+
+def make_user(role, password=None, **fields):
+    """
+    Parola verilmezse kullanılamaz parola atanır; hash maliyeti oluşmaz
+    """
+    number = next(_sequence)
+    fields.setdefault('username', f'{role}{number}')
+    fields.setdefault('email', f"{fields['username']}@test.com")
+    return User.objects.create_user(role=role, password=password, **fields)
+
+
+def make_student(**fields):
+    return make_user('student', **fields)
+
+
+def make_tutor(subjects=(), experience_years=0, **fields):
+    tutor = make_user('tutor', **fields)
+    TutorSubject.objects.bulk_create([
+        TutorSubject(tutor=tutor, subject=subject, experience_years=experience_years)
+        for subject in subjects
+    ])
+    # Testlerde commit sonrası sinyal kuyruğu çalışmadığından kart doğrudan kurulur
+    refresh_tutor_cards([tutor.pk])
+    return tutor
+
+
+def make_subject(**fields):
+    fields.setdefault('name', f'Subject {next(_sequence)}')
+    return Subject.objects.create(**fields)
+
+
+def make_lesson_request(student, tutor, subject, **fields):
+    fields.setdefault('message', 'Test message')
+    fields.setdefault('preferred_date', timezone.now() + timedelta(days=1))
+    return LessonRequest.objects.create(student=student, tutor=tutor, subject=subject, **fields)
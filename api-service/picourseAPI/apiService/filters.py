@@ -0,0 +1,127 @@
+import django_filters
+from django.db.models import Count, Exists, OuterRef, Q
+
+from .models import TutorCard, TutorCardSubject, User, TutorSubject
+
+
+class NumberInFilter(django_filters.BaseInFilter, django_filters.NumberFilter):
+    """
+    Virgülle ayrılmış sayı listesi filtresi (ör. ?subjects=1,2,3)
+    """
+    pass
+
+
+class TutorFilter(django_filters.FilterSet):
+    """
+    Öğretmen listesi filtreleri
+
+    Ders/deneyim filtreleri JOIN yerine TutorSubject üzerinde EXISTS alt
+    sorgularıyla uygulanır; böylece aynı öğretmen sonuçta tekrar etmez.
+    """
+    # Ders satırlarının tablosu ve satırı listelenen kayda bağlayan alan
+    posting_model = TutorSubject
+    posting_owner = 'tutor'
+
+    SUBJECT_MATCH_CHOICES = [
+        ('any', 'Herhangi biri'),
+        ('all', 'Tümü'),
+    ]
+
+    # 'all' eşleşmesinde bu sayıya kadar ders için her ders ayrı bir EXISTS
+    # ile (unique tutor+subject indeksi) kontrol edilir; daha fazlası için
+    # tek bir GROUP BY/HAVING alt sorgusu kullanılır.
+    EXISTS_CHAIN_LIMIT = 3
+
+    SUBJECT_FILTERS = ('subjects', 'subject_match', 'min_experience', 'tutor_subjects__subject')
+
+    subjects = NumberInFilter(label='Ders ID listesi')
+    subject_match = django_filters.ChoiceFilter(
+        choices=SUBJECT_MATCH_CHOICES,
+        label='Ders eşleşme tipi (any/all)'
+    )
+    min_experience = django_filters.NumberFilter(label='Minimum deneyim yılı')
+    min_rating = django_filters.NumberFilter(field_name='rating', lookup_expr='gte')
+    max_rating = django_filters.NumberFilter(field_name='rating', lookup_expr='lte')
+    grade_level = django_filters.NumberFilter(method='filter_grade_level', label='Sınıf seviyesi')
+    # Geriye dönük uyumluluk: tek ders ile filtreleme
+    tutor_subjects__subject = django_filters.NumberFilter(label='Ders ID')
+
+    class Meta:
+        model = User
+        fields = []
+
+    def filter_queryset(self, queryset):
+        for name, value in self.form.cleaned_data.items():
+            if name in self.SUBJECT_FILTERS:
+                continue
+            queryset = self.filters[name].filter(queryset, value)
+        return self.filter_subjects(queryset, self.form.cleaned_data)
+
+    def get_subject_ids(self, data):
+        subject_ids = {int(pk) for pk in data.get('subjects') or []}
+        if data.get('tutor_subjects__subject') is not None:
+            subject_ids.add(int(data['tutor_subjects__subject']))
+        return subject_ids
+
+    def filter_subjects(self, queryset, data):
+        subject_ids = self.get_subject_ids(data)
+        min_experience = data.get('min_experience')
+
+        if not subject_ids and min_experience is None:
+            return queryset
+
+        postings = self.posting_model.objects.all()
+        if min_experience is not None:
+            postings = postings.filter(experience_years__gte=min_experience)
+        owner = {self.posting_owner: OuterRef('pk')}
+
+        if not subject_ids:
+            return queryset.filter(Exists(postings.filter(**owner)))
+
+        if data.get('subject_match') != 'all' or len(subject_ids) == 1:
+            return queryset.filter(
+                Exists(postings.filter(subject_id__in=subject_ids, **owner))
+            )
+
+        if len(subject_ids) <= self.EXISTS_CHAIN_LIMIT:
+            for subject_id in sorted(subject_ids):
+                queryset = queryset.filter(
+                    Exists(postings.filter(subject_id=subject_id, **owner))
+                )
+            return queryset
+
+        matching_tutors = (
+            postings.filter(subject_id__in=subject_ids)
+            .values(self.posting_owner)
+            .annotate(matched=Count('subject', distinct=True))
+            .filter(matched=len(subject_ids))
+            .values(self.posting_owner)
+        )
+        return queryset.filter(pk__in=matching_tutors)
+
+    def filter_grade_level(self, queryset, name, value):
+        # Öğretmenin grade_level alanı verebildiği en üst sınıfı belirtir;
+        # boş bırakılmışsa tüm sınıf seviyelerine ders verebilir.
+        return queryset.filter(Q(grade_level__isnull=True) | Q(grade_level__gte=value))
+
+
+class TutorCardFilter(TutorFilter):
+    """
+    Öğretmen kartı filtreleri: TutorFilter ile aynı parametreler
+
+    Ders ve deneyim filtreleri kartla birlikte yazılan TutorCardSubject
+    satırlarında (subject, card) indeksiyle uygulanır; yalnızca deneyim
+    verildiğinde kartın max_experience sütunu yeterlidir.
+    """
+    posting_model = TutorCardSubject
+    posting_owner = 'card'
+
+    class Meta:
+        model = TutorCard
+        fields = []
+
+    def filter_subjects(self, queryset, data):
+        min_experience = data.get('min_experience')
+        if min_experience is not None and not self.get_subject_ids(data):
+            return queryset.filter(max_experience__gte=min_experience)
+        return super().filter_subjects(queryset, data)
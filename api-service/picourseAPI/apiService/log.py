@@ -0,0 +1,223 @@
+"""
+Yapılandırılmış (JSON) ve istek akışını bekletmeyen loglama
+
+- QueueJsonHandler kayıtları sınırlı bir kuyruğa bırakır; JSON'a çevirme ve
+  yazma işini arka plandaki QueueListener iş parçacığı yapar. Kuyruk
+  doluysa kayıt atılır ve sayılır, istek asla log I/O'su beklemez.
+- RequestLogMiddleware her isteğe bir request id atar (X-Request-ID),
+  SQL sorgularını execute_wrapper ile sayar/süreler ve istek satırını
+  endpoint bazlı örnekleme oranıyla loglar. Yavaş ve hatalı istekler
+  örneklemeden bağımsız olarak her zaman loglanır.
+- request id bir ContextVar'da tutulur; RequestIdFilter onu aynı istekte
+  üretilen tüm kayıtlara (SQL logları dahil) ekler.
+"""
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import re
+import sys
+import time
+import uuid
+from contextlib import ExitStack
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+
+from django.conf import settings
+from django.db import connections
+
+request_id_var = ContextVar('request_id', default=None)
+
+request_logger = logging.getLogger('apiService.requests')
+sql_logger = logging.getLogger('apiService.sql')
+
+REQUEST_LOG_DEFAULTS = {
+    # URL adı -> örnekleme oranı (0-1); listede olmayanlar DEFAULT_SAMPLE_RATE
+    'SAMPLE_RATES': {},
+    'DEFAULT_SAMPLE_RATE': 1.0,
+    # Bu süreyi aşan istekler ve sorgular her zaman loglanır (ms)
+    'SLOW_REQUEST_MS': 500,
+    'SLOW_QUERY_MS': 100,
+}
+
+REQUEST_ID_HEADER = 'X-Request-ID'
+VALID_REQUEST_ID = re.compile(r'^[A-Za-z0-9._-]{1,64}$')
+
+# LogRecord'un standart alanları; geri kalanlar (extra=...) JSON'a eklenir
+RESERVED_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {'message', 'asctime'}
+
+
+def request_log_settings():
+    return {**REQUEST_LOG_DEFAULTS, **getattr(settings, 'REQUEST_LOG', {})}
+
+
+class RequestIdFilter(logging.Filter):
+    """
+    Kayda o anki isteğin id'sini ekler (kaydı üreten iş parçacığında çalışır)
+    """
+    def filter(self, record):
+        if not hasattr(record, 'request_id'):
+            record.request_id = request_id_var.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Kaydı tek satırlık JSON'a çevirir
+    """
+    converter = time.gmtime
+
+    def format(self, record):
+        payload = {
+            'time': self.formatTime(record, '%Y-%m-%dT%H:%M:%S') + f'.{int(record.msecs):03d}Z',
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in RESERVED_ATTRS and value is not None:
+                payload[key] = value
+        if record.exc_info:
+            payload['exc'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload['exc'] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class QueueJsonHandler(QueueHandler):
+    """
+    Kayıtları arka plan iş parçacığında JSON olarak yazan handler
+
+    filename verilmezse stderr'e yazar. fork sonrası (ör. gunicorn worker,
+    paralel test süreçleri) dinleyici çocuk süreçte yeniden başlatılır.
+    """
+    def __init__(self, filename=None, queue_size=10000):
+        super().__init__(queue.Queue(maxsize=queue_size))
+        if filename:
+            target = logging.FileHandler(filename, encoding='utf-8')
+        else:
+            target = logging.StreamHandler(sys.stderr)
+        target.setFormatter(JsonFormatter())
+        self.target = target
+        self.dropped = 0
+        self.listener = None
+        self.start()
+        atexit.register(self.stop)
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._restart_in_child)
+
+    def start(self):
+        self.listener = QueueListener(self.queue, self.target, respect_handler_level=True)
+        self.listener.start()
+
+    def stop(self):
+        if self.listener is not None and self.listener._thread is not None:
+            self.listener.stop()
+
+    def _restart_in_child(self):
+        # Üst süreçteki dinleyici iş parçacığı çocuk sürece kopyalanmaz
+        self.queue = queue.Queue(maxsize=self.queue.maxsize)
+        self.start()
+
+    def prepare(self, record):
+        # Mesaj ve hata metni üreten iş parçacığında sabitlenir; JSON'a
+        # çevirme dinleyicide yapılır
+        record = logging.makeLogRecord(vars(record))
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class QueryRecorder:
+    """
+    Bir istekteki SQL sorgularını sayan ve yavaş olanları loglayan execute_wrapper
+    """
+    def __init__(self, slow_query_ms):
+        self.slow_query_ms = slow_query_ms
+        self.count = 0
+        self.duration_ms = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration_ms = (time.perf_counter() - started) * 1000
+            self.count += 1
+            self.duration_ms += duration_ms
+            if duration_ms >= self.slow_query_ms:
+                sql_logger.warning('slow query', extra={
+                    'request_id': request_id_var.get(),
+                    'sql': sql[:2000],
+                    'duration_ms': round(duration_ms, 2),
+                    'alias': context['connection'].alias,
+                })
+
+
+class RequestLogMiddleware:
+    """
+    İstek başına request id, SQL sayacı ve örneklenmiş istek logu
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def get_request_id(self, request):
+        incoming = request.headers.get(REQUEST_ID_HEADER, '')
+        if VALID_REQUEST_ID.match(incoming):
+            return incoming
+        return uuid.uuid4().hex
+
+    def __call__(self, request):
+        config = request_log_settings()
+        request_id = self.get_request_id(request)
+        token = request_id_var.set(request_id)
+        recorder = QueryRecorder(config['SLOW_QUERY_MS'])
+        started = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(recorder))
+                response = self.get_response(request)
+            duration_ms = (time.perf_counter() - started) * 1000
+            response[REQUEST_ID_HEADER] = request_id
+            self.log_request(request, response, duration_ms, recorder, config)
+            return response
+        finally:
+            request_id_var.reset(token)
+
+    def log_request(self, request, response, duration_ms, recorder, config):
+        match = request.resolver_match
+        route = match.view_name if match else None
+        sample_rate = config['SAMPLE_RATES'].get(route, config['DEFAULT_SAMPLE_RATE'])
+        slow = duration_ms >= config['SLOW_REQUEST_MS']
+        failed = response.status_code >= 500
+
+        if not (slow or failed or random.random() < sample_rate):
+            return
+        user = getattr(request, 'user', None)
+        level = logging.WARNING if slow or failed else logging.INFO
+        request_logger.log(level, 'request', extra={
+            'request_id': request_id_var.get(),
+            'method': request.method,
+            'path': request.path,
+            'route': route,
+            'status': response.status_code,
+            'duration_ms': round(duration_ms, 2),
+            'sql_count': recorder.count,
+            'sql_ms': round(recorder.duration_ms, 2),
+            'user_id': user.pk if user is not None and user.is_authenticated else None,
+            # Örneklenmiş satırlar analizde 1/sample_rate ile ağırlıklandırılır
+            'sample_rate': 1.0 if slow or failed else sample_rate,
+            'slow': slow,
+        })
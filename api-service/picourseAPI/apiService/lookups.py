@@ -0,0 +1,110 @@
+"""
+Sık tekrarlanan satır okumaları için önbellekler
+
+- Subject tablosu küçük ve nadiren değişir; tamamı süreç içinde id -> nesne
+  sözlüğünde tutulur. Kayıt/silme sinyalleri (signals.py) önbelleği
+  temizler, SUBJECT_CACHE_TIMEOUT diğer süreçlerdeki değişiklikler için üst
+  sınırdır. Önbellekteki nesneler paylaşılır, salt okunur kullanılmalıdır.
+- User satırları için istek ömürlü bir kimlik haritası (identity map):
+  aynı istekte aynı kullanıcı ikinci kez sorgulanmaz.
+"""
+import threading
+import time
+
+from django.conf import settings
+from rest_framework import serializers
+
+from .models import Subject, User
+
+_subject_cache = {'subjects': None, 'loaded_at': 0.0}
+_subject_lock = threading.Lock()
+
+
+def get_subject_map():
+    """
+    {id: Subject} sözlüğü; boşsa ya da süresi dolmuşsa tek sorguda yüklenir
+    """
+    subjects = _subject_cache['subjects']
+    timeout = getattr(settings, 'SUBJECT_CACHE_TIMEOUT', 300)
+    if subjects is None or time.monotonic() - _subject_cache['loaded_at'] > timeout:
+        with _subject_lock:
+            subjects = _subject_cache['subjects']
+            if subjects is None or time.monotonic() - _subject_cache['loaded_at'] > timeout:
+                subjects = {subject.pk: subject for subject in Subject.objects.all()}
+                _subject_cache.update(subjects=subjects, loaded_at=time.monotonic())
+    return subjects
+
+
+def get_subject(pk):
+    """
+    Subject'i önbellekten döner; önbellekte yoksa veritabanına bakar
+    """
+    subject = get_subject_map().get(pk)
+    if subject is None:
+        subject = Subject.objects.get(pk=pk)
+        # Başka bir süreçte eklenmiş; önbellek bir sonraki okumada yenilenir
+        clear_subject_cache()
+    return subject
+
+
+def clear_subject_cache():
+    _subject_cache['subjects'] = None
+
+
+def user_identity_map(request):
+    """
+    İstek ömürlü {id: User} haritası; kimliği doğrulanmış kullanıcı ile başlar
+    """
+    try:
+        return request._user_identity_map
+    except AttributeError:
+        identity_map = {}
+        if request.user.is_authenticated:
+            identity_map[request.user.pk] = request.user
+        request._user_identity_map = identity_map
+        return identity_map
+
+
+class CachedSubjectField(serializers.PrimaryKeyRelatedField):
+    """
+    Subject id'sini sorgu yerine süreç önbelleğinden çözen alan
+    """
+    def __init__(self, **kwargs):
+        kwargs.setdefault('queryset', Subject.objects.all())
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            return get_subject(int(data))
+        except Subject.DoesNotExist:
+            self.fail('does_not_exist', pk_value=data)
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+
+
+class IdentityMapUserField(serializers.PrimaryKeyRelatedField):
+    """
+    User id'sini önce isteğin kimlik haritasından çözen alan; sorgulanan
+    kullanıcılar aynı istekteki sonraki okumalar için haritaya eklenir
+    """
+    def __init__(self, **kwargs):
+        kwargs.setdefault('queryset', User.objects.all())
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        request = self.context.get('request')
+        if request is None:
+            return super().to_internal_value(data)
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+
+        identity_map = user_identity_map(request)
+        if pk not in identity_map:
+            identity_map[pk] = super().to_internal_value(pk)
+        return identity_map[pk]
@@ -0,0 +1,74 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from apiService.models import LessonRequest, ArchivedLessonRequest
+from apiService.sharding import lesson_request_aliases
+from apiService.sync import archiving_lesson_requests
+
+ARCHIVED_FIELDS = [
+    'id', 'student_id', 'tutor_id', 'subject_id', 'status', 'message',
+    'preferred_date', 'duration_hours', 'created_at', 'updated_at',
+    'grade_level', 'min_rating',
+]
+
+
+class Command(BaseCommand):
+    help = 'Sonuçlanmış (onaylanmış/reddedilmiş) eski ders taleplerini arşiv tablosuna taşır'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=getattr(settings, 'LESSON_REQUEST_ARCHIVE_AFTER_DAYS', 90),
+            help='Son güncellemesi bu kadar günden eski talepler arşivlenir',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Her transaction içinde taşınacak talep sayısı',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Taşımadan yalnızca arşivlenecek talep sayısını gösterir',
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        candidates = LessonRequest.objects.filter(
+            status__in=['approved', 'rejected'],
+            updated_at__lt=cutoff
+        )
+
+        databases = lesson_request_aliases()
+        if options['dry_run']:
+            total = sum(candidates.using(database).count() for database in databases)
+            self.stdout.write(f'{total} talep arşivlenecek.')
+            return
+
+        archived = 0
+        for database in databases:
+            shard_candidates = candidates.using(database)
+            while True:
+                # Arşiv default'ta, talepler shard'da olabilir; iki transaction birlikte açılır
+                with transaction.atomic(), transaction.atomic(using=database):
+                    rows = list(
+                        shard_candidates.order_by('pk').values(*ARCHIVED_FIELDS)[:options['batch_size']]
+                    )
+                    if not rows:
+                        break
+                    ArchivedLessonRequest.objects.bulk_create(
+                        [ArchivedLessonRequest(**row) for row in rows]
+                    )
+                    # Arşivlenen talepler silinmiş sayılmaz: senkronizasyon silme kayıtları yazılmaz
+                    with archiving_lesson_requests():
+                        shard_candidates.filter(pk__in=[row['id'] for row in rows]).delete()
+                archived += len(rows)
+                self.stdout.write(f'  ✓ {archived} talep arşivlendi')
+
+        self.stdout.write(self.style.SUCCESS(f'Toplam {archived} talep arşivlendi.'))
@@ -0,0 +1,64 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apiService.authentication import CachedJWTAuthentication, TokenCache
+from apiService.models import User
+
+
+class Command(BaseCommand):
+    help = 'JWT doğrulamasını önbelleksiz ve önbellekli ölçer; isabet oranını ve istek başına kazancı raporlar'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--tokens',
+            type=int,
+            default=1000,
+            help='Farklı token (istemci) sayısı',
+        )
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=20000,
+            help='Doğrulanacak istek sayısı; token\'lar rastgele seçilir',
+        )
+        parser.add_argument(
+            '--cache-size',
+            type=int,
+            default=10000,
+            help='Önbellek boyutu (varsayılan: 10000)',
+        )
+
+    def handle(self, *args, **options):
+        # Kullanıcı sorgusu ölçülmez; token'lar kaydedilmemiş kullanıcılar için üretilir
+        tokens = [
+            str(AccessToken.for_user(User(pk=pk))).encode()
+            for pk in range(1, options['tokens'] + 1)
+        ]
+        stream = random.Random(0).choices(tokens, k=options['requests'])
+
+        plain = JWTAuthentication()
+        cached = CachedJWTAuthentication()
+        cached.cache = TokenCache(options['cache_size'])
+
+        plain_us = self.measure(plain, stream)
+        cached_us = self.measure(cached, stream)
+
+        self.stdout.write(f"{options['requests']} istek, {options['tokens']} farklı token")
+        self.stdout.write(f'  önbelleksiz: {plain_us:.1f} µs/istek')
+        self.stdout.write(
+            f'  önbellekli:  {cached_us:.1f} µs/istek '
+            f'(isabet %{cached.cache.hit_rate * 100:.1f}, {len(cached.cache)} kayıt)'
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f'İstek başına kazanç: {plain_us - cached_us:.1f} µs ({plain_us / cached_us:.1f}x)'
+        ))
+
+    def measure(self, authentication, stream):
+        started = time.perf_counter()
+        for raw_token in stream:
+            authentication.get_validated_token(raw_token)
+        return (time.perf_counter() - started) * 1e6 / len(stream)
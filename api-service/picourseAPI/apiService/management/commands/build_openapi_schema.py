@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apiService.docs import (
+    build_schema,
+    clear_schema_cache,
+    schema_fingerprint,
+    schema_is_fresh,
+    schema_paths,
+)
+
+
+class Command(BaseCommand):
+    help = 'OpenAPI şemasını üretip settings.OPENAPI_SCHEMA_FILE yoluna (YAML ve JSON) yazar'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Yazmadan, diskteki şemanın kaynaklarla güncel olup olmadığını kontrol eder',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Şema güncel olsa bile yeniden üretir',
+        )
+
+    def handle(self, *args, **options):
+        files, fingerprint_file = schema_paths()
+        if files is None:
+            raise CommandError('settings.OPENAPI_SCHEMA_FILE ayarlı değil.')
+
+        fresh = schema_is_fresh()
+        if options['check']:
+            if not fresh:
+                raise CommandError('OpenAPI şeması güncel değil; build_openapi_schema çalıştırın.')
+            self.stdout.write(self.style.SUCCESS('OpenAPI şeması güncel.'))
+            return
+
+        if fresh and not options['force']:
+            self.stdout.write(f'Şema zaten güncel ({schema_fingerprint()[:12]}), atlandı.')
+            return
+
+        contents = build_schema()
+        clear_schema_cache()
+        if not schema_is_fresh():
+            raise CommandError(f'Şema dosyaları yazılamadı: {fingerprint_file.parent}')
+
+        self.stdout.write(self.style.SUCCESS('OpenAPI şeması üretildi:'))
+        for fmt, path in files.items():
+            self.stdout.write(f'  ✓ {path} ({len(contents[fmt])} bayt)')
+        self.stdout.write(f'  ✓ özet: {schema_fingerprint()[:12]}')
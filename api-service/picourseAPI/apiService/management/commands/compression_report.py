@@ -0,0 +1,59 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+
+from apiService.middleware import available_encodings, compress
+
+
+class Command(BaseCommand):
+    help = 'Bir endpoint yanıtı için sıkıştırma oranı, süresi ve tahmini aktarım süresini raporlar'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--path',
+            default='/api/tutors/?limit=100',
+            help='Ölçülecek endpoint (varsayılan: /api/tutors/?limit=100)',
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=50,
+            help='Her kodlama için tekrar sayısı',
+        )
+        parser.add_argument(
+            '--bandwidth-kbps',
+            type=int,
+            default=1600,
+            help='Aktarım süresi tahmini için bant genişliği (kbit/s, varsayılan: 3G)',
+        )
+
+    def handle(self, *args, **options):
+        # Ham gövdeyi ölçmek için sıkıştırma istenmez
+        response = Client().get(options['path'], HTTP_ACCEPT_ENCODING='identity')
+        if response.status_code != 200:
+            raise CommandError(f"{options['path']} -> HTTP {response.status_code}")
+
+        content = response.content
+        iterations = options['iterations']
+        bytes_per_ms = options['bandwidth_kbps'] * 1000 / 8 / 1000
+
+        self.stdout.write(f"{options['path']}: {len(content)} bayt (sıkıştırmasız)")
+        self.stdout.write(f"  aktarım: {len(content) / bytes_per_ms:.1f} ms")
+
+        for encoding in ('gzip', 'br', 'zstd'):
+            if encoding not in available_encodings():
+                self.stdout.write(f'{encoding:>5}: kurulu değil, atlandı')
+                continue
+
+            started = time.perf_counter()
+            for _ in range(iterations):
+                compressed = compress(content, encoding)
+            compress_ms = (time.perf_counter() - started) * 1000 / iterations
+
+            ratio = len(compressed) / len(content)
+            transfer_ms = len(compressed) / bytes_per_ms
+            self.stdout.write(
+                f'{encoding:>5}: {len(compressed)} bayt (%{ratio * 100:.1f}), '
+                f'sıkıştırma {compress_ms:.2f} ms, aktarım {transfer_ms:.1f} ms'
+            )
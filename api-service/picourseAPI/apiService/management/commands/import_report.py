@@ -0,0 +1,95 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Worker açılışını taklit eder: uygulamalar yüklenir ve URLconf çözülür
+BOOT_SCRIPT = (
+    'import django; django.setup(); '
+    'from django.urls import get_resolver; get_resolver().url_patterns'
+)
+
+
+def parse_importtime(output):
+    """
+    `python -X importtime` çıktısını (modül, self_us, cumulative_us) listesine çevirir
+    """
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        # İsimden önceki tek boşluk ayraçtır, kalan girinti iç içe importları gösterir
+        rows.append((name.rstrip()[1:], int(self_us), int(cumulative_us)))
+    return rows
+
+
+class Command(BaseCommand):
+    help = 'Worker açılışının import süresini `python -X importtime` ile ölçüp özetler'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=15,
+            help='Listelenecek en pahalı modül sayısı',
+        )
+        parser.add_argument(
+            '--output',
+            help='Özeti JSON olarak bu dosyaya yazar (açılış süresini takip etmek için)',
+        )
+
+    def handle(self, *args, **options):
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings.SETTINGS_MODULE)
+        started = time.perf_counter()
+        process = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', BOOT_SCRIPT],
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        wall_ms = (time.perf_counter() - started) * 1000
+        if process.returncode != 0:
+            raise CommandError(process.stderr[-2000:])
+
+        rows = parse_importtime(process.stderr)
+        # Kök seviyedeki importların kümülatif süresi toplam import süresidir
+        top_level = [row for row in rows if not row[0].startswith(' ')]
+        total_us = sum(row[2] for row in top_level)
+
+        packages = {}
+        for name, self_us, _ in rows:
+            package = name.strip().split('.')[0]
+            packages[package] = packages.get(package, 0) + self_us
+        slowest_packages = sorted(packages.items(), key=lambda item: item[1], reverse=True)
+        slowest_modules = sorted(rows, key=lambda row: row[2], reverse=True)
+
+        top = options['top']
+        self.stdout.write(f'Açılış süresi (süreç dahil): {wall_ms:.0f} ms')
+        self.stdout.write(f'Toplam import süresi: {total_us / 1000:.0f} ms, {len(rows)} modül')
+
+        self.stdout.write(f'\nPaket bazında (self) en pahalı {top}:')
+        for package, self_us in slowest_packages[:top]:
+            self.stdout.write(f'  {self_us / 1000:8.1f} ms  {package}')
+
+        self.stdout.write(f'\nKümülatif en pahalı {top} modül:')
+        for name, _, cumulative_us in slowest_modules[:top]:
+            self.stdout.write(f'  {cumulative_us / 1000:8.1f} ms  {name.strip()}')
+
+        if options['output']:
+            summary = {
+                'wall_ms': round(wall_ms, 1),
+                'import_ms': round(total_us / 1000, 1),
+                'modules': len(rows),
+                'packages_ms': {
+                    package: round(self_us / 1000, 1)
+                    for package, self_us in slowest_packages[:top]
+                },
+            }
+            with open(options['output'], 'w') as output:
+                json.dump(summary, output, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"\nÖzet {options['output']} dosyasına yazıldı."))
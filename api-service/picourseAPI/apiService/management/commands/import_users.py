@@ -0,0 +1,251 @@
+import csv
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from multiprocessing import current_process
+from pathlib import Path
+
+import django
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, transaction
+from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
+
+from apiService.models import User
+from apiService.serializers import UserRegistrationSerializer
+from apiService.tutor_cards import refresh_tutor_cards
+
+
+class ImportUserSerializer(UserRegistrationSerializer):
+    """
+    Kayıt kuralları; kullanıcı adı benzersizliği satır başına sorgu yerine
+    batch başına tek sorguda kontrol edilir
+    """
+    def get_fields(self):
+        fields = super().get_fields()
+        fields['username'].validators = [
+            validator for validator in fields['username'].validators
+            if not isinstance(validator, UniqueValidator)
+        ]
+        return fields
+
+
+def read_rows(path, file_format):
+    """
+    Dosyayı satır satır okur: (satır no, kayıt) üretir; okunamayan NDJSON
+    satırları için kayıt yerine hata mesajı döner
+    """
+    with open(path, newline='', encoding='utf-8-sig') as source:
+        if file_format == 'csv':
+            for number, row in enumerate(csv.DictReader(source), start=1):
+                # CSV'de boş hücre "alan yok" demektir (grade_level gibi)
+                yield number, {key: value for key, value in row.items() if key and value not in ('', None)}
+            return
+        for number, line in enumerate(source, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as error:
+                yield number, f'Geçersiz JSON: {error}'
+                continue
+            yield number, row if isinstance(row, dict) else 'Satır bir JSON nesnesi olmalı'
+
+
+def load_checkpoint(path):
+    try:
+        with open(path) as checkpoint:
+            return json.load(checkpoint)
+    except FileNotFoundError:
+        return None
+
+
+def save_checkpoint(path, state):
+    # Yarım yazılmış checkpoint kalmasın diye önce geçici dosyaya yazılır
+    temporary = f'{path}.tmp'
+    with open(temporary, 'w') as checkpoint:
+        json.dump(state, checkpoint)
+    os.replace(temporary, path)
+
+
+class Command(BaseCommand):
+    help = (
+        'CSV/NDJSON dosyasındaki öğrenci ve öğretmenleri kayıt kurallarıyla doğrulayıp '
+        'toplu olarak içe aktarır; şifreler paralel hash\'lenir, kesilirse kaldığı yerden devam eder'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='İçe aktarılacak .csv veya .ndjson/.jsonl dosyası')
+        parser.add_argument(
+            '--format',
+            choices=['csv', 'ndjson'],
+            help='Dosya biçimi (varsayılan: uzantıdan)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Tek bulk_create ile eklenecek satır sayısı; checkpoint her batch sonrası yazılır',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Şifre hash\'leyen süreç sayısı (1: aynı süreçte)',
+        )
+        parser.add_argument(
+            '--checkpoint',
+            help='İlerleme dosyası (varsayılan: <dosya>.checkpoint)',
+        )
+        parser.add_argument(
+            '--errors',
+            help='Hatalı satırların yazılacağı CSV (varsayılan: <dosya>.errors.csv)',
+        )
+        parser.add_argument(
+            '--restart',
+            action='store_true',
+            help='Checkpoint\'i yok sayıp dosyanın başından başlar',
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options['path'])
+        if not path.exists():
+            raise CommandError(f'Dosya bulunamadı: {path}')
+        file_format = options['format'] or ('csv' if path.suffix.lower() == '.csv' else 'ndjson')
+        batch_size = max(1, options['batch_size'])
+        checkpoint_path = options['checkpoint'] or f'{path}.checkpoint'
+        errors_path = options['errors'] or f'{path}.errors.csv'
+
+        state = None if options['restart'] else load_checkpoint(checkpoint_path)
+        if state and state.get('path') != str(path.resolve()):
+            raise CommandError(
+                f'{checkpoint_path} başka bir dosyaya ait; --checkpoint veya --restart kullanın'
+            )
+        state = state or {'path': str(path.resolve()), 'row': 0, 'created': 0, 'failed': 0}
+        if state['row']:
+            self.stdout.write(f"Checkpoint: {state['row']}. satırdan sonra devam ediliyor.")
+
+        self.serializer = ImportUserSerializer()
+        rows = (
+            (number, row) for number, row in read_rows(path, file_format) if number > state['row']
+        )
+
+        self.workers = options['workers']
+        self.executor = None
+        # daemon süreçler (ör. `manage.py test --parallel` worker'ları) alt süreç başlatamaz
+        if self.workers > 1 and not current_process().daemon:
+            # spawn kullanan platformlarda alt süreçler ayarları kendisi yükler
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=django.setup)
+        # Devam ederken önceki hatalar korunur
+        with open(errors_path, 'a' if state['row'] else 'w', newline='', encoding='utf-8') as errors_file:
+            errors = csv.writer(errors_file)
+            if not state['row']:
+                errors.writerow(['row', 'username', 'errors'])
+            try:
+                while True:
+                    batch = list(islice(rows, batch_size))
+                    if not batch:
+                        break
+                    created, failed = self.import_batch(batch, errors)
+                    errors_file.flush()
+                    state['row'] = batch[-1][0]
+                    state['created'] += created
+                    state['failed'] += len(failed)
+                    save_checkpoint(checkpoint_path, state)
+                    self.stdout.write(
+                        f"  ✓ {state['row']}. satıra kadar: {state['created']} eklendi, {state['failed']} hatalı"
+                    )
+            finally:
+                if self.executor is not None:
+                    self.executor.shutdown()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Toplam {state['created']} kullanıcı eklendi, {state['failed']} satır hatalı."
+        ))
+        if state['failed']:
+            self.stdout.write(f'Hatalı satırlar: {errors_path}')
+
+    def validate_batch(self, batch):
+        """
+        Satırları doğrular; (geçerli satırlar, hatalı satırlar) döner
+        """
+        valid, failed = [], []
+        for number, row in batch:
+            if isinstance(row, str):
+                failed.append((number, '', {'non_field_errors': [row]}))
+                continue
+            # password_confirm yoksa dosyadaki şifre onaylanmış sayılır
+            row.setdefault('password_confirm', row.get('password'))
+            try:
+                data = self.serializer.run_validation(row)
+            except serializers.ValidationError as error:
+                failed.append((number, row.get('username', ''), error.detail))
+                continue
+            valid.append((number, data))
+
+        # Dosya içindeki tekrarlar ve veritabanında zaten olan kullanıcı adları
+        existing = set(User.objects.filter(
+            username__in=[data['username'] for _, data in valid]
+        ).values_list('username', flat=True))
+        unique = []
+        for number, data in valid:
+            if data['username'] in existing:
+                failed.append((number, data['username'], {'username': ['Bu kullanıcı adı zaten kullanılıyor.']}))
+                continue
+            existing.add(data['username'])
+            unique.append((number, data))
+        return unique, failed
+
+    def hash_passwords(self, passwords):
+        """
+        Şifreleri süreç havuzunda hash'ler; havuz yoksa veya süreçleri
+        başlatılamıyorsa aynı süreçte
+        """
+        if self.executor is not None:
+            chunksize = max(1, len(passwords) // (self.workers * 4))
+            try:
+                return list(self.executor.map(make_password, passwords, chunksize=chunksize))
+            except (BrokenProcessPool, OSError) as error:
+                self.stdout.write(self.style.WARNING(
+                    f'Hash süreçleri çalışmıyor ({error}); şifreler bu süreçte hash\'lenecek.'
+                ))
+                self.executor.shutdown()
+                self.executor = None
+        return [make_password(password) for password in passwords]
+
+    def import_batch(self, batch, errors):
+        valid, failed = self.validate_batch(batch)
+
+        hashes = self.hash_passwords([data['password'] for _, data in valid])
+
+        users = []
+        for (number, data), password in zip(valid, hashes):
+            fields = {key: value for key, value in data.items() if key not in ('password', 'password_confirm')}
+            users.append((number, User(password=password, **fields)))
+
+        while users:
+            try:
+                with transaction.atomic():
+                    User.objects.bulk_create([user for _, user in users])
+                    # bulk_create post_save göndermez; öğretmen kartları burada yazılır
+                    refresh_tutor_cards(user.pk for _, user in users if user.role == 'tutor')
+                break
+            except IntegrityError:
+                # Doğrulamadan sonra başka bir istekle kaydolan kullanıcı adları ayıklanır
+                taken = set(User.objects.filter(
+                    username__in=[user.username for _, user in users]
+                ).values_list('username', flat=True))
+                if not taken:
+                    raise
+                failed.extend(
+                    (number, user.username, {'username': ['Bu kullanıcı adı zaten kullanılıyor.']})
+                    for number, user in users if user.username in taken
+                )
+                users = [(number, user) for number, user in users if user.username not in taken]
+
+        for number, username, detail in sorted(failed, key=lambda item: item[0]):
+            errors.writerow([number, username, json.dumps(detail, ensure_ascii=False)])
+        return len(users), failed
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apiService.concurrency import purge_expired_keys
+
+
+class Command(BaseCommand):
+    help = 'Süresi dolmuş Idempotency-Key kayıtlarını toplu olarak siler'
+
+    def handle(self, *args, **options):
+        deleted = purge_expired_keys()
+        self.stdout.write(self.style.SUCCESS(f'{deleted} süresi dolmuş anahtar silindi.'))
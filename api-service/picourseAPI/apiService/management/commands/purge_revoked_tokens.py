@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apiService.revocation import purge_expired_buckets
+
+
+class Command(BaseCommand):
+    help = 'Son geçerlilik günü geçmiş iptal edilmiş token kayıtlarını toplu olarak siler'
+
+    def handle(self, *args, **options):
+        deleted = purge_expired_buckets()
+        self.stdout.write(self.style.SUCCESS(f'{deleted} iptal kaydı silindi.'))
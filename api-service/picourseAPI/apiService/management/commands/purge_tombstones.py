@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apiService.sync import purge_tombstones
+
+
+class Command(BaseCommand):
+    help = 'Saklama süresi (SYNC_TOMBSTONE_TTL) dolmuş senkronizasyon silme kayıtlarını siler'
+
+    def handle(self, *args, **options):
+        deleted = purge_tombstones()
+        self.stdout.write(self.style.SUCCESS(f'{deleted} silme kaydı temizlendi.'))
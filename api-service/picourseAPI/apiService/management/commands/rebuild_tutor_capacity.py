@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from apiService.capacity import rebuild_counters
+
+
+class Command(BaseCommand):
+    help = 'Öğretmen kapasite sayaçlarını (bekleyen talep, haftalık saat) ders taleplerinden yeniden hesaplar'
+
+    def handle(self, *args, **options):
+        tutors, weeks = rebuild_counters()
+        self.stdout.write(self.style.SUCCESS('Kapasite sayaçları yeniden hesaplandı:'))
+        self.stdout.write(f'  ✓ {tutors} öğretmen için bekleyen talep sayacı')
+        self.stdout.write(f'  ✓ {weeks} haftalık ders saati sayacı')
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from apiService.tutor_cards import rebuild_tutor_cards
+
+
+class Command(BaseCommand):
+    help = 'Öğretmen kartlarını (TutorCard) kullanıcı ve ders tablolarından yeniden kurar'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Tek upsert ile yazılacak kart sayısı',
+        )
+
+    def handle(self, *args, **options):
+        rebuilt = rebuild_tutor_cards(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'{rebuilt} öğretmen kartı yeniden kuruldu.'))
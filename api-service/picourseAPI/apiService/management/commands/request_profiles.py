@@ -0,0 +1,87 @@
+import pstats
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from apiService.profiling import delete_profile, list_profiles, profiling_settings
+
+
+class Command(BaseCommand):
+    help = 'X-Profile ile kaydedilen istek profillerini listeler, gösterir ve temizler'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--show',
+            metavar='PROFILE_ID',
+            help='Profildeki en pahalı fonksiyonları ve en yavaş SQL sorgularını gösterir',
+        )
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=20,
+            help='--show ile gösterilecek fonksiyon/sorgu sayısı',
+        )
+        parser.add_argument(
+            '--older-than-days',
+            type=int,
+            help='Bu kadar günden eski profilleri siler',
+        )
+        parser.add_argument(
+            '--keep',
+            type=int,
+            help='En yeni bu kadar profil dışındakileri siler',
+        )
+
+    def handle(self, *args, **options):
+        directory = profiling_settings()['DIRECTORY']
+        if options['show']:
+            self.show(directory, options['show'], options['top'])
+            return
+
+        profiles = list_profiles(directory)
+        if options['older_than_days'] is not None or options['keep'] is not None:
+            self.prune(directory, profiles, options['older_than_days'], options['keep'])
+            return
+
+        if not profiles:
+            self.stdout.write(f'{directory} altında profil yok.')
+            return
+        for profile in profiles:
+            self.stdout.write(
+                f"{profile['id']}  {profile['status']}  {profile['duration_ms']:8.1f} ms  "
+                f"{profile['sql_count']:4d} SQL  {profile['method']} {profile['path']}"
+            )
+
+    def show(self, directory, profile_id, top):
+        summary = next((profile for profile in list_profiles(directory) if profile['id'] == profile_id), None)
+        if summary is None:
+            raise CommandError(f'Profil bulunamadı: {profile_id}')
+
+        self.stdout.write(
+            f"{summary['method']} {summary['path']} -> {summary['status']}, "
+            f"{summary['duration_ms']:.1f} ms, {summary['sql_count']} SQL ({summary['sql_ms']:.1f} ms)"
+        )
+        output = StringIO()
+        pstats.Stats(str(directory / f'{profile_id}.prof'), stream=output).sort_stats('cumulative').print_stats(top)
+        self.stdout.write(output.getvalue())
+
+        self.stdout.write(f'En yavaş {top} SQL sorgusu:')
+        for query in sorted(summary['sql'], key=lambda query: query['duration_ms'], reverse=True)[:top]:
+            self.stdout.write(f"  {query['duration_ms']:8.2f} ms  [{query['alias']}] {query['sql'][:200]}")
+
+    def prune(self, directory, profiles, older_than_days, keep):
+        expired = set()
+        if older_than_days is not None:
+            cutoff = timezone.now() - timedelta(days=older_than_days)
+            expired.update(
+                profile['id'] for profile in profiles if parse_datetime(profile['created_at']) < cutoff
+            )
+        if keep is not None:
+            expired.update(profile['id'] for profile in profiles[keep:])
+
+        for profile_id in expired:
+            delete_profile(directory, profile_id)
+        self.stdout.write(self.style.SUCCESS(f'{len(expired)} profil silindi.'))
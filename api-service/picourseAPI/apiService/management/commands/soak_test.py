@@ -0,0 +1,238 @@
+import gc
+import random
+import tracemalloc
+
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Prefetch
+from django.test import RequestFactory
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apiService.models import LessonRequest, TutorSubject, User
+from apiService.serializers import LessonRequestSerializer, TutorListSerializer
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+# Bellek artışı raporunda gösterilmeyen çerçeveler (ölçümün kendisi ve importlar)
+IGNORED_TRACES = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+]
+
+
+def request_mix(student, tutor):
+    """
+    (ad, yol, kullanıcı, ağırlık) listesi; yalnızca okuma yapan istekler
+    """
+    return [
+        ('tutor-list', reverse('tutor-list'), None, 4),
+        ('tutor-list-compact', reverse('tutor-list') + '?fields=id,first_name,rating,subjects', None, 1),
+        ('tutor-cards', reverse('tutor-card-list'), None, 2),
+        ('tutor-detail', reverse('tutor-detail', args=[tutor.pk]), None, 1),
+        ('tutor-page', reverse('tutor-page', args=[tutor.pk]), student, 1),
+        ('subjects', reverse('subject-list'), None, 1),
+        ('autocomplete', reverse('autocomplete') + '?q=a', None, 1),
+        ('lesson-requests-student', reverse('lesson-request-list'), student, 2),
+        ('lesson-requests-tutor', reverse('lesson-request-list'), tutor, 2),
+    ]
+
+
+def net_growth(stats):
+    return sum(stat.size_diff for stat in stats)
+
+
+class Command(BaseCommand):
+    help = (
+        'Gerçekçi bir okuma istek karışımını süreç içinde tekrarlayıp tracemalloc ile '
+        'bellek artışını ölçer; artış eşiği aşarsa hata verir'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=2000,
+            help='Ölçülen istek sayısı',
+        )
+        parser.add_argument(
+            '--warmup',
+            type=int,
+            default=100,
+            help='Ölçümden önce atılan istek sayısı (önbellekler ve tembel importlar dolar)',
+        )
+        parser.add_argument(
+            '--snapshot-every',
+            type=int,
+            default=250,
+            help='Kaç istekte bir tracemalloc snapshot alınacağı',
+        )
+        parser.add_argument(
+            '--threshold-kb',
+            type=int,
+            default=1024,
+            help='Isınmadan sonraki net bellek artışı bu değeri aşarsa komut hata verir',
+        )
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=10,
+            help='Raporlanacak en çok büyüyen satır sayısı',
+        )
+        parser.add_argument(
+            '--frames',
+            type=int,
+            default=1,
+            help='tracemalloc\'un her ayırma için tuttuğu çerçeve sayısı',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='İstek sırası için rastgele tohum',
+        )
+        parser.add_argument(
+            '--skip-streaming',
+            action='store_true',
+            help='Liste ile akış (iterator) serileştirmesinin tepe bellek karşılaştırmasını atlar',
+        )
+
+    def handle(self, *args, **options):
+        student = User.objects.filter(role='student', is_active=True).order_by('pk').first()
+        tutor = User.objects.filter(role='tutor', is_active=True).order_by('pk').first()
+        if student is None or tutor is None:
+            raise CommandError('En az bir öğrenci ve bir öğretmen gerekli; önce `seed_data` çalıştırın.')
+
+        mix = request_mix(student, tutor)
+        tokens = {user.pk: f'Bearer {AccessToken.for_user(user)}' for user in (student, tutor)}
+        sequence = random.Random(options['seed']).choices(
+            mix, weights=[weight for *_, weight in mix], k=options['warmup'] + options['iterations']
+        )
+        # Test Client her istekte kendi sinyal alıcılarını bağladığı için
+        # ölçümü bozar; istekler worker'daki gibi WSGIHandler'dan geçer
+        handler = WSGIHandler()
+        factory = RequestFactory(HTTP_HOST='localhost')
+        statuses = {}
+
+        def replay(requests):
+            for name, path, user, _ in requests:
+                headers = {'HTTP_AUTHORIZATION': tokens[user.pk]} if user is not None else {}
+                started = []
+                environ = factory.get(path, **headers).environ
+                response = handler(environ, lambda status, response_headers: started.append(status))
+                b''.join(response)
+                response.close()
+                code = int(started[0].split()[0])
+                statuses.setdefault(name, {})
+                statuses[name][code] = statuses[name].get(code, 0) + 1
+
+        tracemalloc.start(options['frames'])
+        try:
+            replay(sequence[:options['warmup']])
+            gc.collect()
+            baseline = tracemalloc.take_snapshot().filter_traces(IGNORED_TRACES)
+            self.stdout.write(
+                f"{options['warmup']} isınma isteği sonrası izlenen bellek: "
+                f'{tracemalloc.get_traced_memory()[0] / 1024:.1f} KB'
+            )
+
+            measured = sequence[options['warmup']:]
+            stats = []
+            step = max(1, options['snapshot_every'])
+            for start in range(0, len(measured), step):
+                replay(measured[start:start + step])
+                gc.collect()
+                snapshot = tracemalloc.take_snapshot().filter_traces(IGNORED_TRACES)
+                stats = snapshot.compare_to(baseline, 'lineno')
+                self.stdout.write(
+                    f'  {start + len(measured[start:start + step]):6d} istek: '
+                    f'{net_growth(stats) / 1024:+9.1f} KB'
+                )
+            growth = net_growth(stats)
+            self.report_growth(stats, options['top'])
+
+            if not options['skip_streaming']:
+                self.compare_streaming()
+        finally:
+            tracemalloc.stop()
+
+        self.stdout.write('\nİstek durumları:')
+        for name, counts in statuses.items():
+            summary = ', '.join(f'{code}: {count}' for code, count in sorted(counts.items()))
+            self.stdout.write(f'  {name}: {summary}')
+        if resource is not None:
+            # Linux'ta KB cinsindendir
+            self.stdout.write(f'Tepe RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MB')
+
+        failed = sum(count for counts in statuses.values() for code, count in counts.items() if code >= 500)
+        if failed:
+            raise CommandError(f'{failed} istek 5xx döndü.')
+        if growth > options['threshold_kb'] * 1024:
+            raise CommandError(
+                f"Net bellek artışı {growth / 1024:.1f} KB, eşik {options['threshold_kb']} KB."
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f"{options['iterations']} istekte net bellek artışı {growth / 1024:.1f} KB (eşik {options['threshold_kb']} KB)."
+        ))
+
+    def report_growth(self, stats, top):
+        growing = [stat for stat in stats if stat.size_diff > 0][:top]
+        if not growing:
+            return
+        self.stdout.write(f'\nEn çok büyüyen {len(growing)} satır:')
+        for stat in growing:
+            frame = stat.traceback[0]
+            self.stdout.write(
+                f'  {stat.size_diff / 1024:+9.1f} KB  {stat.count_diff:+7d} blok  {frame.filename}:{frame.lineno}'
+            )
+
+    def compare_streaming(self):
+        """
+        Tüm öğretmen ve ders talebi listesini tek seferde (liste) ve
+        iterator ile satır satır (akış) serileştirmenin tepe belleği
+        """
+        renderer = JSONRenderer()
+        paths = [
+            (
+                'tutors',
+                User.objects.filter(role='tutor').order_by('pk').prefetch_related(
+                    Prefetch('tutor_subjects', queryset=TutorSubject.objects.select_related('subject'))
+                ),
+                TutorListSerializer,
+            ),
+            (
+                'lesson_requests',
+                LessonRequest.objects.order_by('pk').select_related('student', 'tutor', 'subject'),
+                LessonRequestSerializer,
+            ),
+        ]
+        self.stdout.write('\nTepe bellek, liste ve akış serileştirmesi:')
+        for name, queryset, serializer_class in paths:
+            gc.collect()
+            tracemalloc.reset_peak()
+            start = tracemalloc.get_traced_memory()[0]
+            body = renderer.render(serializer_class(list(queryset), many=True).data)
+            list_peak = tracemalloc.get_traced_memory()[1] - start
+            list_size = len(body)
+            del body
+
+            gc.collect()
+            tracemalloc.reset_peak()
+            start = tracemalloc.get_traced_memory()[0]
+            stream_size, rows = 2, 0
+            for obj in queryset.iterator(chunk_size=500):
+                # Her satır ayrı yazılır (StreamingHttpResponse'a verilecek parçalar)
+                stream_size += len(renderer.render(serializer_class(obj).data)) + 1
+                rows += 1
+            stream_peak = tracemalloc.get_traced_memory()[1] - start
+
+            self.stdout.write(
+                f'  {name} ({rows} satır, ~{max(list_size, stream_size) / 1024:.0f} KB JSON): '
+                f'liste {list_peak / 1024:.1f} KB, akış {stream_peak / 1024:.1f} KB'
+            )
@@ -0,0 +1,190 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.text import compress_sequence, compress_string
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - opsiyonel bağımlılık
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - opsiyonel bağımlılık
+    zstandard = None
+
+
+COMPRESSION_DEFAULTS = {
+    # Sunucu tercih sırası; kurulu olmayan kodlamalar atlanır
+    'ENCODINGS': ['br', 'zstd', 'gzip'],
+    'MIN_SIZE': 500,
+    'CACHE_ALIAS': 'default',
+    'CACHE_TIMEOUT': 300,
+}
+
+# gzip yanıtlarına eklenen rastgele dolgu (BREACH'e karşı, GZipMiddleware ile aynı)
+GZIP_MAX_RANDOM_BYTES = 100
+
+
+def compression_settings():
+    return {**COMPRESSION_DEFAULTS, **getattr(settings, 'COMPRESSION', {})}
+
+
+def available_encodings():
+    encodings = {'gzip'}
+    if brotli is not None:
+        encodings.add('br')
+    if zstandard is not None:
+        encodings.add('zstd')
+    return encodings
+
+
+def compress(content, encoding):
+    """
+    Tek parça içeriği verilen kodlamayla sıkıştırır
+    """
+    if encoding == 'br':
+        return brotli.compress(content, quality=5)
+    if encoding == 'zstd':
+        return zstandard.ZstdCompressor(level=3).compress(content)
+    return compress_string(content, max_random_bytes=GZIP_MAX_RANDOM_BYTES)
+
+
+def compress_stream(chunks, encoding):
+    """
+    Akış (streaming) yanıtlarını parça parça sıkıştırır
+    """
+    if encoding == 'gzip':
+        yield from compress_sequence(chunks, max_random_bytes=GZIP_MAX_RANDOM_BYTES)
+        return
+
+    # Her parça flush edilir ki istemci veriyi beklemeden alabilsin
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=5)
+        for chunk in chunks:
+            data = compressor.process(chunk) + compressor.flush()
+            if data:
+                yield data
+        yield compressor.finish()
+    else:
+        compressor = zstandard.ZstdCompressor(level=3).compressobj()
+        for chunk in chunks:
+            data = compressor.compress(chunk) + compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+            if data:
+                yield data
+        yield compressor.flush()
+
+
+def parse_accept_encoding(header):
+    """
+    Accept-Encoding başlığını {kodlama: q} sözlüğüne çevirir
+    """
+    accepted = {}
+    for part in header.split(','):
+        name, _, params = part.strip().partition(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name] = quality
+    return accepted
+
+
+def negotiate_encoding(header, preferred=None):
+    """
+    İstemcinin kabul ettiği ve sunucuda kurulu olan en uygun kodlamayı seçer
+    """
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get('*', 0.0)
+    available = available_encodings()
+
+    best, best_quality = None, 0.0
+    for encoding in preferred or compression_settings()['ENCODINGS']:
+        if encoding not in available:
+            continue
+        quality = accepted.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Accept-Encoding'e göre br/zstd/gzip sıkıştırma.
+
+    Sıkıştırılmış gövdeler içerik özetiyle önbelleğe yazılır; aynı gövde
+    tekrar üretildiğinde (ör. değişmeyen öğretmen listesi) sıkıştırma
+    yapılmadan önbellekteki varyant döner.
+    """
+
+    def process_response(self, request, response):
+        if response.has_header('Content-Encoding'):
+            return response
+
+        config = compression_settings()
+        if not response.streaming and len(response.content) < config['MIN_SIZE']:
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        encoding = negotiate_encoding(
+            request.META.get('HTTP_ACCEPT_ENCODING', ''), config['ENCODINGS']
+        )
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                # Async akışlarda yalnızca parça bazlı gzip uygulanır
+                if encoding != 'gzip':
+                    return response
+                original_iterator = response.streaming_content
+
+                async def gzip_wrapper():
+                    async for chunk in original_iterator:
+                        yield compress_string(chunk, max_random_bytes=GZIP_MAX_RANDOM_BYTES)
+
+                response.streaming_content = gzip_wrapper()
+            else:
+                response.streaming_content = compress_stream(response.streaming_content, encoding)
+            del response.headers['Content-Length']
+        else:
+            compressed = self.get_compressed(request, response, encoding, config)
+            if compressed is None:
+                return response
+            response.content = compressed
+            response.headers['Content-Length'] = str(len(compressed))
+
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = encoding
+        return response
+
+    def get_compressed(self, request, response, encoding, config):
+        content = response.content
+        cacheable = request.method in ('GET', 'HEAD') and response.status_code == 200
+        if cacheable:
+            cache = caches[config['CACHE_ALIAS']]
+            digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+            cache_key = f'compressed:{encoding}:{digest}'
+            compressed = cache.get(cache_key)
+            if compressed is not None:
+                return compressed or None
+
+        compressed = compress(content, encoding)
+        # Sıkıştırma kazanç sağlamıyorsa orijinal içerik döner
+        if len(compressed) >= len(content):
+            compressed = b''
+        if cacheable:
+            cache.set(cache_key, compressed, config['CACHE_TIMEOUT'])
+        return compressed or None
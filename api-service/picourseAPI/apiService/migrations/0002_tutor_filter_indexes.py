@@ -0,0 +1,22 @@
+# Generated by Django 5.2.5 on 2026-10-19 12:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apiService', '0001_initial'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tutorsubject',
+            index=models.Index(fields=['subject', 'experience_years'], name='tutorsubj_subject_exp_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['role', '-rating'], name='user_role_rating_idx'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.5 on 2026-10-19 12:50
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apiService', '0003_idempotency_key'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedLessonRequest',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('status', models.CharField(choices=[('pending', 'Beklemede'), ('approved', 'Onaylandı'), ('rejected', 'Reddedildi')], max_length=10, verbose_name='Durum')),
+                ('message', models.TextField(verbose_name='Mesaj')),
+                ('preferred_date', models.DateTimeField(verbose_name='Tercih Edilen Tarih')),
+                ('duration_hours', models.IntegerField(verbose_name='Ders Süresi (saat)')),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('subject', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='apiService.subject')),
+                ('tutor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Arşivlenmiş Ders Talebi',
+                'verbose_name_plural': 'Arşivlenmiş Ders Talepleri',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['student', '-created_at'], name='archivedlr_student_idx'), models.Index(fields=['tutor', '-created_at'], name='archivedlr_tutor_idx')],
+            },
+        ),
+    ]
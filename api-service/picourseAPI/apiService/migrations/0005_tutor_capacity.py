@@ -0,0 +1,40 @@
+# Generated by Django 5.2.5 on 2026-10-19 13:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apiService', '0004_archived_lesson_request'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TutorCapacity',
+            fields=[
+                ('tutor', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='capacity', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('pending_count', models.PositiveIntegerField(default=0, verbose_name='Bekleyen Talep')),
+            ],
+            options={
+                'verbose_name': 'Öğretmen Kapasitesi',
+                'verbose_name_plural': 'Öğretmen Kapasiteleri',
+            },
+        ),
+        migrations.CreateModel(
+            name='TutorWeeklyLoad',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('week_start', models.DateField(verbose_name='Hafta Başı')),
+                ('booked_hours', models.PositiveIntegerField(default=0, verbose_name='Onaylı Saat')),
+                ('tutor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='weekly_loads', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Haftalık Ders Yükü',
+                'verbose_name_plural': 'Haftalık Ders Yükleri',
+                'unique_together': {('tutor', 'week_start')},
+            },
+        ),
+    ]
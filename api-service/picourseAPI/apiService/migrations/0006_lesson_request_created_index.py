@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-19 13:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apiService', '0005_tutor_capacity'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lessonrequest',
+            index=models.Index(fields=['created_at'], name='lessonreq_created_idx'),
+        ),
+    ]
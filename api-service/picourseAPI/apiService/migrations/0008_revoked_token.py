@@ -0,0 +1,27 @@
+# Generated by Django 5.2.5 on 2026-10-19 13:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apiService', '0007_delta_sync'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RevokedToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('jti', models.CharField(max_length=255, unique=True)),
+                ('expires_at', models.DateTimeField()),
+                ('expires_on', models.DateField(db_index=True, verbose_name='Son Geçerlilik Günü')),
+                ('revoked_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'İptal Edilmiş Token',
+                'verbose_name_plural': "İptal Edilmiş Token'lar",
+            },
+        ),
+    ]
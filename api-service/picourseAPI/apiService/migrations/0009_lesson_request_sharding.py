@@ -0,0 +1,40 @@
+# Generated by Django 5.2.5 on 2026-10-19 13:14
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apiService', '0008_revoked_token'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LessonRequestSequence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+            ],
+            options={
+                'verbose_name': 'Ders Talebi Id Sırası',
+                'verbose_name_plural': 'Ders Talebi Id Sırası',
+            },
+        ),
+        migrations.AlterField(
+            model_name='lessonrequest',
+            name='student',
+            field=models.ForeignKey(db_constraint=False, limit_choices_to={'role': 'student'}, on_delete=django.db.models.deletion.CASCADE, related_name='lesson_requests_as_student', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='lessonrequest',
+            name='subject',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, to='apiService.subject'),
+        ),
+        migrations.AlterField(
+            model_name='lessonrequest',
+            name='tutor',
+            field=models.ForeignKey(db_constraint=False, limit_choices_to={'role': 'tutor'}, on_delete=django.db.models.deletion.CASCADE, related_name='lesson_requests_as_tutor', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
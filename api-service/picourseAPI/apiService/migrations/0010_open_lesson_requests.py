@@ -0,0 +1,50 @@
+# Generated by Django 5.2.5 on 2026-10-19 13:16
+
+import django.core.validators
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apiService', '0009_lesson_request_sharding'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivedlessonrequest',
+            name='grade_level',
+            field=models.IntegerField(choices=[(1, '1. Sınıf'), (2, '2. Sınıf'), (3, '3. Sınıf'), (4, '4. Sınıf'), (5, '5. Sınıf'), (6, '6. Sınıf'), (7, '7. Sınıf'), (8, '8. Sınıf'), (9, '9. Sınıf'), (10, '10. Sınıf'), (11, '11. Sınıf'), (12, '12. Sınıf')], null=True),
+        ),
+        migrations.AddField(
+            model_name='archivedlessonrequest',
+            name='min_rating',
+            field=models.FloatField(null=True),
+        ),
+        migrations.AddField(
+            model_name='lessonrequest',
+            name='grade_level',
+            field=models.IntegerField(blank=True, choices=[(1, '1. Sınıf'), (2, '2. Sınıf'), (3, '3. Sınıf'), (4, '4. Sınıf'), (5, '5. Sınıf'), (6, '6. Sınıf'), (7, '7. Sınıf'), (8, '8. Sınıf'), (9, '9. Sınıf'), (10, '10. Sınıf'), (11, '11. Sınıf'), (12, '12. Sınıf')], null=True, verbose_name='Sınıf Seviyesi'),
+        ),
+        migrations.AddField(
+            model_name='lessonrequest',
+            name='min_rating',
+            field=models.FloatField(blank=True, null=True, validators=[django.core.validators.MinValueValidator(0.0), django.core.validators.MaxValueValidator(5.0)], verbose_name='En Düşük Öğretmen Puanı'),
+        ),
+        migrations.AlterField(
+            model_name='archivedlessonrequest',
+            name='tutor',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='lessonrequest',
+            name='tutor',
+            field=models.ForeignKey(blank=True, db_constraint=False, limit_choices_to={'role': 'tutor'}, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='lesson_requests_as_tutor', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='lessonrequest',
+            index=models.Index(condition=models.Q(('status', 'pending'), ('tutor__isnull', True)), fields=['subject', '-created_at'], name='lessonreq_open_idx'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.5 on 2026-10-19 13:25
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apiService', '0010_open_lesson_requests'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TutorCard',
+            fields=[
+                ('tutor', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='card', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('username', models.CharField(max_length=150)),
+                ('first_name', models.CharField(blank=True, max_length=150)),
+                ('last_name', models.CharField(blank=True, max_length=150)),
+                ('bio', models.TextField(blank=True, null=True)),
+                ('grade_level', models.IntegerField(blank=True, null=True)),
+                ('rating', models.FloatField(default=0.0)),
+                ('total_lessons', models.IntegerField(default=0)),
+                ('date_joined', models.DateTimeField()),
+                ('subjects', models.JSONField(default=list)),
+                ('subject_ids', models.CharField(default=',', max_length=1000)),
+                ('max_experience', models.IntegerField(default=0, verbose_name='En Yüksek Deneyim Yılı')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Öğretmen Kartı',
+                'verbose_name_plural': 'Öğretmen Kartları',
+                'indexes': [models.Index(fields=['-rating', 'tutor'], name='tutorcard_rating_idx'), models.Index(fields=['-total_lessons', 'tutor'], name='tutorcard_lessons_idx'), models.Index(fields=['-date_joined'], name='tutorcard_joined_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.5 on 2026-10-19 13:52
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apiService', '0011_tutor_card'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='idempotencykey',
+            name='response_body',
+            field=models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder, null=True),
+        ),
+        migrations.AlterField(
+            model_name='idempotencykey',
+            name='response_status',
+            field=models.PositiveSmallIntegerField(null=True),
+        ),
+    ]
@@ -0,0 +1,64 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, migrations, models
+
+
+class AlterFieldOnDefault(migrations.AlterField):
+    """
+    Alanı yalnızca default veritabanında değiştirir
+    """
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.alias == DEFAULT_DB_ALIAS:
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.alias == DEFAULT_DB_ALIAS:
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+# 0009 yabancı anahtar kısıtlarını her veritabanında kaldırır. Kısıt yalnızca
+# User/Subject tablosu olmayan shard'larda kurulamaz; kullanıcıların ve
+# derslerin bulunduğu default veritabanında geri eklenir. Migration durumu
+# modeldeki gibi db_constraint=False'a döner (shard'lardaki tablo tanımı).
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apiService', '0012_idempotency_key_claim'),
+    ]
+
+    operations = [
+        AlterFieldOnDefault(
+            model_name='lessonrequest',
+            name='student',
+            field=models.ForeignKey(limit_choices_to={'role': 'student'}, on_delete=django.db.models.deletion.CASCADE, related_name='lesson_requests_as_student', to=settings.AUTH_USER_MODEL),
+        ),
+        AlterFieldOnDefault(
+            model_name='lessonrequest',
+            name='subject',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='apiService.subject'),
+        ),
+        AlterFieldOnDefault(
+            model_name='lessonrequest',
+            name='tutor',
+            field=models.ForeignKey(blank=True, limit_choices_to={'role': 'tutor'}, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='lesson_requests_as_tutor', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='lessonrequest',
+                    name='student',
+                    field=models.ForeignKey(db_constraint=False, limit_choices_to={'role': 'student'}, on_delete=django.db.models.deletion.CASCADE, related_name='lesson_requests_as_student', to=settings.AUTH_USER_MODEL),
+                ),
+                migrations.AlterField(
+                    model_name='lessonrequest',
+                    name='subject',
+                    field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, to='apiService.subject'),
+                ),
+                migrations.AlterField(
+                    model_name='lessonrequest',
+                    name='tutor',
+                    field=models.ForeignKey(blank=True, db_constraint=False, limit_choices_to={'role': 'tutor'}, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='lesson_requests_as_tutor', to=settings.AUTH_USER_MODEL),
+                ),
+            ],
+        ),
+    ]
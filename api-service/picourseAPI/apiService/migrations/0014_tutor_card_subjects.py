@@ -0,0 +1,69 @@
+# Generated by Django 5.2.5 on 2026-10-19 14:00
+
+import django.db.models.deletion
+from django.db import migrations, models, router
+from rest_framework import serializers
+
+
+def rebuild_card_subjects(apps, schema_editor):
+    """
+    Mevcut kartların derslerini yeni biçime çevirir ve ders satırlarını doldurur
+    """
+    TutorCard = apps.get_model('apiService', 'TutorCard')
+    TutorCardSubject = apps.get_model('apiService', 'TutorCardSubject')
+    TutorSubject = apps.get_model('apiService', 'TutorSubject')
+    alias = schema_editor.connection.alias
+    if not router.allow_migrate_model(alias, TutorCard):
+        return
+    
+    created_at = serializers.DateTimeField()
+    postings = {}
+    for posting in TutorSubject.objects.using(alias).select_related('subject').order_by('subject__name'):
+        postings.setdefault(posting.tutor_id, []).append(posting)
+    for card in TutorCard.objects.using(alias).iterator():
+        card.subjects = [
+            {
+                'subject': {
+                    'id': posting.subject_id,
+                    'name': posting.subject.name,
+                    'description': posting.subject.description,
+                    'created_at': created_at.to_representation(posting.subject.created_at),
+                },
+                'experience_years': posting.experience_years,
+            }
+            for posting in postings.get(card.pk, [])
+        ]
+        card.save(using=alias, update_fields=['subjects'])
+        TutorCardSubject.objects.using(alias).bulk_create([
+            TutorCardSubject(card_id=card.pk, subject_id=posting.subject_id, experience_years=posting.experience_years)
+            for posting in postings.get(card.pk, [])
+        ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apiService', '0013_lesson_request_default_constraints'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='tutorcard',
+            name='subject_ids',
+        ),
+        migrations.CreateModel(
+            name='TutorCardSubject',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('experience_years', models.IntegerField(default=0, verbose_name='Deneyim Yılı')),
+                ('card', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='subject_postings', to='apiService.tutorcard')),
+                ('subject', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='apiService.subject')),
+            ],
+            options={
+                'verbose_name': 'Öğretmen Kartı Dersi',
+                'verbose_name_plural': 'Öğretmen Kartı Dersleri',
+                'constraints': [models.UniqueConstraint(fields=('subject', 'card'), name='tutorcardsubj_subject_card_uniq')],
+            },
+        ),
+        migrations.RunPython(rebuild_card_subjects, migrations.RunPython.noop),
+    ]
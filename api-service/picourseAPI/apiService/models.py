@@ -1,7 +1,11 @@
 from django.contrib.auth.models import AbstractUser
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator
 
+from .sharding import LessonRequestQuerySet
+
 
 class User(AbstractUser):
     """
@@ -45,6 +49,13 @@ class User(AbstractUser):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            models.Index(fields=['role', '-rating'], name='user_role_rating_idx'),
+            # Delta senkronizasyonu: (updated_at, id) sırasıyla keyset tarama
+            models.Index(fields=['updated_at', 'id'], name='user_sync_idx'),
+        ]
+    
     def __str__(self):
         return f"{self.username} ({self.get_role_display()})"
 
@@ -56,11 +67,15 @@ class Subject(models.Model):
     name = models.CharField(max_length=100, unique=True, verbose_name="Ders Adı")
     description = models.TextField(blank=True, null=True, verbose_name="Açıklama")
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
         verbose_name = "Ders"
         verbose_name_plural = "Dersler"
         ordering = ['name']
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='subject_sync_idx'),
+        ]
     
     def __str__(self):
         return self.name
@@ -78,9 +93,14 @@ class TutorSubject(models.Model):
     )
     subject = models.ForeignKey(Subject, on_delete=models.CASCADE)
     experience_years = models.IntegerField(default=0, verbose_name="Deneyim Yılı")
+    updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
         unique_together = ['tutor', 'subject']
+        indexes = [
+            models.Index(fields=['subject', 'experience_years'], name='tutorsubj_subject_exp_idx'),
+            models.Index(fields=['updated_at', 'id'], name='tutorsubj_sync_idx'),
+        ]
         verbose_name = "Öğretmen Dersi"
         verbose_name_plural = "Öğretmen Dersleri"
     
@@ -98,19 +118,28 @@ class LessonRequest(models.Model):
         ('rejected', 'Reddedildi'),
     ]
     
+    # Talepler User/Subject tablosu olmayan bir veritabanında (shard)
+    # tutulabildiği için yabancı anahtar kısıtı shard'larda tanımlanmaz;
+    # default veritabanında vardır (0013). Silinen kullanıcı/dersin
+    # shard'lardaki talepleri sinyalle silinir (bkz. sharding.py, signals.py)
     student = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
         limit_choices_to={'role': 'student'},
-        related_name='lesson_requests_as_student'
+        related_name='lesson_requests_as_student',
+        db_constraint=False
     )
+    # Açık taleplerde öğretmen, talebi ilk alan öğretmen olana kadar boştur
     tutor = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
         limit_choices_to={'role': 'tutor'},
-        related_name='lesson_requests_as_tutor'
+        related_name='lesson_requests_as_tutor',
+        db_constraint=False,
+        null=True,
+        blank=True
     )
-    subject = models.ForeignKey(Subject, on_delete=models.CASCADE)
+    subject = models.ForeignKey(Subject, on_delete=models.CASCADE, db_constraint=False)
     status = models.CharField(
         max_length=10,
         choices=STATUS_CHOICES,
@@ -126,11 +155,267 @@ class LessonRequest(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Açık talep kriterleri: öğrencinin sınıfı ve öğretmende aranan en düşük puan
+    grade_level = models.IntegerField(
+        choices=User.GRADE_LEVEL_CHOICES,
+        blank=True,
+        null=True,
+        verbose_name="Sınıf Seviyesi"
+    )
+    min_rating = models.FloatField(
+        blank=True,
+        null=True,
+        validators=[MinValueValidator(0.0), MaxValueValidator(5.0)],
+        verbose_name="En Düşük Öğretmen Puanı"
+    )
+    
+    objects = LessonRequestQuerySet.as_manager()
     
     class Meta:
         verbose_name = "Ders Talebi"
         verbose_name_plural = "Ders Talepleri"
         ordering = ['-created_at']
+        indexes = [
+            # Varsayılan sıralama ve admin tarih hiyerarşisi için
+            models.Index(fields=['created_at'], name='lessonreq_created_idx'),
+            models.Index(fields=['updated_at', 'id'], name='lessonreq_sync_idx'),
+            # Öğretmenlere gösterilen açık talepler (henüz alınmamış)
+            models.Index(
+                fields=['subject', '-created_at'],
+                name='lessonreq_open_idx',
+                condition=models.Q(tutor__isnull=True, status='pending'),
+            ),
+        ]
+    
+    def __str__(self):
+        tutor = self.tutor.username if self.tutor_id else 'açık talep'
+        return f"{self.student.username} -> {tutor} ({self.subject.name})"
+
+
+class ArchivedLessonRequest(models.Model):
+    """
+    Arşivlenmiş (sonuçlanmış ve eski) ders talepleri
+
+    Kolonlar LessonRequest ile aynı sıradadır; böylece iki tablo tek bir
+    UNION sorgusuyla birlikte listelenebilir. id değerleri korunur.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    student = models.ForeignKey(User, on_delete=models.CASCADE, related_name='+')
+    tutor = models.ForeignKey(User, on_delete=models.CASCADE, related_name='+', null=True)
+    subject = models.ForeignKey(Subject, on_delete=models.CASCADE, related_name='+')
+    status = models.CharField(
+        max_length=10,
+        choices=LessonRequest.STATUS_CHOICES,
+        verbose_name="Durum"
+    )
+    message = models.TextField(verbose_name="Mesaj")
+    preferred_date = models.DateTimeField(verbose_name="Tercih Edilen Tarih")
+    duration_hours = models.IntegerField(verbose_name="Ders Süresi (saat)")
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    grade_level = models.IntegerField(choices=User.GRADE_LEVEL_CHOICES, null=True)
+    min_rating = models.FloatField(null=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        verbose_name = "Arşivlenmiş Ders Talebi"
+        verbose_name_plural = "Arşivlenmiş Ders Talepleri"
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['student', '-created_at'], name='archivedlr_student_idx'),
+            models.Index(fields=['tutor', '-created_at'], name='archivedlr_tutor_idx'),
+        ]
+    
+    def __str__(self):
+        return f"#{self.pk} ({self.get_status_display()}, arşiv)"
+
+
+class IdempotencyKey(models.Model):
+    """
+    Idempotency-Key başlığıyla yapılan yazma isteklerinin saklanan yanıtları
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='idempotency_keys')
+    key = models.CharField(max_length=255)
+    request_fingerprint = models.CharField(max_length=64)
+    # İstek işlenirken boştur (anahtar alınmış, yanıt henüz yazılmamış)
+    response_status = models.PositiveSmallIntegerField(null=True)
+    response_body = models.JSONField(encoder=DjangoJSONEncoder, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+    
+    class Meta:
+        unique_together = ['user', 'key']
+        verbose_name = "Idempotency Anahtarı"
+        verbose_name_plural = "Idempotency Anahtarları"
+    
+    def __str__(self):
+        return f"{self.user_id}:{self.key}"
+
+
+class TutorCapacity(models.Model):
+    """
+    Öğretmen başına bekleyen talep sayacı
+
+    Sınır kontrolü COUNT(*) yerine bu satır üzerinde koşullu UPDATE ile
+    yapılır (bkz. capacity.py).
+    """
+    tutor = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='capacity'
+    )
+    pending_count = models.PositiveIntegerField(default=0, verbose_name="Bekleyen Talep")
+    
+    class Meta:
+        verbose_name = "Öğretmen Kapasitesi"
+        verbose_name_plural = "Öğretmen Kapasiteleri"
+    
+    def __str__(self):
+        return f"{self.tutor_id}: {self.pending_count} bekleyen"
+
+
+class TutorWeeklyLoad(models.Model):
+    """
+    Öğretmenin bir haftadaki onaylanmış ders saati sayacı
+    """
+    tutor = models.ForeignKey(User, on_delete=models.CASCADE, related_name='weekly_loads')
+    week_start = models.DateField(verbose_name="Hafta Başı")
+    booked_hours = models.PositiveIntegerField(default=0, verbose_name="Onaylı Saat")
+    
+    class Meta:
+        unique_together = ['tutor', 'week_start']
+        verbose_name = "Haftalık Ders Yükü"
+        verbose_name_plural = "Haftalık Ders Yükleri"
+    
+    def __str__(self):
+        return f"{self.tutor_id} @ {self.week_start}: {self.booked_hours} saat"
+
+
+class Tombstone(models.Model):
+    """
+    Silinen satırların kaydı; delta senkronizasyonunda istemcilere silme
+    olarak gönderilir (bkz. sync.py)
+    """
+    MODEL_CHOICES = [
+        ('lesson_request', 'Ders Talebi'),
+        ('subject', 'Ders'),
+        ('tutor', 'Öğretmen'),
+        ('tutor_subject', 'Öğretmen Dersi'),
+    ]
+    
+    model = models.CharField(max_length=20, choices=MODEL_CHOICES)
+    object_id = models.BigIntegerField()
+    # Ders talebi silmeleri yalnızca talebin taraflarına gönderilir
+    student_id = models.BigIntegerField(null=True, blank=True)
+    tutor_id = models.BigIntegerField(null=True, blank=True)
+    deleted_at = models.DateTimeField(default=timezone.now)
+    
+    class Meta:
+        verbose_name = "Silinen Kayıt"
+        verbose_name_plural = "Silinen Kayıtlar"
+        indexes = [
+            models.Index(fields=['deleted_at', 'id'], name='tombstone_sync_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.model}#{self.object_id}"
+
+
+class RevokedToken(models.Model):
+    """
+    Geçersiz kılınmış (ör. yenileme sırasında döndürülmüş) refresh token'lar
+
+    Kayıtlar token'ın son geçerlilik gününe göre kovalanır; süresi dolan
+    kovalar toplu silinir (bkz. revocation.py).
+    """
+    jti = models.CharField(max_length=255, unique=True)
+    expires_at = models.DateTimeField()
+    expires_on = models.DateField(db_index=True, verbose_name="Son Geçerlilik Günü")
+    revoked_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        verbose_name = "İptal Edilmiş Token"
+        verbose_name_plural = "İptal Edilmiş Token'lar"
+    
+    def __str__(self):
+        return self.jti
+
+
+class LessonRequestSequence(models.Model):
+    """
+    Shard'lı kurulumda ders talebi id'lerini üreten tablo; her satır bir id'dir
+    """
+    class Meta:
+        verbose_name = "Ders Talebi Id Sırası"
+        verbose_name_plural = "Ders Talebi Id Sırası"
+
+
+class TutorCard(models.Model):
+    """
+    Öğretmen listesi için denormalize okuma modeli
+
+    Öğretmenin liste alanları, dersleri ve en yüksek deneyim yılı tek
+    satırda tutulur; liste JOIN/prefetch olmadan tek tablodan okunur.
+    Ders filtreleri TutorCardSubject satırlarıyla uygulanır. Satırlar
+    sinyallerle güncellenir (bkz. tutor_cards.py).
+    """
+    # Kartlar yalnızca öğretmenler için tutulur
+    role = 'tutor'
+    
+    tutor = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='card'
+    )
+    username = models.CharField(max_length=150)
+    first_name = models.CharField(max_length=150, blank=True)
+    last_name = models.CharField(max_length=150, blank=True)
+    bio = models.TextField(blank=True, null=True)
+    grade_level = models.IntegerField(blank=True, null=True)
+    rating = models.FloatField(default=0.0)
+    total_lessons = models.IntegerField(default=0)
+    date_joined = models.DateTimeField()
+    # TutorSubjectSerializer çıktısı: [{"subject": {...}, "experience_years": 5}, ...]
+    subjects = models.JSONField(default=list)
+    max_experience = models.IntegerField(default=0, verbose_name="En Yüksek Deneyim Yılı")
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = "Öğretmen Kartı"
+        verbose_name_plural = "Öğretmen Kartları"
+        indexes = [
+            models.Index(fields=['-rating', 'tutor'], name='tutorcard_rating_idx'),
+            models.Index(fields=['-total_lessons', 'tutor'], name='tutorcard_lessons_idx'),
+            models.Index(fields=['-date_joined'], name='tutorcard_joined_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.username} kartı"
+    
+    def get_role_display(self):
+        return dict(User.ROLE_CHOICES)[self.role]
+
+
+class TutorCardSubject(models.Model):
+    """
+    Öğretmen kartının ders satırları
+
+    Kartlardaki ders filtresi için (subject, card) indeksli arama tablosu;
+    satırlar kartla aynı işlemde yeniden yazılır.
+    """
+    card = models.ForeignKey(TutorCard, on_delete=models.CASCADE, related_name='subject_postings')
+    # Ders sütunu benzersiz (subject, card) indeksinin ilk sütunudur
+    subject = models.ForeignKey(Subject, on_delete=models.CASCADE, db_index=False, related_name='+')
+    experience_years = models.IntegerField(default=0, verbose_name="Deneyim Yılı")
+    
+    class Meta:
+        verbose_name = "Öğretmen Kartı Dersi"
+        verbose_name_plural = "Öğretmen Kartı Dersleri"
+        constraints = [
+            models.UniqueConstraint(fields=['subject', 'card'], name='tutorcardsubj_subject_card_uniq'),
+        ]
     
     def __str__(self):
-        return f"{self.student.username} -> {self.tutor.username} ({self.subject.name})"
+        return f"{self.card_id} - {self.subject_id}"
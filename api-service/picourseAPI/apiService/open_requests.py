@@ -0,0 +1,60 @@
+"""
+Açık ders talepleri: öğretmen seçmeden ders, sınıf ve puan kriteriyle
+oluşturulan, uyan tüm öğretmenlere görünen talepler
+
+Talebi ilk alan öğretmen kazanır. Alma işlemi kilit kullanmadan tek bir
+koşullu UPDATE'tir:
+
+    UPDATE ... SET tutor_id = %s, status = 'approved'
+    WHERE id = %s AND tutor_id IS NULL AND status = 'pending' AND <kriterler>
+
+Aynı anda alan öğretmenlerden yalnızca birinin UPDATE'i satır etkiler;
+diğerleri 0 satır görür ve kaybeder.
+"""
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .capacity import reserve_weekly_hours
+from .models import LessonRequest, TutorSubject
+
+
+def matching_open_requests(tutor):
+    """
+    Öğretmenin alabileceği açık talepler: verdiği bir ders, sınıf seviyesi
+    ve puan kriterine uyanlar
+    """
+    queryset = LessonRequest.objects.filter(
+        tutor__isnull=True,
+        status='pending',
+        subject_id__in=TutorSubject.objects.filter(tutor_id=tutor.pk).values('subject_id'),
+    ).filter(
+        Q(min_rating__isnull=True) | Q(min_rating__lte=tutor.rating)
+    )
+    # Öğretmenin grade_level alanı verebildiği en üst sınıftır; boşsa hepsi
+    if tutor.grade_level is not None:
+        queryset = queryset.filter(Q(grade_level__isnull=True) | Q(grade_level__lte=tutor.grade_level))
+    return queryset
+
+
+def claim_open_request(lesson_request, tutor):
+    """
+    Açık talebi öğretmene verir ve onaylar; başka bir öğretmen önce aldıysa False
+
+    Haftalık ders saati aynı transaction'da ayrılır, sınır doluysa
+    CapacityExceeded fırlatılır.
+    """
+    updated_at = timezone.now()
+    with transaction.atomic():
+        reserve_weekly_hours(tutor.pk, lesson_request.preferred_date, lesson_request.duration_hours)
+        claimed = matching_open_requests(tutor).filter(pk=lesson_request.pk).update(
+            tutor_id=tutor.pk, status='approved', updated_at=updated_at
+        )
+        if not claimed:
+            transaction.set_rollback(True)
+            return False
+
+    lesson_request.tutor = tutor
+    lesson_request.status = 'approved'
+    lesson_request.updated_at = updated_at
+    return True
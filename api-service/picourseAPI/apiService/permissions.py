@@ -1,14 +1,31 @@
+from django.contrib.auth import get_user_model
+from django.db.models import Q
 from rest_framework import permissions
 
+SAFE_METHODS = ['GET', 'HEAD', 'OPTIONS']
+
+
+def request_role(request):
+    """
+    Kullanıcının rolünü istek başına bir kez çözümler ve request üzerinde saklar
+    """
+    try:
+        return request._cached_role
+    except AttributeError:
+        user = request.user
+        role = getattr(user, 'role', None) if user.is_authenticated else None
+        request._cached_role = role
+        return role
+
 
 class IsStudentOrReadOnly(permissions.BasePermission):
     """
     Yalnızca öğrencilerin yazma izni olduğu permission
     """
     def has_permission(self, request, view):
-        if request.method in ['GET', 'HEAD', 'OPTIONS']:
+        if request.method in SAFE_METHODS:
             return True
-        return request.user.is_authenticated and request.user.role == 'student'
+        return request_role(request) == 'student'
 
 
 class IsTutorOrReadOnly(permissions.BasePermission):
@@ -16,9 +33,9 @@ class IsTutorOrReadOnly(permissions.BasePermission):
     Yalnızca öğretmenlerin yazma izni olduğu permission
     """
     def has_permission(self, request, view):
-        if request.method in ['GET', 'HEAD', 'OPTIONS']:
+        if request.method in SAFE_METHODS:
             return True
-        return request.user.is_authenticated and request.user.role == 'tutor'
+        return request_role(request) == 'tutor'
 
 
 class IsOwnerOrTutorForLessonRequest(permissions.BasePermission):
@@ -26,16 +43,31 @@ class IsOwnerOrTutorForLessonRequest(permissions.BasePermission):
     Ders talebi için özel permission:
     - Öğrenci kendi oluşturduğu talepleri görebilir
     - Öğretmen kendine yapılan talepleri görebilir ve durumlarını güncelleyebilir
+
+    Karşılaştırmalar *_id kolonlarıyla yapılır, ilişkili kullanıcılar yüklenmez.
+    scope_queryset aynı kuralı sorguya taşır; böylece nesne tek sorguda hem
+    getirilir hem de yetkilendirilir.
     """
+    @staticmethod
+    def scope_queryset(request, queryset):
+        user_id = request.user.pk
+        if request.method in SAFE_METHODS:
+            return queryset.filter(Q(student_id=user_id) | Q(tutor_id=user_id))
+        if request.method in ['PUT', 'PATCH'] and request_role(request) == 'tutor':
+            return queryset.filter(tutor_id=user_id)
+        return queryset.none()
+
     def has_object_permission(self, request, view, obj):
+        user_id = request.user.pk
+
         # Okuma izni: öğrenci kendi talepleri, öğretmen kendine yapılan talepler
-        if request.method in ['GET', 'HEAD', 'OPTIONS']:
-            return (obj.student == request.user or obj.tutor == request.user)
-        
+        if request.method in SAFE_METHODS:
+            return user_id in (obj.student_id, obj.tutor_id)
+
         # Güncelleme izni: sadece öğretmen kendi taleplerine cevap verebilir
         if request.method in ['PUT', 'PATCH']:
-            return (request.user.role == 'tutor' and obj.tutor == request.user)
-        
+            return request_role(request) == 'tutor' and obj.tutor_id == user_id
+
         return False
 
 
@@ -44,4 +76,6 @@ class IsOwner(permissions.BasePermission):
     Yalnızca nesnenin sahibi işlem yapabilir
     """
     def has_object_permission(self, request, view, obj):
-        return obj == request.user or obj.user == request.user
+        if isinstance(obj, get_user_model()):
+            return obj.pk == request.user.pk
+        return getattr(obj, 'user_id', None) == request.user.pk
@@ -0,0 +1,154 @@
+"""
+İstek bazında isteğe bağlı profilleme
+
+Staff kullanıcı `X-Profile: 1` başlığıyla istek attığında istek cProfile
+altında çalıştırılır ve PROFILING['DIRECTORY'] altına iki dosya yazılır:
+
+- <id>.prof: pstats dökümü; snakeviz ile açılır, `flameprof <id>.prof`
+  ile flamegraph'a çevrilir
+- <id>.json: istek özeti ve çalışan SQL sorguları (süreleriyle)
+
+Profil id'si yanıtta X-Profile-Id başlığıyla döner. Başlık yoksa tek
+maliyet bir META okumasıdır; staff olmayanların başlığı yok sayılır.
+Dosyalar `python manage.py request_profiles` ile listelenir ve temizlenir.
+"""
+import cProfile
+import json
+import time
+import uuid
+from contextlib import ExitStack
+from datetime import datetime, timezone as dt_timezone
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connections
+from rest_framework.exceptions import AuthenticationFailed
+
+from .authentication import CachedJWTAuthentication
+from .log import request_id_var
+
+PROFILING_DEFAULTS = {
+    'DIRECTORY': None,
+    # Bir profilde saklanacak en fazla SQL sorgusu
+    'MAX_QUERIES': 1000,
+}
+
+PROFILE_HEADER = 'HTTP_X_PROFILE'
+PROFILE_ID_HEADER = 'X-Profile-Id'
+
+
+def profiling_settings():
+    config = {**PROFILING_DEFAULTS, **getattr(settings, 'PROFILING', {})}
+    config['DIRECTORY'] = Path(config['DIRECTORY'] or Path(settings.BASE_DIR) / 'profiles')
+    return config
+
+
+def is_staff_request(request):
+    """
+    İsteği yapan staff mı; oturum yoksa JWT doğrulanır (DRF henüz çalışmadı)
+    """
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        return user.is_staff
+    try:
+        result = CachedJWTAuthentication().authenticate(request)
+    except AuthenticationFailed:
+        return False
+    return result is not None and result[0].is_staff
+
+
+class SqlCollector:
+    """
+    Profillenen istekteki SQL sorgularını süreleriyle kaydeden execute_wrapper
+    """
+    def __init__(self, max_queries):
+        self.max_queries = max_queries
+        self.queries = []
+        self.count = 0
+        self.duration_ms = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration_ms = (time.perf_counter() - started) * 1000
+            self.count += 1
+            self.duration_ms += duration_ms
+            # Parametreler kişisel veri içerebileceği için saklanmaz
+            if len(self.queries) < self.max_queries:
+                self.queries.append({
+                    'alias': context['connection'].alias,
+                    'sql': sql[:2000],
+                    'duration_ms': round(duration_ms, 3),
+                })
+
+
+def list_profiles(directory):
+    """
+    Kayıtlı profillerin özetleri, yeniden eskiye
+    """
+    profiles = []
+    for path in Path(directory).glob('*.json'):
+        try:
+            with open(path, encoding='utf-8') as summary:
+                profiles.append(json.load(summary))
+        except (OSError, ValueError):
+            continue
+    return sorted(profiles, key=lambda profile: profile['created_at'], reverse=True)
+
+
+def delete_profile(directory, profile_id):
+    for suffix in ('.prof', '.json'):
+        (Path(directory) / f'{profile_id}{suffix}').unlink(missing_ok=True)
+
+
+class ProfilingMiddleware:
+    """
+    X-Profile: 1 başlıklı staff isteklerini cProfile ile profiller
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if request.META.get(PROFILE_HEADER) != '1' or not is_staff_request(request):
+            return self.get_response(request)
+
+        config = profiling_settings()
+        collector = SqlCollector(config['MAX_QUERIES'])
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(collector))
+            profiler.enable()
+            try:
+                response = self.get_response(request)
+            finally:
+                profiler.disable()
+        duration_ms = (time.perf_counter() - started) * 1000
+
+        created_at = datetime.now(dt_timezone.utc)
+        profile_id = f'{created_at:%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:12]}'
+        directory = config['DIRECTORY']
+        directory.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(directory / f'{profile_id}.prof')
+        match = request.resolver_match
+        summary = {
+            'id': profile_id,
+            'created_at': created_at.isoformat(),
+            'request_id': request_id_var.get(),
+            'method': request.method,
+            'path': request.get_full_path(),
+            'route': match.view_name if match else None,
+            'status': response.status_code,
+            'duration_ms': round(duration_ms, 2),
+            'sql_count': collector.count,
+            'sql_ms': round(collector.duration_ms, 2),
+            'sql': collector.queries,
+        }
+        with open(directory / f'{profile_id}.json', 'w', encoding='utf-8') as output:
+            json.dump(summary, output, ensure_ascii=False, indent=2)
+
+        response[PROFILE_ID_HEADER] = profile_id
+        return response
@@ -0,0 +1,161 @@
+"""
+Refresh token iptali (rotation sonrası eski token'ların geçersiz kılınması)
+
+İptal edilen jti'ler RevokedToken tablosunda son geçerlilik gününe göre
+kovalanır; süresi dolan kovalar purge_revoked_tokens ile tek DELETE'te
+silinir.
+
+Her süreçte geçerli iptallerin bir Bloom filtresi tutulur. Filtrede
+olmayan jti kesinlikle iptal edilmemiştir ve veritabanına bakılmaz; yalnızca
+filtrenin "olabilir" dediği jti'ler tabloda aranır. Filtre
+REVOCATION_BLOOM_REFRESH_SECONDS'ta bir yeniden kurulur; diğer süreçlerdeki
+iptaller en geç bu sürede görünür. Yenilemede eski jti'nin eklenmesi
+benzersiz indeksle yapıldığından aynı refresh token'ın iki kez
+kullanılması filtre güncel olmasa da yakalanır.
+"""
+import hashlib
+import math
+import threading
+import time
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework import serializers
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer, TokenVerifySerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import UntypedToken
+
+from .models import RevokedToken
+
+
+class TokenAlreadyRevoked(Exception):
+    pass
+
+
+class BloomFilter:
+    """
+    Sabit boyutlu Bloom filtresi; yanlış negatif vermez
+    """
+    def __init__(self, capacity, error_rate):
+        capacity = max(capacity, 1)
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def positions(self, value):
+        # İki bağımsız özetten k konum üretilir (Kirsch-Mitzenmacher)
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+    def add(self, value):
+        for position in self.positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self.positions(value))
+
+
+_bloom = {'filter': None, 'loaded_at': 0.0}
+_bloom_lock = threading.Lock()
+
+
+def build_bloom_filter():
+    """
+    Süresi dolmamış iptallerden filtreyi kurar; kapasite iptal sayısıyla büyür
+    """
+    jtis = list(
+        RevokedToken.objects.filter(expires_at__gt=timezone.now()).values_list('jti', flat=True)
+    )
+    capacity = max(settings.REVOCATION_BLOOM_CAPACITY, 2 * len(jtis))
+    bloom = BloomFilter(capacity, settings.REVOCATION_BLOOM_ERROR_RATE)
+    for jti in jtis:
+        bloom.add(jti)
+    return bloom
+
+
+def get_bloom_filter():
+    bloom = _bloom['filter']
+    timeout = settings.REVOCATION_BLOOM_REFRESH_SECONDS
+    if bloom is None or time.monotonic() - _bloom['loaded_at'] > timeout:
+        with _bloom_lock:
+            bloom = _bloom['filter']
+            if bloom is None or time.monotonic() - _bloom['loaded_at'] > timeout:
+                bloom = build_bloom_filter()
+                _bloom.update(filter=bloom, loaded_at=time.monotonic())
+    return bloom
+
+
+def clear_bloom_filter():
+    _bloom['filter'] = None
+
+
+def is_revoked(jti):
+    if jti not in get_bloom_filter():
+        return False
+    return RevokedToken.objects.filter(jti=jti).exists()
+
+
+def revoke(token):
+    """
+    Token'ın jti'sini iptal listesine ekler; zaten iptal edilmişse TokenAlreadyRevoked
+    """
+    jti = token[api_settings.JTI_CLAIM]
+    expires_at = datetime.fromtimestamp(token['exp'], tz=dt_timezone.utc)
+    try:
+        with transaction.atomic():
+            RevokedToken.objects.create(
+                jti=jti, expires_at=expires_at, expires_on=expires_at.date()
+            )
+    except IntegrityError:
+        raise TokenAlreadyRevoked(jti) from None
+    bloom = _bloom['filter']
+    if bloom is not None:
+        bloom.add(jti)
+
+
+def purge_expired_buckets(today=None):
+    """
+    Son geçerlilik günü geçmiş kovaları siler
+    """
+    today = today or timezone.now().date()
+    deleted, _ = RevokedToken.objects.filter(expires_on__lt=today).delete()
+    return deleted
+
+
+class RevokingTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    İptal edilmiş refresh token'ı reddeden, rotation'da eskisini iptal eden serializer
+    """
+    def validate(self, attrs):
+        refresh = self.token_class(attrs['refresh'])
+        jti = refresh[api_settings.JTI_CLAIM]
+        if is_revoked(jti):
+            raise InvalidToken(_('Token is blacklisted'))
+
+        data = {'access': str(refresh.access_token)}
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            try:
+                revoke(refresh)
+            except TokenAlreadyRevoked:
+                # Aynı token başka bir istekte az önce kullanıldı
+                raise InvalidToken(_('Token is blacklisted'))
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            data['refresh'] = str(refresh)
+        return data
+
+
+class RevokingTokenVerifySerializer(TokenVerifySerializer):
+    def validate(self, attrs):
+        token = UntypedToken(attrs['token'])
+        jti = token.get(api_settings.JTI_CLAIM)
+        if jti is not None and is_revoked(jti):
+            raise serializers.ValidationError(_('Token is blacklisted'))
+        return {}
@@ -0,0 +1,13 @@
+"""
+drf-spectacular eklentileri
+
+Şema üretici kimlik doğrulama sınıflarını tam sınıf eşleşmesiyle tanır;
+SimpleJWT'nin eklentisi CachedJWTAuthentication'a uygulanmaz ve şemada
+securitySchemes boş kalır. Eklentiler ApiserviceConfig.ready içinde
+import edilerek kaydedilir.
+"""
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+
+
+class CachedJWTScheme(SimpleJWTScheme):
+    target_class = 'apiService.authentication.CachedJWTAuthentication'
@@ -1,7 +1,36 @@
 from rest_framework import serializers
 from django.contrib.auth import authenticate
 from django.contrib.auth.password_validation import validate_password
-from .models import User, Subject, TutorSubject, LessonRequest
+from drf_spectacular.utils import extend_schema_field
+from .models import User, Subject, TutorSubject, TutorCard, LessonRequest
+from .lookups import CachedSubjectField, IdentityMapUserField
+
+
+class SparseFieldsetMixin:
+    """
+    ?fields= / ?expand= desteği: yalnızca istenen alanları serileştirir.
+    compact_fields içindeki iç içe alanlar, expand ile istenmedikçe hafif
+    serializer'larıyla gösterilir.
+    """
+    compact_fields = {}
+    
+    def __init__(self, *args, fields=None, expand=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is None:
+            return
+        
+        for name in set(self.fields) - set(fields):
+            self.fields.pop(name)
+        
+        expand = set(expand or ())
+        for name, compact_class in self.compact_fields.items():
+            if name in self.fields and name not in expand:
+                field = self.fields[name]
+                self.fields[name] = compact_class(
+                    source=field.source,
+                    many=isinstance(field, serializers.ListSerializer),
+                    read_only=True
+                )
 
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
@@ -103,10 +132,24 @@ class TutorSubjectSerializer(serializers.ModelSerializer):
         fields = ('subject', 'experience_years')
 
 
-class TutorListSerializer(serializers.ModelSerializer):
+class TutorSubjectCompactSerializer(serializers.ModelSerializer):
+    """
+    Öğretmen ders uzmanlığının hafif gösterimi (liste ekranları için)
+    """
+    id = serializers.IntegerField(source='subject_id', read_only=True)
+    name = serializers.CharField(source='subject.name', read_only=True)
+    
+    class Meta:
+        model = TutorSubject
+        fields = ('id', 'name', 'experience_years')
+
+
+class TutorListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Öğretmen listesi için serializer
     """
+    compact_fields = {'subjects': TutorSubjectCompactSerializer}
+    
     subjects = TutorSubjectSerializer(source='tutor_subjects', many=True, read_only=True)
     role_display = serializers.CharField(source='get_role_display', read_only=True)
     
@@ -116,10 +159,51 @@ class TutorListSerializer(serializers.ModelSerializer):
                  'bio', 'rating', 'total_lessons', 'subjects')
 
 
-class TutorDetailSerializer(serializers.ModelSerializer):
+class TutorListCardSerializer(serializers.ModelSerializer):
+    """
+    Öğretmen listesinin karttan okunan hali; yanıt TutorListSerializer ile aynıdır
+    """
+    id = serializers.IntegerField(source='tutor_id', read_only=True)
+    role = serializers.CharField(read_only=True)
+    role_display = serializers.CharField(source='get_role_display', read_only=True)
+    subjects = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = TutorCard
+        fields = ('id', 'username', 'first_name', 'last_name', 'role', 'role_display',
+                 'bio', 'rating', 'total_lessons', 'subjects')
+    
+    @extend_schema_field(TutorSubjectSerializer(many=True))
+    def get_subjects(self, card):
+        return card.subjects
+
+
+class TutorCardSerializer(serializers.ModelSerializer):
+    """
+    Öğretmen kartı serializer'ı; dersler TutorSubjectCompactSerializer biçimindedir
+    """
+    id = serializers.IntegerField(source='tutor_id', read_only=True)
+    subjects = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = TutorCard
+        fields = ('id', 'username', 'first_name', 'last_name', 'bio', 'grade_level',
+                 'rating', 'total_lessons', 'max_experience', 'subjects')
+    
+    @extend_schema_field(TutorSubjectCompactSerializer(many=True))
+    def get_subjects(self, card):
+        return [
+            {'id': item['subject']['id'], 'name': item['subject']['name'], 'experience_years': item['experience_years']}
+            for item in card.subjects
+        ]
+
+
+class TutorDetailSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Öğretmen detay serializer'ı
     """
+    compact_fields = {'subjects': TutorSubjectCompactSerializer}
+    
     subjects = TutorSubjectSerializer(source='tutor_subjects', many=True, read_only=True)
     role_display = serializers.CharField(source='get_role_display', read_only=True)
     grade_level_display = serializers.CharField(source='get_grade_level_display', read_only=True)
@@ -131,10 +215,46 @@ class TutorDetailSerializer(serializers.ModelSerializer):
                  'rating', 'total_lessons', 'subjects', 'date_joined')
 
 
+class TutorPageLessonRequestSerializer(serializers.ModelSerializer):
+    """
+    Öğretmen sayfasında kullanıcının o öğretmene yaptığı son talebin özeti
+    """
+    status_display = serializers.CharField(source='get_status_display', read_only=True)
+    
+    class Meta:
+        model = LessonRequest
+        fields = ('id', 'status', 'status_display')
+
+
+class TutorPageTutorSerializer(TutorDetailSerializer):
+    """
+    Öğretmen sayfasındaki öğretmen detayı; dersler ayrı sorgu yerine
+    context['tutor_subjects'] listesinden ({subject, experience_years}) okunur
+    """
+    subjects = serializers.SerializerMethodField()
+    
+    @extend_schema_field(TutorSubjectSerializer(many=True))
+    def get_subjects(self, tutor):
+        return TutorSubjectSerializer(self.context['tutor_subjects'], many=True).data
+
+
+class TutorPageSerializer(serializers.Serializer):
+    """
+    Öğretmen sayfası için birleşik yanıt: öğretmen detayı, ders listesi ve
+    kullanıcının bu öğretmenle son talebi
+    """
+    tutor = TutorPageTutorSerializer(read_only=True)
+    subjects = SubjectSerializer(many=True, read_only=True)
+    lesson_request = TutorPageLessonRequestSerializer(read_only=True, allow_null=True)
+
+
 class LessonRequestCreateSerializer(serializers.ModelSerializer):
     """
     Ders talebi oluşturma serializer'ı
     """
+    tutor = IdentityMapUserField()
+    subject = CachedSubjectField()
+    
     class Meta:
         model = LessonRequest
         fields = ('tutor', 'subject', 'message', 'preferred_date', 'duration_hours')
@@ -150,14 +270,30 @@ class LessonRequestCreateSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class LessonRequestSerializer(serializers.ModelSerializer):
+class OpenLessonRequestCreateSerializer(serializers.ModelSerializer):
+    """
+    Açık ders talebi oluşturma serializer'ı; öğretmen yerine kriterler verilir
+    """
+    subject = CachedSubjectField()
+    
+    class Meta:
+        model = LessonRequest
+        fields = ('subject', 'grade_level', 'min_rating', 'message', 'preferred_date', 'duration_hours')
+    
+    def create(self, validated_data):
+        validated_data['student'] = self.context['request'].user
+        return super().create(validated_data)
+
+
+class LessonRequestSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Ders talebi serializer'ı
     """
     student_name = serializers.CharField(source='student.get_full_name', read_only=True)
     student_username = serializers.CharField(source='student.username', read_only=True)
-    tutor_name = serializers.CharField(source='tutor.get_full_name', read_only=True)
-    tutor_username = serializers.CharField(source='tutor.username', read_only=True)
+    # Açık taleplerde öğretmen alınana kadar boştur
+    tutor_name = serializers.CharField(source='tutor.get_full_name', read_only=True, allow_null=True)
+    tutor_username = serializers.CharField(source='tutor.username', read_only=True, allow_null=True)
     subject_name = serializers.CharField(source='subject.name', read_only=True)
     status_display = serializers.CharField(source='get_status_display', read_only=True)
     
@@ -166,7 +302,7 @@ class LessonRequestSerializer(serializers.ModelSerializer):
         fields = ('id', 'student', 'student_name', 'student_username', 'tutor', 
                  'tutor_name', 'tutor_username', 'subject', 'subject_name', 'status', 
                  'status_display', 'message', 'preferred_date', 'duration_hours', 
-                 'created_at', 'updated_at')
+                 'grade_level', 'min_rating', 'created_at', 'updated_at')
         read_only_fields = ('id', 'student', 'created_at', 'updated_at')
 
 
@@ -182,3 +318,56 @@ class LessonRequestUpdateSerializer(serializers.ModelSerializer):
         if value not in ['approved', 'rejected']:
             raise serializers.ValidationError("Durum 'approved' veya 'rejected' olmalı.")
         return value
+
+
+class SyncTutorSubjectSerializer(serializers.ModelSerializer):
+    """
+    Öğretmen-ders ilişkisinin düz gösterimi (delta senkronizasyonu için)
+    """
+    class Meta:
+        model = TutorSubject
+        fields = ('id', 'tutor', 'subject', 'experience_years', 'updated_at')
+
+
+class SyncDeletedSerializer(serializers.Serializer):
+    """
+    Son senkronizasyondan beri silinen kayıtların id'leri
+    """
+    lesson_requests = serializers.ListField(child=serializers.IntegerField())
+    subjects = serializers.ListField(child=serializers.IntegerField())
+    tutors = serializers.ListField(child=serializers.IntegerField())
+    tutor_subjects = serializers.ListField(child=serializers.IntegerField())
+
+
+class SyncSerializer(serializers.Serializer):
+    """
+    Delta senkronizasyonu yanıtı; öğretmenler ders listesi olmadan,
+    ilişkiler tutor_subjects içinde ayrıca gönderilir
+    """
+    cursor = serializers.CharField()
+    has_more = serializers.BooleanField()
+    lesson_requests = LessonRequestSerializer(many=True)
+    subjects = SubjectSerializer(many=True)
+    tutors = TutorListSerializer(
+        many=True,
+        fields=('id', 'username', 'first_name', 'last_name', 'role', 'role_display',
+                'bio', 'rating', 'total_lessons')
+    )
+    tutor_subjects = SyncTutorSubjectSerializer(many=True)
+    deleted = SyncDeletedSerializer()
+
+
+class AutocompleteItemSerializer(serializers.Serializer):
+    """
+    Önek aramasında eşleşen öğretmen veya ders
+    """
+    type = serializers.ChoiceField(choices=['tutor', 'subject'])
+    id = serializers.IntegerField()
+    label = serializers.CharField()
+
+
+class AutocompleteSerializer(serializers.Serializer):
+    """
+    Otomatik tamamlama yanıtı
+    """
+    results = AutocompleteItemSerializer(many=True)
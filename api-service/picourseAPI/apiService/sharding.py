@@ -0,0 +1,154 @@
+"""
+LessonRequest tablosunun birden fazla veritabanına bölünmesi (sharding)
+
+LESSON_REQUEST_SHARDS boşsa (varsayılan) her şey default veritabanında
+kalır ve bu modül hiçbir davranışı değiştirmez. Dolu olduğunda:
+
+- LessonRequest satırı stable_hash(tutor_id) % N ile seçilen veritabanına
+  yazılır; öğretmenin talepleri tek bir shard'dadır (for_tutor).
+- Öğrencinin talepleri her shard'da ayrı sorgulanır ve created_at sırasıyla
+  k-yollu birleştirilir (ShardedQuery, heapq.merge).
+- Diğer modeller default'ta kalır; ilişkili User/Subject satırları JOIN
+  yerine prefetch ile ayrı sorguda yüklenir.
+- id'ler shard'lar arasında çakışmasın diye default'taki
+  LessonRequestSequence tablosundan alınır (signals.py).
+"""
+import hashlib
+import heapq
+from itertools import islice
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, models
+
+SHARDED_MODEL = 'apiService.LessonRequest'
+
+
+def shard_aliases():
+    return list(getattr(settings, 'LESSON_REQUEST_SHARDS', ()))
+
+
+def sharding_enabled():
+    return bool(shard_aliases())
+
+
+def stable_hash(value):
+    # hash() süreçler arasında değişebilir; shard seçimi kalıcı olmalı
+    return int.from_bytes(hashlib.blake2b(str(value).encode(), digest_size=8).digest(), 'big')
+
+
+def shard_for_tutor(tutor_id):
+    """
+    Öğretmenin taleplerinin bulunduğu veritabanı
+    """
+    aliases = shard_aliases()
+    if not aliases:
+        return DEFAULT_DB_ALIAS
+    return aliases[stable_hash(tutor_id) % len(aliases)]
+
+
+def lesson_request_aliases():
+    return shard_aliases() or [DEFAULT_DB_ALIAS]
+
+
+class ShardedQuery:
+    """
+    Aynı sıralamaya sahip birden fazla sorgunun birleşik, salt okunur görünümü
+
+    Sayfalama için dilimlenebilir ve sayılabilir; [start:stop] her sorgudan
+    en fazla stop satır okur ve sonuçları heapq.merge ile birleştirir.
+    Sıralama alanlarının hepsi aynı yönde olmalıdır.
+    """
+    def __init__(self, querysets, ordering):
+        self.ordering = list(ordering)
+        self.descending = self.ordering[0].startswith('-')
+        self.fields = [field.lstrip('-') for field in self.ordering]
+        self.querysets = [queryset.order_by(*self.ordering) for queryset in querysets]
+        self.model = self.querysets[0].model
+
+    def sort_key(self, row):
+        return tuple(getattr(row, field) for field in self.fields)
+
+    def filter(self, *args, **kwargs):
+        return ShardedQuery([queryset.filter(*args, **kwargs) for queryset in self.querysets], self.ordering)
+
+    def order_by(self, *ordering):
+        return ShardedQuery(self.querysets, ordering)
+
+    def count(self):
+        return sum(queryset.count() for queryset in self.querysets)
+
+    def merged(self, limit=None):
+        parts = [queryset if limit is None else queryset[:limit] for queryset in self.querysets]
+        return heapq.merge(*parts, key=self.sort_key, reverse=self.descending)
+
+    def __iter__(self):
+        return iter(list(self.merged()))
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, index):
+        if isinstance(index, int):
+            return self[index:index + 1][0]
+        start, stop = index.start or 0, index.stop
+        return list(islice(self.merged(limit=stop), start, stop))
+
+
+class LessonRequestQuerySet(models.QuerySet):
+    def create(self, **kwargs):
+        # create() router'a nesneyi göstermez; shard öğretmenden burada seçilir
+        if self._db is None and sharding_enabled():
+            tutor_id = kwargs.get('tutor_id', getattr(kwargs.get('tutor'), 'pk', None))
+            return self.using(shard_for_tutor(tutor_id)).create(**kwargs)
+        return super().create(**kwargs)
+
+    def for_tutor(self, tutor_id):
+        """
+        Öğretmenin talepleri; yalnızca öğretmenin shard'ı sorgulanır
+        """
+        return self.using(shard_for_tutor(tutor_id)).filter(tutor_id=tutor_id)
+
+    def across_shards(self, extra=(), ordering=('-created_at', '-pk')):
+        """
+        Sorguyu tüm shard'larda (ve extra sorgularda) çalıştıran ShardedQuery;
+        sharding kapalıysa ve extra yoksa sorgunun kendisi döner
+        """
+        if not sharding_enabled() and not extra:
+            return self
+        querysets = [self.using(alias) for alias in lesson_request_aliases()]
+        return ShardedQuery(querysets + list(extra), ordering)
+
+
+def allocate_lesson_request_id():
+    from .models import LessonRequestSequence
+
+    return LessonRequestSequence.objects.using(DEFAULT_DB_ALIAS).create().pk
+
+
+class LessonRequestRouter:
+    """
+    LessonRequest okuma/yazmalarını öğretmene göre shard'a, diğer modelleri
+    default'a yönlendirir
+    """
+    def db_for_read(self, model, **hints):
+        if not sharding_enabled():
+            return None
+        if model._meta.label != SHARDED_MODEL:
+            # İlişki üzerinden gelen okumalar shard'daki nesnenin veritabanına gitmesin
+            return DEFAULT_DB_ALIAS
+        instance = hints.get('instance')
+        if isinstance(instance, model) and instance.tutor_id is not None:
+            return shard_for_tutor(instance.tutor_id)
+        return None
+
+    db_for_write = db_for_read
+
+    def allow_relation(self, obj1, obj2, **hints):
+        if sharding_enabled() and SHARDED_MODEL in (obj1._meta.label, obj2._meta.label):
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in shard_aliases():
+            return app_label == 'apiService' and model_name == 'lessonrequest'
+        return None
@@ -0,0 +1,132 @@
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from .autocomplete import prefix_index, subject_item, tutor_update
+from .lookups import clear_subject_cache
+from .sharding import allocate_lesson_request_id, shard_aliases, sharding_enabled
+from .sync import is_archiving_lesson_requests
+from .models import LessonRequest, Subject, Tombstone, TutorSubject, User
+from .tutor_cards import CARD_USER_FIELDS, schedule_refresh
+
+
+@receiver([post_save, post_delete], sender=Subject)
+def invalidate_subject_cache(sender, **kwargs):
+    """
+    Ders eklendiğinde, değiştiğinde ya da silindiğinde süreç önbelleğini temizler
+
+    Commit'ten önce başka bir isteğin eski satırları tekrar önbelleğe
+    almasına karşı commit sonrasında bir kez daha temizlenir.
+    """
+    clear_subject_cache()
+    transaction.on_commit(clear_subject_cache)
+
+
+@receiver(pre_save, sender=LessonRequest)
+def assign_lesson_request_id(sender, instance, **kwargs):
+    # Shard'ların kendi otomatik id'leri çakışır; id ortak sıradan alınır
+    if instance.pk is None and sharding_enabled():
+        instance.pk = allocate_lesson_request_id()
+
+
+@receiver(post_delete, sender=LessonRequest)
+def record_lesson_request_deletion(sender, instance, **kwargs):
+    if is_archiving_lesson_requests():
+        return
+    # Silme kayıtları talebin shard'ında değil default veritabanında tutulur
+    Tombstone.objects.create(
+        model='lesson_request',
+        object_id=instance.pk,
+        student_id=instance.student_id,
+        tutor_id=instance.tutor_id,
+    )
+
+
+@receiver(pre_delete, sender=User)
+@receiver(pre_delete, sender=Subject)
+def delete_sharded_lesson_requests(sender, instance, using, **kwargs):
+    """
+    Silinen kullanıcının veya dersin shard'lardaki taleplerini siler
+
+    CASCADE yalnızca silmenin yapıldığı veritabanındaki talepleri bulur;
+    diğer shard'lardaki satırlar sahipsiz kalır. Her satır için silme
+    kaydı (Tombstone) yazılır. Shard'lar ayrı commit edildiği için silme
+    sonradan geri alınırsa talepler geri gelmez.
+    """
+    if sender is Subject:
+        lookup = Q(subject_id=instance.pk)
+    else:
+        lookup = Q(student_id=instance.pk) | Q(tutor_id=instance.pk)
+    for alias in shard_aliases():
+        if alias != using:
+            LessonRequest.objects.using(alias).filter(lookup).delete()
+
+
+@receiver(post_delete, sender=Subject)
+def record_subject_deletion(sender, instance, **kwargs):
+    Tombstone.objects.create(model='subject', object_id=instance.pk)
+
+
+@receiver(post_delete, sender=TutorSubject)
+def record_tutor_subject_deletion(sender, instance, **kwargs):
+    Tombstone.objects.create(model='tutor_subject', object_id=instance.pk)
+
+
+@receiver(post_delete, sender=User)
+def record_tutor_deletion(sender, instance, **kwargs):
+    # Senkronizasyonda yalnızca öğretmen profilleri gönderilir
+    if instance.role == 'tutor':
+        Tombstone.objects.create(model='tutor', object_id=instance.pk)
+
+
+def update_prefix_index(*args):
+    # Dizin commit sonrasında güncellenir; geri alınan kayıtlar aramaya girmez
+    transaction.on_commit(lambda: prefix_index.update(*args))
+
+
+# Bu alanlar değişmeyen kayıtlar (ör. girişte last_login) dizine dokunmaz
+INDEXED_USER_FIELDS = {'username', 'first_name', 'last_name', 'role', 'is_active'}
+
+
+@receiver(post_save, sender=User)
+def index_user(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not INDEXED_USER_FIELDS & set(update_fields):
+        return
+    update_prefix_index(*tutor_update(instance))
+
+
+@receiver(post_delete, sender=User)
+def unindex_user(sender, instance, **kwargs):
+    update_prefix_index(('tutor', instance.pk))
+
+
+@receiver(post_save, sender=Subject)
+def index_subject(sender, instance, **kwargs):
+    update_prefix_index(*subject_item(instance))
+
+
+@receiver(post_delete, sender=Subject)
+def unindex_subject(sender, instance, **kwargs):
+    update_prefix_index(('subject', instance.pk))
+
+
+@receiver(post_save, sender=User)
+def refresh_user_card(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not CARD_USER_FIELDS & set(update_fields):
+        return
+    # Rolü öğretmenlikten çıkan kullanıcının kartı da silinir
+    schedule_refresh([instance.pk])
+
+
+@receiver([post_save, post_delete], sender=TutorSubject)
+def refresh_tutor_subject_card(sender, instance, **kwargs):
+    schedule_refresh([instance.tutor_id])
+
+
+@receiver(post_save, sender=Subject)
+def refresh_subject_cards(sender, instance, created=False, **kwargs):
+    # Yeni dersi veren öğretmen yoktur; silmede TutorSubject sinyalleri çalışır
+    if created:
+        return
+    schedule_refresh(TutorSubject.objects.filter(subject_id=instance.pk).values_list('tutor_id', flat=True))
@@ -0,0 +1,170 @@
+"""
+Çevrimdışı çalışan istemciler için delta senkronizasyonu
+
+Her akış (ders talepleri, dersler, öğretmenler, öğretmen dersleri, silinen
+kayıtlar) kendi (updated_at, id) konumundan keyset ile taranır; istemciye
+dönen imleç bu konumların tamamını taşır. Sıralama zaman damgası ve id
+ile yapıldığı için aynı anda değişen satırlar atlanmaz.
+
+Sharding açıkken öğrencinin talepleri tüm shard'lardan (updated_at, id)
+sırasıyla birleştirilir; ilişkili User/Subject satırları JOIN yerine
+parça yüklendikten sonra default'tan ayrı sorguyla alınır.
+
+Commit'i geciken bir transaction'ın satırını kaçırmamak için son
+SYNC_SETTLE_SECONDS saniyede değişen satırlar bir sonraki senkronizasyona
+bırakılır.
+"""
+import base64
+import json
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db.models import Q, prefetch_related_objects
+from django.utils import timezone
+
+from .models import LessonRequest, Subject, Tombstone, TutorSubject, User
+from .sharding import ShardedQuery, sharding_enabled
+
+CURSOR_VERSION = 1
+
+STREAMS = ('lesson_requests', 'subjects', 'tutors', 'tutor_subjects', 'deleted')
+
+# Silinen kayıtların model adı -> yanıt anahtarı
+DELETED_KEYS = {
+    'lesson_request': 'lesson_requests',
+    'subject': 'subjects',
+    'tutor': 'tutors',
+    'tutor_subject': 'tutor_subjects',
+}
+
+
+# Açıkken silinen ders talepleri için silme kaydı (Tombstone) yazılmaz
+_archiving = ContextVar('archiving_lesson_requests', default=False)
+
+
+@contextmanager
+def archiving_lesson_requests():
+    """
+    Arşive taşınan talepler silinmiş sayılmaz; bu blokta silinen ders
+    talepleri istemcilere silme olarak gönderilmez
+    """
+    token = _archiving.set(True)
+    try:
+        yield
+    finally:
+        _archiving.reset(token)
+
+
+def is_archiving_lesson_requests():
+    return _archiving.get()
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+class ExpiredCursor(Exception):
+    pass
+
+
+def encode_cursor(positions):
+    payload = {'v': CURSOR_VERSION, 'p': positions}
+    raw = json.dumps(payload, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """
+    İmleci {akış: (datetime, id)} sözlüğüne çevirir
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if payload['v'] != CURSOR_VERSION:
+            raise InvalidCursor
+        return {
+            stream: (datetime.fromisoformat(moment), int(pk))
+            for stream, (moment, pk) in payload['p'].items()
+            if stream in STREAMS
+        }
+    except (ValueError, TypeError, KeyError):
+        raise InvalidCursor from None
+
+
+def stream_querysets(user):
+    """
+    Kullanıcının görebileceği satırlar; akış adı -> (queryset, zaman alanı)
+    """
+    participant = Q(student_id=user.pk) | Q(tutor_id=user.pk)
+    lesson_requests = LessonRequest.objects.filter(participant)
+    if sharding_enabled():
+        lesson_requests = lesson_requests.across_shards(ordering=('updated_at', 'pk'))
+    else:
+        lesson_requests = lesson_requests.select_related('student', 'tutor', 'subject')
+    return {
+        'lesson_requests': (lesson_requests, 'updated_at'),
+        'subjects': (Subject.objects.all(), 'updated_at'),
+        'tutors': (User.objects.filter(role='tutor'), 'updated_at'),
+        'tutor_subjects': (TutorSubject.objects.all(), 'updated_at'),
+        'deleted': (
+            Tombstone.objects.filter(~Q(model='lesson_request') | participant),
+            'deleted_at',
+        ),
+    }
+
+
+def collect_changes(user, positions, batch_size=None, now=None):
+    """
+    Konumlardan sonra değişen satırları akış başına en fazla batch_size
+    kadar döner: ({akış: [satırlar]}, yeni imleç, has_more)
+    """
+    batch_size = batch_size or settings.SYNC_BATCH_SIZE
+    now = now or timezone.now()
+    horizon = now - timedelta(seconds=settings.SYNC_SETTLE_SECONDS)
+
+    oldest_tombstone = now - settings.SYNC_TOMBSTONE_TTL
+    deleted_position = positions.get('deleted')
+    if positions and (deleted_position is None or deleted_position[0] < oldest_tombstone):
+        # Silinen kayıtlar temizlenmiş olabilir; istemci tam senkronizasyon yapmalı
+        raise ExpiredCursor
+
+    changes, new_positions, has_more = {}, {}, False
+    for stream, (queryset, field) in stream_querysets(user).items():
+        queryset = queryset.filter(**{f'{field}__lte': horizon})
+        position = positions.get(stream)
+        if position is not None:
+            moment, pk = position
+            queryset = queryset.filter(
+                Q(**{f'{field}__gt': moment}) | Q(**{field: moment, 'pk__gt': pk})
+            )
+        rows = list(queryset.order_by(field, 'pk')[:batch_size + 1])
+        if len(rows) > batch_size:
+            rows = rows[:batch_size]
+            has_more = True
+        if isinstance(queryset, ShardedQuery):
+            prefetch_related_objects(rows, 'student', 'tutor', 'subject')
+
+        changes[stream] = rows
+        if rows:
+            last = rows[-1]
+            new_positions[stream] = (getattr(last, field), last.pk)
+        else:
+            # Ufka kadar yeni satır yok; konum ufka ilerletilir ki seyrek
+            # değişen akışlar imlecin süresini doldurmasın
+            new_positions[stream] = (horizon, 0)
+
+    serialized = {
+        stream: [moment.isoformat(), pk] for stream, (moment, pk) in new_positions.items()
+    }
+    return changes, encode_cursor(serialized), has_more
+
+
+def purge_tombstones(now=None):
+    """
+    SYNC_TOMBSTONE_TTL'den eski silme kayıtlarını temizler
+    """
+    cutoff = (now or timezone.now()) - settings.SYNC_TOMBSTONE_TTL
+    deleted, _ = Tombstone.objects.filter(deleted_at__lt=cutoff).delete()
+    return deleted
@@ -0,0 +1,86 @@
+import time
+
+from django.test.runner import (
+    DiscoverRunner, ParallelTestSuite, RemoteTestResult, RemoteTestRunner
+)
+from unittest import TextTestResult
+
+
+class TimedRemoteTestResult(RemoteTestResult):
+    """
+    Paralel çalışan işlemlerde test süresini ölçüp ana işleme olay olarak iletir
+    """
+    def startTest(self, test):
+        self._started_at = time.perf_counter()
+        super().startTest(test)
+
+    def stopTest(self, test):
+        self.events.append(('addTiming', self.test_index, time.perf_counter() - self._started_at))
+        super().stopTest(test)
+
+
+class TimedRemoteTestRunner(RemoteTestRunner):
+    resultclass = TimedRemoteTestResult
+
+
+class TimedParallelTestSuite(ParallelTestSuite):
+    runner_class = TimedRemoteTestRunner
+
+
+class TimedTextTestResult(TextTestResult):
+    """
+    Test sürelerini toplayan sonuç sınıfı (seri ve --parallel çalıştırmada)
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.timings = {}
+
+    def startTest(self, test):
+        self._started_at = time.perf_counter()
+        super().startTest(test)
+
+    def addTiming(self, test, elapsed):
+        self.timings[test.id()] = elapsed
+
+    def stopTest(self, test):
+        # Paralel modda süre işçi işlemden addTiming ile gelmiştir
+        self.timings.setdefault(test.id(), time.perf_counter() - self._started_at)
+        super().stopTest(test)
+
+
+class TimedTestRunner(DiscoverRunner):
+    """
+    Test sonunda en yavaş testleri raporlayan test çalıştırıcısı
+    """
+    parallel_test_suite = TimedParallelTestSuite
+
+    def __init__(self, slowest=10, **kwargs):
+        super().__init__(**kwargs)
+        self.slowest = slowest
+
+    @classmethod
+    def add_arguments(cls, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            '--slowest',
+            type=int,
+            default=10,
+            help='Raporlanacak en yavaş test sayısı (0: rapor yok)',
+        )
+
+    def get_resultclass(self):
+        return super().get_resultclass() or TimedTextTestResult
+
+    def run_suite(self, suite, **kwargs):
+        result = super().run_suite(suite, **kwargs)
+        self.report_slowest(result)
+        return result
+
+    def report_slowest(self, result):
+        timings = getattr(result, 'timings', None)
+        if not timings or not self.slowest:
+            return
+        self.log(f'\nEn yavaş {min(self.slowest, len(timings))} test:')
+        slowest = sorted(timings.items(), key=lambda item: item[1], reverse=True)
+        for test_id, elapsed in slowest[:self.slowest]:
+            self.log(f'  {elapsed:7.3f}s  {test_id}')
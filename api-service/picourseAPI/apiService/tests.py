@@ -1,9 +1,51 @@
-from django.test import TestCase
+import csv
+import gzip
+import json
+import logging
+import os
+import pstats
+import tempfile
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, OperationalError, connection, connections
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
-from rest_framework.test import APITestCase
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
 from rest_framework import status
+from rest_framework_simplejwt.backends import TokenBackend
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
 from django.contrib.auth import get_user_model
-from .models import Subject, TutorSubject, LessonRequest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from .models import (
+    Subject, TutorSubject, LessonRequest, ArchivedLessonRequest, IdempotencyKey,
+    TutorCapacity, TutorWeeklyLoad, Tombstone, RevokedToken, TutorCard
+)
+from .admin import EstimatedCountPaginator
+from .autocomplete import fold, prefix_index
+from .authentication import TokenCache, token_cache
+from .capacity import (
+    CapacityExceeded, apply_status_change, create_pending_request, reserve_pending_slot, week_start
+)
+from .filters import TutorCardFilter
+from .docs import clear_schema_cache, generate_schema, schema_fingerprint
+from .views import LessonRequestClaimView, LessonRequestCreateView
+from .log import QueueJsonHandler
+from .lookups import clear_subject_cache, get_subject, get_subject_map
+from .revocation import BloomFilter, clear_bloom_filter, is_revoked
+from .sharding import shard_for_tutor
+from .factories import (
+    make_student, make_tutor, make_subject, make_lesson_request
+)
 from datetime import datetime, timedelta
 
 User = get_user_model()
@@ -84,33 +126,12 @@ class PermissionTestCase(APITestCase):
     Rol bazlı izin testleri
     """
     
-    def setUp(self):
-        # Test kullanıcıları oluştur
-        self.student = User.objects.create_user(
-            username='student',
-            email='student@test.com',
-            password='pass123',
-            role='student'
-        )
-        
-        self.tutor = User.objects.create_user(
-            username='tutor',
-            email='tutor@test.com',
-            password='pass123',
-            role='tutor'
-        )
-        
-        # Test ders konusu
-        self.subject = Subject.objects.create(
-            name='Test Subject',
-            description='Test description'
-        )
-        
-        # Öğretmen-ders ilişkisi
-        TutorSubject.objects.create(
-            tutor=self.tutor,
-            subject=self.subject
-        )
+    @classmethod
+    def setUpTestData(cls):
+        # Test kullanıcıları ve ders konusu (sınıf başına bir kez oluşturulur)
+        cls.subject = make_subject(name='Test Subject', description='Test description')
+        cls.student = make_student(username='student')
+        cls.tutor = make_tutor(username='tutor', subjects=[cls.subject])
         
     def test_student_can_create_lesson_request(self):
         """Öğrenci ders talebi oluşturabilir"""
@@ -147,13 +168,8 @@ class PermissionTestCase(APITestCase):
     def test_tutor_can_update_lesson_request_status(self):
         """Öğretmen ders talebi durumunu güncelleyebilir"""
         # Ders talebi oluştur
-        lesson_request = LessonRequest.objects.create(
-            student=self.student,
-            tutor=self.tutor,
-            subject=self.subject,
-            message='Test message',
-            preferred_date=datetime.now() + timedelta(days=1),
-            duration_hours=2
+        lesson_request = make_lesson_request(
+            self.student, self.tutor, self.subject, duration_hours=2
         )
         
         self.client.force_authenticate(user=self.tutor)
@@ -168,13 +184,8 @@ class PermissionTestCase(APITestCase):
         
     def test_student_cannot_update_lesson_request_status(self):
         """Öğrenci ders talebi durumunu güncelleyemez"""
-        lesson_request = LessonRequest.objects.create(
-            student=self.student,
-            tutor=self.tutor,
-            subject=self.subject,
-            message='Test message',
-            preferred_date=datetime.now() + timedelta(days=1),
-            duration_hours=2
+        lesson_request = make_lesson_request(
+            self.student, self.tutor, self.subject, duration_hours=2
         )
         
         self.client.force_authenticate(user=self.student)
@@ -192,31 +203,12 @@ class LessonRequestFlowTestCase(APITestCase):
     Ders talebi akış testleri
     """
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         # Test kullanıcıları ve verileri oluştur
-        self.student = User.objects.create_user(
-            username='student',
-            email='student@test.com',
-            password='pass123',
-            role='student'
-        )
-        
-        self.tutor = User.objects.create_user(
-            username='tutor',
-            email='tutor@test.com',
-            password='pass123',
-            role='tutor'
-        )
-        
-        self.subject = Subject.objects.create(
-            name='Mathematics',
-            description='Math lessons'
-        )
-        
-        TutorSubject.objects.create(
-            tutor=self.tutor,
-            subject=self.subject
-        )
+        cls.subject = make_subject(name='Mathematics', description='Math lessons')
+        cls.student = make_student(username='student')
+        cls.tutor = make_tutor(username='tutor', subjects=[cls.subject])
         
     def test_complete_lesson_request_flow(self):
         """Tam ders talebi akış testi"""
@@ -265,32 +257,30 @@ class TutorSearchTestCase(APITestCase):
     Öğretmen arama ve filtreleme testleri
     """
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         # Test verileri oluştur
-        self.math_subject = Subject.objects.create(name='Mathematics')
-        self.physics_subject = Subject.objects.create(name='Physics')
+        cls.math_subject = make_subject(name='Mathematics')
+        cls.physics_subject = make_subject(name='Physics')
         
-        self.tutor1 = User.objects.create_user(
+        cls.tutor1 = make_tutor(
             username='math_tutor',
             first_name='John',
             last_name='Doe',
-            role='tutor',
             rating=4.5,
-            bio='Experienced math teacher'
+            bio='Experienced math teacher',
+            subjects=[cls.math_subject]
         )
         
-        self.tutor2 = User.objects.create_user(
+        cls.tutor2 = make_tutor(
             username='physics_tutor',
             first_name='Jane',
             last_name='Smith',
-            role='tutor',
             rating=4.8,
-            bio='Physics expert'
+            bio='Physics expert',
+            subjects=[cls.physics_subject]
         )
         
-        TutorSubject.objects.create(tutor=self.tutor1, subject=self.math_subject)
-        TutorSubject.objects.create(tutor=self.tutor2, subject=self.physics_subject)
-        
     def test_tutor_list(self):
         """Öğretmen listesi testi"""
         url = reverse('tutor-list')
@@ -319,3 +309,1713 @@ class TutorSearchTestCase(APITestCase):
         response = self.client.get(url, {'ordering': '-rating'})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['results'][0]['rating'], 4.8)
+
+
+class TutorFilterTestCase(APITestCase):
+    """
+    Çoklu ders, deneyim, puan ve sınıf seviyesi filtre testleri
+    """
+    
+    url = reverse('tutor-list')
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.math = make_subject(name='Mathematics')
+        cls.physics = make_subject(name='Physics')
+        cls.history = make_subject(name='History')
+        
+        cls.both = make_tutor(username='both_tutor', rating=4.9, grade_level=12)
+        cls.math_only = make_tutor(
+            username='math_only', rating=3.5, grade_level=8,
+            subjects=[cls.math], experience_years=3
+        )
+        cls.history_only = make_tutor(
+            username='history_only', rating=4.2,
+            subjects=[cls.history], experience_years=6
+        )
+        with cls.captureOnCommitCallbacks(execute=True):
+            TutorSubject.objects.create(tutor=cls.both, subject=cls.math, experience_years=10)
+            TutorSubject.objects.create(tutor=cls.both, subject=cls.physics, experience_years=2)
+    
+    def usernames(self, params):
+        """Kart tablolarından ve (fields ile) kullanıcı tablosundan aynı sonuç döner"""
+        results = []
+        for extra in ({}, {'fields': 'username'}):
+            response = self.client.get(self.url, {**params, **extra})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            results.append(sorted(tutor['username'] for tutor in response.data['results']))
+        self.assertEqual(results[0], results[1])
+        return results[0]
+        
+    def test_any_subject_has_no_duplicates(self):
+        """Birden fazla ders eşleşse de öğretmen bir kez döner"""
+        ids = f'{self.math.id},{self.physics.id}'
+        self.assertEqual(self.usernames({'subjects': ids}), ['both_tutor', 'math_only'])
+        
+    def test_all_subjects(self):
+        """Tüm dersleri veren öğretmenler"""
+        ids = f'{self.math.id},{self.physics.id}'
+        self.assertEqual(
+            self.usernames({'subjects': ids, 'subject_match': 'all'}), ['both_tutor']
+        )
+        ids = f'{self.math.id},{self.physics.id},{self.history.id},999'
+        self.assertEqual(self.usernames({'subjects': ids, 'subject_match': 'all'}), [])
+        
+    def test_min_experience_applies_per_subject(self):
+        """Deneyim filtresi ilgili ders satırına uygulanır"""
+        params = {'subjects': self.physics.id, 'min_experience': 5}
+        self.assertEqual(self.usernames(params), [])
+        self.assertEqual(self.usernames({'min_experience': 5}), ['both_tutor', 'history_only'])
+        
+    def test_rating_range_and_grade_level(self):
+        """Puan aralığı ve sınıf seviyesi filtreleri"""
+        self.assertEqual(
+            self.usernames({'min_rating': 4.0, 'max_rating': 4.5}), ['history_only']
+        )
+        self.assertEqual(self.usernames({'grade_level': 10}), ['both_tutor', 'history_only'])
+
+
+class SparseFieldsetTestCase(APITestCase):
+    """
+    ?fields= / ?expand= hafif liste modu testleri
+    """
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.subject = make_subject(name='Mathematics', description='Math lessons')
+        cls.student = make_student(username='student')
+        cls.tutor = make_tutor(
+            username='tutor', first_name='John', rating=4.5, bio='Long bio',
+            subjects=[cls.subject], experience_years=4
+        )
+        make_lesson_request(cls.student, cls.tutor, cls.subject)
+        
+    def test_tutor_list_fields(self):
+        """Yalnızca istenen alanlar ve hafif ders gösterimi döner"""
+        url = reverse('tutor-list')
+        response = self.client.get(url, {'fields': 'id,first_name,rating,subjects'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        tutor = response.data['results'][0]
+        self.assertEqual(set(tutor), {'id', 'first_name', 'rating', 'subjects'})
+        self.assertEqual(
+            dict(tutor['subjects'][0]),
+            {'id': self.subject.id, 'name': 'Mathematics', 'experience_years': 4}
+        )
+        
+        response = self.client.get(url, {'fields': 'id,subjects', 'expand': 'subjects'})
+        self.assertIn('description', response.data['results'][0]['subjects'][0]['subject'])
+        
+    def test_tutor_list_without_fields_is_unchanged(self):
+        """Parametre verilmediğinde tam gösterim döner"""
+        response = self.client.get(reverse('tutor-list'))
+        tutor = response.data['results'][0]
+        self.assertIn('bio', tutor)
+        self.assertIn('subject', tutor['subjects'][0])
+        
+    def test_tutor_detail_fields(self):
+        """Detay görünümünde alan seçimi"""
+        url = reverse('tutor-detail', kwargs={'pk': self.tutor.pk})
+        with self.assertNumQueries(1):
+            response = self.client.get(url, {'fields': 'id,username,rating'})
+        self.assertEqual(set(response.data), {'id', 'username', 'rating'})
+        
+    def test_lesson_request_list_fields(self):
+        """Ders talebi listesinde alan seçimi ek sorgu üretmez"""
+        self.client.force_authenticate(user=self.student)
+        url = reverse('lesson-request-list')
+        # count + liste sorgusu
+        with self.assertNumQueries(2):
+            response = self.client.get(url, {'fields': 'id,tutor_name,subject_name,status'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            set(response.data['results'][0]), {'id', 'tutor_name', 'subject_name', 'status'}
+        )
+
+
+class CompressionTestCase(APITestCase):
+    """
+    Yanıt sıkıştırma testleri
+    """
+    
+    url = reverse('tutor-list')
+    
+    @classmethod
+    def setUpTestData(cls):
+        subject = make_subject(name='Matematik')
+        for _ in range(5):
+            make_tutor(
+                bio='Matematik alanında uzun yıllara dayanan deneyime sahibim. ' * 10,
+                subjects=[subject]
+            )
+        
+    def setUp(self):
+        cache.clear()
+        
+    def test_gzip_response(self):
+        """gzip kabul eden istemciye sıkıştırılmış yanıt döner"""
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        data = json.loads(gzip.decompress(response.content))
+        self.assertEqual(data['count'], 5)
+        
+    def test_negotiation_and_threshold(self):
+        """q=0 ile reddedilen kodlama ve küçük yanıtlar sıkıştırılmaz"""
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip;q=0')
+        self.assertFalse(response.has_header('Content-Encoding'))
+        
+        response = self.client.get(reverse('subject-list'), HTTP_ACCEPT_ENCODING='gzip')
+        self.assertFalse(response.has_header('Content-Encoding'))
+        
+    def test_compressed_variant_is_cached(self):
+        """Aynı gövde için ikinci istekte sıkıştırma yapılmaz"""
+        first = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip')
+        with mock.patch('apiService.middleware.compress') as compress:
+            second = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip')
+        compress.assert_not_called()
+        self.assertEqual(first.content, second.content)
+
+
+class LessonRequestConcurrencyTestCase(APITestCase):
+    """
+    If-Match koşullu güncelleme ve Idempotency-Key testleri
+    """
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = make_student()
+        cls.tutor = make_tutor()
+        cls.subject = make_subject()
+        cls.lesson_request = make_lesson_request(cls.student, cls.tutor, cls.subject)
+        
+    def setUp(self):
+        self.update_url = reverse('lesson-request-update', kwargs={'pk': self.lesson_request.pk})
+        self.create_data = {
+            'tutor': self.tutor.id,
+            'subject': self.subject.id,
+            'message': 'Test message',
+            'preferred_date': (datetime.now() + timedelta(days=1)).isoformat(),
+            'duration_hours': 2
+        }
+        
+    def test_if_match_update(self):
+        """Güncel sürümle güncelleme başarılı, eski sürümle 412 döner"""
+        self.client.force_authenticate(user=self.tutor)
+        list_response = self.client.get(reverse('lesson-request-list'))
+        version = list_response.data['results'][0]['updated_at']
+        
+        response = self.client.patch(
+            self.update_url, {'status': 'approved'}, HTTP_IF_MATCH=f'"{version}"'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        new_etag = response['ETag']
+        
+        # Eski sürümü gören ikinci cihaz
+        response = self.client.patch(
+            self.update_url, {'status': 'rejected'}, HTTP_IF_MATCH=f'"{version}"'
+        )
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.lesson_request.refresh_from_db()
+        self.assertEqual(self.lesson_request.status, 'approved')
+        
+        response = self.client.patch(self.update_url, {'status': 'rejected'}, HTTP_IF_MATCH=new_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        
+    def test_idempotency_key_replays_response(self):
+        """Aynı anahtarla tekrar gönderim yeni kayıt oluşturmaz"""
+        self.client.force_authenticate(user=self.student)
+        url = reverse('lesson-request-create')
+        first = self.client.post(url, self.create_data, HTTP_IDEMPOTENCY_KEY='retry-1')
+        second = self.client.post(url, self.create_data, HTTP_IDEMPOTENCY_KEY='retry-1')
+        
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(first.data['id'], second.data['id'])
+        self.assertEqual(second['Idempotent-Replayed'], 'true')
+        self.assertEqual(LessonRequest.objects.count(), 2)
+        
+        changed = dict(self.create_data, message='Farklı mesaj')
+        response = self.client.post(url, changed, HTTP_IDEMPOTENCY_KEY='retry-1')
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        
+    def test_expired_idempotency_key(self):
+        """Süresi dolan anahtar yeni bir istek olarak işlenir"""
+        self.client.force_authenticate(user=self.student)
+        url = reverse('lesson-request-create')
+        self.client.post(url, self.create_data, HTTP_IDEMPOTENCY_KEY='retry-2')
+        IdempotencyKey.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+        
+        response = self.client.post(url, self.create_data, HTTP_IDEMPOTENCY_KEY='retry-2')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertFalse(response.has_header('Idempotent-Replayed'))
+        self.assertEqual(LessonRequest.objects.count(), 3)
+
+
+class PermissionQueryCountTestCase(APITestCase):
+    """
+    İzin kontrollerinin ek sorgu üretmediğini doğrulayan testler
+    """
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = make_student()
+        cls.tutor = make_tutor()
+        cls.other_tutor = make_tutor()
+        cls.subject = make_subject()
+        cls.lesson_request = make_lesson_request(cls.student, cls.tutor, cls.subject)
+        cls.url = reverse('lesson-request-update', kwargs={'pk': cls.lesson_request.pk})
+        
+    def test_update_permission_adds_no_queries(self):
+        """Yetkili güncelleme: nesne sorgusu + sayaç ve durum UPDATE'leri"""
+        TutorCapacity.objects.create(tutor=self.tutor, pending_count=1)
+        TutorWeeklyLoad.objects.create(
+            tutor=self.tutor, week_start=week_start(self.lesson_request.preferred_date)
+        )
+        self.client.force_authenticate(user=self.tutor)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(self.url, {'status': 'approved'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        statements = [q['sql'].split()[0] for q in queries if 'SAVEPOINT' not in q['sql']]
+        self.assertEqual(statements, ['SELECT', 'UPDATE', 'UPDATE', 'UPDATE'])
+        
+    def test_other_tutor_gets_404_with_single_query(self):
+        """Yetkisiz öğretmen tek sorguda 404 alır"""
+        self.client.force_authenticate(user=self.other_tutor)
+        with self.assertNumQueries(1):
+            response = self.client.patch(self.url, {'status': 'approved'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        
+    def test_profile_owner_permission(self):
+        """IsOwner kullanıcı nesnesinde çalışır"""
+        self.client.force_authenticate(user=self.student)
+        response = self.client.patch(reverse('user-profile'), {'first_name': 'Can'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class LessonRequestArchiveTestCase(APITestCase):
+    """
+    Eski ders taleplerinin arşivlenmesi testleri
+    """
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = make_student()
+        cls.tutor = make_tutor(username='tutor')
+        cls.subject = make_subject()
+        
+        def create(status_value):
+            return make_lesson_request(cls.student, cls.tutor, cls.subject, status=status_value)
+        
+        cls.old_approved = create('approved')
+        cls.old_pending = create('pending')
+        cls.recent_rejected = create('rejected')
+        LessonRequest.objects.filter(
+            pk__in=[cls.old_approved.pk, cls.old_pending.pk]
+        ).update(updated_at=timezone.now() - timedelta(days=200))
+        
+    def test_archive_command_moves_only_old_resolved_requests(self):
+        """Yalnızca eski ve sonuçlanmış talepler taşınır"""
+        call_command('archive_lesson_requests', days=90, batch_size=1, stdout=StringIO())
+        
+        self.assertEqual(
+            list(ArchivedLessonRequest.objects.values_list('pk', flat=True)), [self.old_approved.pk]
+        )
+        self.assertFalse(LessonRequest.objects.filter(pk=self.old_approved.pk).exists())
+        self.assertEqual(LessonRequest.objects.count(), 2)
+        
+    def test_list_include_archived(self):
+        """Varsayılan liste aktif tabloyu, include_archived ikisini birlikte döner"""
+        call_command('archive_lesson_requests', days=90, stdout=StringIO())
+        self.client.force_authenticate(user=self.student)
+        url = reverse('lesson-request-list')
+        
+        response = self.client.get(url)
+        self.assertEqual(response.data['count'], 2)
+        
+        response = self.client.get(url, {'include_archived': '1'})
+        self.assertEqual(response.data['count'], 3)
+        archived = next(r for r in response.data['results'] if r['id'] == self.old_approved.pk)
+        self.assertEqual(archived['tutor_username'], 'tutor')
+        
+        response = self.client.get(url, {'include_archived': '1', 'status': 'approved'})
+        self.assertEqual([r['id'] for r in response.data['results']], [self.old_approved.pk])
+
+
+class ApiDocsTestCase(APITestCase):
+    """Önceden üretilen ve önbelleğe alınan OpenAPI şeması testleri"""
+    
+    def setUp(self):
+        schema_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(schema_dir.cleanup)
+        self.schema_file = Path(schema_dir.name) / 'openapi-schema.yaml'
+        
+        settings_override = override_settings(OPENAPI_SCHEMA_FILE=self.schema_file)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        clear_schema_cache()
+        self.addCleanup(clear_schema_cache)
+        
+    def test_build_command_and_check(self):
+        """Komut YAML/JSON ve özeti yazar; --check güncel şemayı doğrular"""
+        with self.assertRaises(CommandError):
+            call_command('build_openapi_schema', check=True, stdout=StringIO())
+        
+        call_command('build_openapi_schema', stdout=StringIO())
+        self.assertTrue(self.schema_file.is_file())
+        self.assertIn('/api/tutors/', json.loads(self.schema_file.with_suffix('.json').read_text())['paths'])
+        call_command('build_openapi_schema', check=True, stdout=StringIO())
+        
+    def test_schema_served_with_etag_and_regenerated_when_stale(self):
+        """Şema ETag ile sunulur; özet tutmayan dosya yeniden üretilir"""
+        self.schema_file.write_text('openapi: bayat-sema\n')
+        self.schema_file.with_suffix('.json').write_text('{}')
+        self.schema_file.with_suffix('.sha256').write_text('eski-ozet')
+        
+        response = self.client.get(reverse('schema'), {'format': 'json'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('/api/tutors/', json.loads(response.content)['paths'])
+        self.assertNotIn('bayat-sema', self.schema_file.read_text())
+        
+        response = self.client.get(reverse('schema'), HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response['ETag']
+        response = self.client.get(reverse('schema'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        
+    def test_fresh_schema_file_is_served_without_generation(self):
+        """Özet güncelse şema üretilmeden dosyadan okunur"""
+        call_command('build_openapi_schema', stdout=StringIO())
+        clear_schema_cache()
+        
+        with mock.patch('apiService.docs.generate_schema') as generate:
+            response = self.client.get(reverse('schema'))
+        generate.assert_not_called()
+        self.assertEqual(response.content, self.schema_file.read_bytes())
+        
+    def test_schema_documents_jwt_security_scheme(self):
+        """CachedJWTAuthentication şemada Bearer JWT olarak tanımlanır"""
+        call_command('build_openapi_schema', stdout=StringIO())
+        schema = json.loads(self.schema_file.with_suffix('.json').read_text())
+        self.assertEqual(schema['components']['securitySchemes']['jwtAuth']['scheme'], 'bearer')
+        self.assertIn({'jwtAuth': []}, schema['paths']['/api/lesson-requests/']['get']['security'])
+        
+    def test_fingerprint_covers_api_settings(self):
+        """DRF ve SimpleJWT ayarları özeti değiştirir; imza anahtarı değiştirmez"""
+        fingerprint = schema_fingerprint()
+        rest_framework = {**settings.REST_FRAMEWORK, 'PAGE_SIZE': 50}
+        simple_jwt = {**settings.SIMPLE_JWT, 'AUTH_HEADER_TYPES': ('JWT',)}
+        for override in ({'REST_FRAMEWORK': rest_framework}, {'SIMPLE_JWT': simple_jwt}):
+            with self.subTest(setting=next(iter(override))), override_settings(**override):
+                clear_schema_cache()
+                self.assertNotEqual(schema_fingerprint(), fingerprint)
+        
+        with override_settings(SIMPLE_JWT={**settings.SIMPLE_JWT, 'SIGNING_KEY': 'baska-anahtar'}):
+            clear_schema_cache()
+            self.assertEqual(schema_fingerprint(), fingerprint)
+
+
+class TutorPageTestCase(APITestCase):
+    """Öğretmen sayfası birleşik endpoint testleri"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.math = make_subject(name='Matematik')
+        cls.physics = make_subject(name='Fizik')
+        cls.tutor = make_tutor(subjects=[cls.math], experience_years=4)
+        cls.student = make_student()
+        make_lesson_request(cls.student, cls.tutor, cls.math, status='rejected')
+        cls.latest = make_lesson_request(cls.student, cls.tutor, cls.physics)
+        cls.url = reverse('tutor-page', args=[cls.tutor.pk])
+        
+    def test_page_for_student_in_two_queries(self):
+        """Öğretmen, dersler ve son talep iki sorguda döner"""
+        self.client.force_authenticate(user=self.student)
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['tutor']['id'], self.tutor.pk)
+        self.assertEqual(
+            [(s['subject']['name'], s['experience_years']) for s in response.data['tutor']['subjects']],
+            [('Matematik', 4)]
+        )
+        self.assertEqual([s['name'] for s in response.data['subjects']], ['Fizik', 'Matematik'])
+        self.assertEqual(response.data['lesson_request']['id'], self.latest.pk)
+        self.assertEqual(response.data['lesson_request']['status'], 'pending')
+        
+    def test_page_for_anonymous_and_unknown_tutor(self):
+        """Anonim kullanıcıda talep boş döner; öğretmen yoksa 404"""
+        response = self.client.get(self.url)
+        self.assertIsNone(response.data['lesson_request'])
+        
+        response = self.client.get(reverse('tutor-page', args=[self.student.pk]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+@override_settings(BATCH_LOOKUP_MAX_IDS=3)
+class BatchLookupTestCase(APITestCase):
+    """?ids= ile toplu getirme testleri"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.subject = make_subject()
+        cls.tutors = [make_tutor(subjects=[cls.subject]) for _ in range(3)]
+        cls.student = make_student()
+        cls.other_student = make_student()
+        cls.own_request = make_lesson_request(cls.student, cls.tutors[0], cls.subject)
+        cls.other_request = make_lesson_request(cls.other_student, cls.tutors[0], cls.subject)
+        
+    def test_tutors_by_ids_in_request_order(self):
+        """Öğretmenler tek IN sorgusu ve ders prefetch'i ile istenen sırada döner"""
+        ids = [self.tutors[2].pk, self.student.pk, self.tutors[0].pk]
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('tutor-list'), {'ids': ','.join(map(str, ids))})
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([t['id'] for t in response.data], [self.tutors[2].pk, self.tutors[0].pk])
+        self.assertEqual(len(response.data[0]['subjects']), 1)
+        
+    def test_invalid_and_oversized_batches(self):
+        """Geçersiz ya da sınırı aşan id listeleri 400 döner"""
+        response = self.client.get(reverse('tutor-list'), {'ids': '1,abc'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        
+        response = self.client.get(reverse('tutor-list'), {'ids': '1,2,3,4'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('ids', response.data)
+        
+    def test_lesson_requests_skip_rows_of_other_users(self):
+        """Başka kullanıcının talepleri toplu istekte atlanır"""
+        self.client.force_authenticate(user=self.student)
+        response = self.client.get(
+            reverse('lesson-request-list'),
+            {'ids': f'{self.other_request.pk},{self.own_request.pk}'}
+        )
+        self.assertEqual([r['id'] for r in response.data], [self.own_request.pk])
+
+
+class LookupCacheTestCase(APITestCase):
+    """Subject süreç önbelleği ve kullanıcı kimlik haritası testleri"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.subject = make_subject(name='Matematik')
+        cls.tutor = make_tutor(subjects=[cls.subject])
+        cls.student = make_student()
+        
+    def setUp(self):
+        clear_subject_cache()
+        get_subject_map()
+        
+    def test_create_costs_one_lookup_and_one_insert(self):
+        """Ders önbellekten gelir; öğretmen okunur, kapasite sayacı artırılır ve talep eklenir"""
+        self.client.force_authenticate(user=self.student)
+        data = {
+            'tutor': self.tutor.pk,
+            'subject': self.subject.pk,
+            'message': 'Merhaba',
+            'preferred_date': (datetime.now() + timedelta(days=1)).isoformat(),
+        }
+        TutorCapacity.objects.create(tutor=self.tutor)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(reverse('lesson-request-create'), data)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['subject_name'], 'Matematik')
+        statements = [q['sql'].split()[0] for q in queries if 'SAVEPOINT' not in q['sql']]
+        self.assertEqual(statements, ['SELECT', 'UPDATE', 'INSERT'])
+        
+        data['tutor'] = self.student.pk
+        with self.assertNumQueries(0):
+            response = self.client.post(reverse('lesson-request-create'), data)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        
+    def test_subject_changes_invalidate_cache(self):
+        """Ders kaydı ve silinmesi önbelleği temizler"""
+        self.subject.name = 'İleri Matematik'
+        self.subject.save()
+        self.assertEqual(get_subject(self.subject.pk).name, 'İleri Matematik')
+        
+        new_subject = make_subject()
+        self.assertEqual(get_subject_map()[new_subject.pk], new_subject)
+        new_subject_id = new_subject.pk
+        new_subject.delete()
+        self.assertNotIn(new_subject_id, get_subject_map())
+
+
+@override_settings(TUTOR_MAX_PENDING_REQUESTS=2, TUTOR_MAX_WEEKLY_HOURS=3)
+class TutorCapacityTestCase(APITestCase):
+    """Öğretmen kapasite sınırları testleri"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.subject = make_subject()
+        cls.tutor = make_tutor(subjects=[cls.subject])
+        cls.student = make_student()
+        
+    def create_request(self, duration_hours=2):
+        self.client.force_authenticate(user=self.student)
+        return self.client.post(reverse('lesson-request-create'), {
+            'tutor': self.tutor.pk,
+            'subject': self.subject.pk,
+            'message': 'Merhaba',
+            'preferred_date': (timezone.now() + timedelta(days=7)).isoformat(),
+            'duration_hours': duration_hours,
+        })
+        
+    def set_status(self, pk, status_value):
+        self.client.force_authenticate(user=self.tutor)
+        url = reverse('lesson-request-update', kwargs={'pk': pk})
+        return self.client.patch(url, {'status': status_value})
+        
+    def test_pending_and_weekly_hour_caps(self):
+        """Bekleyen talep ve haftalık saat sınırı aşılamaz, sonuçlanan talep yer açar"""
+        first = self.create_request().data['id']
+        second = self.create_request().data['id']
+        response = self.create_request()
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertIn('error', response.data)
+        
+        self.assertEqual(self.set_status(first, 'approved').status_code, status.HTTP_200_OK)
+        self.assertEqual(self.set_status(second, 'approved').status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(LessonRequest.objects.get(pk=second).status, 'pending')
+        
+        self.assertEqual(self.set_status(second, 'rejected').status_code, status.HTTP_200_OK)
+        self.assertEqual(TutorCapacity.objects.get(tutor=self.tutor).pending_count, 0)
+        self.assertEqual(self.create_request().status_code, status.HTTP_201_CREATED)
+        
+    def test_rebuild_counters_matches_requests(self):
+        """Sayaçlar kaynak tablodan yeniden hesaplanabilir"""
+        make_lesson_request(self.student, self.tutor, self.subject)
+        make_lesson_request(self.student, self.tutor, self.subject, status='approved', duration_hours=3)
+        call_command('rebuild_tutor_capacity', stdout=StringIO())
+        
+        self.assertEqual(TutorCapacity.objects.get(tutor=self.tutor).pending_count, 1)
+        self.assertEqual(TutorWeeklyLoad.objects.get(tutor=self.tutor).booked_hours, 3)
+        
+    def test_rejection_at_cap_does_not_count_requests(self):
+        """Sınır doluyken reddetme kaynak tabloyu saymaz: iki sabit sorgu"""
+        TutorCapacity.objects.create(tutor=self.tutor, pending_count=settings.TUTOR_MAX_PENDING_REQUESTS)
+        with CaptureQueriesContext(connection) as queries, self.assertRaises(CapacityExceeded):
+            reserve_pending_slot(self.tutor.pk)
+        self.assertEqual(len(queries), 2)
+        self.assertFalse(any('apiService_lessonrequest' in query['sql'] for query in queries))
+
+
+@override_settings(TUTOR_MAX_PENDING_REQUESTS=5)
+class TutorCapacityStressTestCase(TransactionTestCase):
+    """
+    Eşzamanlı yazan iş parçacıklarıyla kapasite sınırının aşılmadığını doğrular
+
+    Test istemcisi istisnaları global bir sinyalle yakaladığı için iş
+    parçacıkları view'ı APIRequestFactory ile doğrudan çağırır.
+    """
+    
+    WRITERS = 8
+    ATTEMPTS = 3
+    
+    def setUp(self):
+        self.subject = make_subject()
+        self.tutor = make_tutor(subjects=[self.subject])
+        self.students = [make_student() for _ in range(self.WRITERS)]
+        
+    def write(self, student, barrier, results):
+        view = LessonRequestCreateView.as_view()
+        factory = APIRequestFactory()
+        barrier.wait()
+        try:
+            for _ in range(self.ATTEMPTS):
+                # Paylaşılan SQLite test veritabanında kilitlenen yazma tekrar denenir
+                for _ in range(100):
+                    request = factory.post(reverse('lesson-request-create'), {
+                        'tutor': self.tutor.pk,
+                        'subject': self.subject.pk,
+                        'message': 'Merhaba',
+                        'preferred_date': (timezone.now() + timedelta(days=1)).isoformat(),
+                    })
+                    force_authenticate(request, user=student)
+                    try:
+                        results.append(view(request).status_code)
+                        break
+                    except OperationalError:
+                        time.sleep(0.005)
+        finally:
+            connection.close()
+        
+    def test_parallel_writers_never_exceed_cap(self):
+        barrier = threading.Barrier(self.WRITERS)
+        results = []
+        threads = [
+            threading.Thread(target=self.write, args=(student, barrier, results))
+            for student in self.students
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(len(results), self.WRITERS * self.ATTEMPTS)
+        self.assertEqual(results.count(status.HTTP_201_CREATED), 5)
+        self.assertEqual(results.count(status.HTTP_409_CONFLICT), len(results) - 5)
+        self.assertEqual(LessonRequest.objects.filter(tutor=self.tutor).count(), 5)
+        self.assertEqual(TutorCapacity.objects.get(tutor=self.tutor).pending_count, 5)
+
+
+class AdminChangelistTestCase(TestCase):
+    """Admin liste sayfalarının satır sayısıyla artmayan sorgu sayısı testleri"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = User.objects.create_superuser('admin', 'admin@example.com', 'pass')
+        cls.subject = make_subject()
+        cls.tutor = make_tutor()
+        
+    def changelist_sql(self, url, **params):
+        self.client.force_login(self.admin_user)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return [query['sql'] for query in queries]
+        
+    def changelist_queries(self, url, **params):
+        return len(self.changelist_sql(url, **params))
+        
+    def test_lesson_request_changelist_queries_do_not_grow(self):
+        """select_related ile sorgu sayısı satır sayısından bağımsızdır"""
+        url = reverse('admin:apiService_lessonrequest_changelist')
+        make_lesson_request(make_student(), self.tutor, self.subject)
+        few = self.changelist_queries(url)
+        for _ in range(5):
+            make_lesson_request(make_student(), self.tutor, self.subject)
+        self.assertEqual(self.changelist_queries(url), few)
+        self.assertEqual(self.changelist_queries(url, q='abc'), few)
+        
+    def test_lesson_request_search_does_not_cast_id(self):
+        """Sayısal arama birincil anahtarla, diğerleri kullanıcı adı önekiyle yapılır"""
+        request = make_lesson_request(make_student(username='ayse'), self.tutor, self.subject)
+        for name in ('lessonrequest', 'archivedlessonrequest'):
+            url = reverse(f'admin:apiService_{name}_changelist')
+            with self.subTest(admin=name):
+                # id metne çevrilmez: SQLite'ta "id" LIKE, PostgreSQL'de "id"::text olurdu
+                for sql in self.changelist_sql(url, q='abc'):
+                    self.assertNotRegex(sql, r'"id" LIKE|"id"::text|CAST\(')
+                self.assertTrue(any(
+                    f'"apiService_{name}"."id" = {request.pk}' in sql
+                    for sql in self.changelist_sql(url, q=str(request.pk))
+                ))
+        
+        url = reverse('admin:apiService_lessonrequest_changelist')
+        self.client.force_login(self.admin_user)
+        for term in (str(request.pk), 'ay', '9' * 30):
+            response = self.client.get(url, {'q': term})
+            expected = [] if term == '9' * 30 else [request]
+            self.assertEqual(list(response.context['cl'].result_list), expected)
+        
+    def test_estimated_count_paginator_caps_exact_count(self):
+        """Sınırı aşan sayımda tam COUNT yerine sınırlı sayım kullanılır"""
+        for _ in range(3):
+            make_student()
+        queryset = User.objects.order_by('pk')
+        with mock.patch.object(EstimatedCountPaginator, 'EXACT_COUNT_LIMIT', 2):
+            self.assertEqual(EstimatedCountPaginator(queryset, 1).count, 3)
+        self.assertEqual(EstimatedCountPaginator(queryset, 1).count, User.objects.count())
+
+
+class RequestLoggingTestCase(APITestCase):
+    """İstek logu örnekleme, yavaş istek ve request id testleri"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        make_subject()
+        
+    def get_logged(self, sample_rate, slow_request_ms=10000, slow_query_ms=10000):
+        config = {
+            'SAMPLE_RATES': {'subject-list': sample_rate},
+            'SLOW_REQUEST_MS': slow_request_ms,
+            'SLOW_QUERY_MS': slow_query_ms,
+        }
+        with override_settings(REQUEST_LOG=config), \
+                self.assertLogs('apiService', 'INFO') as logs:
+            response = self.client.get(reverse('subject-list'))
+            # assertLogs en az bir kayıt bekler
+            logging.getLogger('apiService').info('end')
+        return response, [record for record in logs.records if record.getMessage() != 'end']
+        
+    def test_sampling_and_slow_requests(self):
+        """Örneklenmeyen istek loglanmaz; yavaş istek her zaman WARNING ile loglanır"""
+        _, records = self.get_logged(sample_rate=0)
+        self.assertEqual(records, [])
+        
+        _, records = self.get_logged(sample_rate=1)
+        self.assertEqual(records[0].route, 'subject-list')
+        self.assertEqual(records[0].levelname, 'INFO')
+        
+        _, records = self.get_logged(sample_rate=0, slow_request_ms=0)
+        self.assertEqual(records[0].levelname, 'WARNING')
+        self.assertEqual(records[0].sample_rate, 1.0)
+        
+    def test_request_id_reaches_sql_logs(self):
+        """Yavaş sorgu kayıtları isteğin request id'sini taşır"""
+        response, records = self.get_logged(sample_rate=1, slow_query_ms=0)
+        sql_records = [record for record in records if record.name == 'apiService.sql']
+        self.assertTrue(sql_records)
+        self.assertEqual(
+            {record.request_id for record in records}, {response['X-Request-ID']}
+        )
+        self.assertEqual(records[-1].sql_count, len(sql_records))
+        
+    def test_queue_handler_writes_json_lines(self):
+        """Kuyruk handler'ı kayıtları arka planda JSON satırı olarak yazar"""
+        with tempfile.TemporaryDirectory() as log_dir:
+            handler = QueueJsonHandler(filename=os.path.join(log_dir, 'app.log'))
+            handler.handle(logging.makeLogRecord({
+                'name': 'apiService', 'levelname': 'INFO', 'levelno': logging.INFO,
+                'msg': 'merhaba %s', 'args': ('dünya',), 'route': 'tutor-list',
+            }))
+            handler.stop()
+            handler.target.close()
+            with open(os.path.join(log_dir, 'app.log'), encoding='utf-8') as log_file:
+                line = json.loads(log_file.readline())
+        self.assertEqual(line['message'], 'merhaba dünya')
+        self.assertEqual(line['route'], 'tutor-list')
+
+
+@override_settings(SYNC_SETTLE_SECONDS=0)
+class SyncTestCase(APITestCase):
+    """Delta senkronizasyonu testleri"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = make_student()
+        cls.other_student = make_student(username='other')
+        cls.subject = make_subject(name='Fizik')
+        cls.tutor = make_tutor(username='tutor', subjects=[cls.subject])
+        cls.own_request = make_lesson_request(cls.student, cls.tutor, cls.subject)
+        cls.other_request = make_lesson_request(cls.other_student, cls.tutor, cls.subject)
+        
+    def setUp(self):
+        self.client.force_authenticate(user=self.student)
+        
+    def sync(self, since=None):
+        params = {'since': since} if since else {}
+        return self.client.get(reverse('sync'), params)
+        
+    def test_initial_sync_returns_visible_rows(self):
+        """İlk senkronizasyon yalnızca kullanıcının taleplerini ve ortak verileri döner"""
+        response = self.sync()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.data['has_more'])
+        self.assertEqual([r['id'] for r in response.data['lesson_requests']], [self.own_request.pk])
+        self.assertEqual([s['id'] for s in response.data['subjects']], [self.subject.pk])
+        self.assertEqual([t['id'] for t in response.data['tutors']], [self.tutor.pk])
+        self.assertNotIn('subjects', response.data['tutors'][0])
+        self.assertEqual(response.data['tutor_subjects'][0]['tutor'], self.tutor.pk)
+        
+    def test_incremental_changes_and_deletions(self):
+        """Sonraki senkronizasyon yalnızca değişen ve silinen kayıtları döner"""
+        cursor = self.sync().data['cursor']
+        
+        response = self.sync(cursor)
+        self.assertEqual(response.data['lesson_requests'], [])
+        self.assertEqual(response.data['subjects'], [])
+        
+        self.own_request.status = 'approved'
+        self.own_request.save()
+        subject_id = self.subject.pk
+        self.subject.delete()
+        response = self.sync(response.data['cursor'])
+        self.assertEqual(response.data['deleted']['subjects'], [subject_id])
+        self.assertEqual(response.data['deleted']['tutor_subjects'], [
+            t.object_id for t in Tombstone.objects.filter(model='tutor_subject')
+        ])
+        # Ders silinince ona bağlı talepler de silinir; başkasının talebi gönderilmez
+        self.assertEqual(response.data['deleted']['lesson_requests'], [self.own_request.pk])
+        
+    def test_batches_with_has_more(self):
+        """Satırlar akış başına parça parça gelir, imleçle kaldığı yerden devam eder"""
+        for index in range(4):
+            make_subject(name=f'Ders {index}')
+        seen = []
+        cursor = None
+        with override_settings(SYNC_BATCH_SIZE=2):
+            while True:
+                response = self.sync(cursor)
+                seen += [s['id'] for s in response.data['subjects']]
+                cursor = response.data['cursor']
+                if not response.data['has_more']:
+                    break
+        self.assertEqual(sorted(seen), sorted(Subject.objects.values_list('pk', flat=True)))
+        
+    def test_invalid_and_expired_cursor(self):
+        """Bozuk imleç 400, saklama süresini aşmış imleç 410 döner"""
+        self.assertEqual(self.sync('bozuk').status_code, status.HTTP_400_BAD_REQUEST)
+        
+        cursor = self.sync().data['cursor']
+        with override_settings(SYNC_TOMBSTONE_TTL=timedelta(0)):
+            self.assertEqual(self.sync(cursor).status_code, status.HTTP_410_GONE)
+        
+    def test_archiving_does_not_create_tombstones(self):
+        """Arşivlenen talepler silme kaydı oluşturmaz"""
+        LessonRequest.objects.filter(pk=self.own_request.pk).update(
+            status='approved', updated_at=timezone.now() - timedelta(days=200)
+        )
+        call_command('archive_lesson_requests', days=90, stdout=StringIO())
+        self.assertFalse(LessonRequest.objects.filter(pk=self.own_request.pk).exists())
+        self.assertFalse(Tombstone.objects.exists())
+        
+        # Arşivleme bittikten sonra silinen talepler yine silme kaydı bırakır
+        other_request_id = self.other_request.pk
+        self.other_request.delete()
+        self.assertEqual(list(Tombstone.objects.values_list('object_id', flat=True)), [other_request_id])
+
+
+class TokenCacheTestCase(APITestCase):
+    """Doğrulanmış JWT önbelleği testleri"""
+    
+    def setUp(self):
+        token_cache.clear()
+        self.student = make_student()
+        
+    def test_repeated_token_is_verified_once(self):
+        """Aynı token ikinci istekte imza doğrulamasına girmez"""
+        token = str(AccessToken.for_user(self.student))
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        decode = 'rest_framework_simplejwt.backends.TokenBackend.decode'
+        with mock.patch(decode, autospec=True, side_effect=TokenBackend.decode) as decoded:
+            for _ in range(3):
+                response = self.client.get(reverse('user-profile'))
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(decoded.call_count, 1)
+        self.assertEqual((token_cache.hits, token_cache.misses), (2, 1))
+        
+    def test_expired_entries_and_size_limit(self):
+        """Süresi dolan kayıt dönmez; boyut aşılınca en eski kayıt atılır"""
+        cache = TokenCache(max_size=2)
+        cache.set('a', 1, expires_at=100, now=0)
+        self.assertEqual(cache.get('a', now=50), 1)
+        self.assertIsNone(cache.get('a', now=100))
+        
+        cache.set('a', 1, expires_at=100, now=0)
+        cache.set('b', 2, expires_at=100, now=0)
+        cache.get('a', now=0)
+        cache.set('c', 3, expires_at=100, now=0)
+        self.assertEqual(set(cache.entries), {'a', 'c'})
+        
+    def test_invalid_token_is_not_cached(self):
+        """Geçersiz token önbelleğe girmez ve 401 alır"""
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer bozuk.token.deger')
+        response = self.client.get(reverse('user-profile'))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(len(token_cache), 0)
+
+
+class TokenRevocationTestCase(APITestCase):
+    """Refresh token rotation ve iptal testleri"""
+    
+    def setUp(self):
+        clear_bloom_filter()
+        self.student = make_student()
+        
+    def refresh(self, token):
+        return self.client.post(reverse('token_refresh'), {'refresh': token}, format='json')
+        
+    def test_rotated_refresh_token_cannot_be_reused(self):
+        """Yenilemede dönen eski refresh token ikinci kez kullanılamaz"""
+        old = str(RefreshToken.for_user(self.student))
+        response = self.refresh(old)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.refresh(response.data['refresh']).status_code, status.HTTP_200_OK)
+        
+        self.assertEqual(self.refresh(old).status_code, status.HTTP_401_UNAUTHORIZED)
+        # Filtre yeniden kurulduğunda da iptal görünür
+        clear_bloom_filter()
+        self.assertEqual(self.refresh(old).status_code, status.HTTP_401_UNAUTHORIZED)
+        response = self.client.post(reverse('token_verify'), {'token': old}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        
+    def test_unrevoked_check_skips_database(self):
+        """Filtrede olmayan jti için veritabanına bakılmaz"""
+        self.refresh(str(RefreshToken.for_user(self.student)))
+        with self.assertNumQueries(0):
+            self.assertFalse(is_revoked('iptal-edilmemis'))
+            
+    def test_bloom_filter_and_bucket_purge(self):
+        """Filtre eklenen değeri kaçırmaz; süresi geçmiş kovalar silinir"""
+        bloom = BloomFilter(capacity=100, error_rate=0.01)
+        for index in range(100):
+            bloom.add(f'jti-{index}')
+        self.assertTrue(all(f'jti-{index}' in bloom for index in range(100)))
+        
+        self.refresh(str(RefreshToken.for_user(self.student)))
+        RevokedToken.objects.create(
+            jti='eski', expires_at=timezone.now() - timedelta(days=2),
+            expires_on=(timezone.now() - timedelta(days=2)).date()
+        )
+        call_command('purge_revoked_tokens', stdout=StringIO())
+        self.assertFalse(RevokedToken.objects.filter(jti='eski').exists())
+        self.assertEqual(RevokedToken.objects.count(), 1)
+
+
+@override_settings(LESSON_REQUEST_SHARDS=['lessons_0', 'lessons_1'])
+class LessonRequestShardingTestCase(APITestCase):
+    """LessonRequest'in iki SQLite veritabanına bölünmesi testleri"""
+    databases = {'default', 'lessons_0', 'lessons_1'}
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = make_student()
+        cls.subject = make_subject()
+        # Farklı shard'lara düşen iki öğretmen
+        tutors = {}
+        while len(tutors) < 2:
+            tutor = make_tutor()
+            tutors.setdefault(shard_for_tutor(tutor.pk), tutor)
+        cls.tutors = [tutors['lessons_0'], tutors['lessons_1']]
+        cls.requests = [
+            make_lesson_request(cls.student, cls.tutors[index % 2], cls.subject)
+            for index in range(5)
+        ]
+        
+    def test_rows_live_on_tutor_shard_with_unique_ids(self):
+        """Talep öğretmeninin shard'ına yazılır; id'ler shard'lar arasında çakışmaz"""
+        for alias, tutor in zip(['lessons_0', 'lessons_1'], self.tutors):
+            ids = set(LessonRequest.objects.using(alias).values_list('tutor_id', flat=True))
+            self.assertEqual(ids, {tutor.pk})
+        self.assertFalse(LessonRequest.objects.using('default').exists())
+        self.assertEqual(len({r.pk for r in self.requests}), 5)
+        
+    def test_tutor_list_queries_single_shard(self):
+        """Öğretmenin listesi yalnızca kendi shard'ını sorgular"""
+        self.client.force_authenticate(user=self.tutors[1])
+        with CaptureQueriesContext(connections['lessons_0']) as other, \
+                CaptureQueriesContext(connections['lessons_1']) as own:
+            response = self.client.get(reverse('lesson-request-list'))
+        self.assertEqual(response.data['count'], 2)
+        self.assertEqual(len(other), 0)
+        self.assertTrue(own)
+        
+    def test_student_list_merges_shards_by_created_at(self):
+        """Öğrenci listesi shard'lardan created_at sırasıyla birleştirilir ve sayfalanır"""
+        self.client.force_authenticate(user=self.student)
+        url = reverse('lesson-request-list')
+        expected = [r.pk for r in sorted(self.requests, key=lambda r: (r.created_at, r.pk), reverse=True)]
+        
+        response = self.client.get(url)
+        self.assertEqual(response.data['count'], 5)
+        self.assertEqual([r['id'] for r in response.data['results']], expected)
+        self.assertEqual(response.data['results'][0]['tutor_username'],
+                         User.objects.get(pk=response.data['results'][0]['tutor']).username)
+        
+        response = self.client.get(url, {'limit': 2, 'offset': 2})
+        self.assertEqual([r['id'] for r in response.data['results']], expected[2:4])
+        
+    def test_tutor_updates_request_on_shard(self):
+        """Öğretmen kendi shard'ındaki talebi onaylayabilir"""
+        lesson_request = self.requests[1]
+        self.client.force_authenticate(user=self.tutors[1])
+        response = self.client.patch(
+            reverse('lesson-request-update', args=[lesson_request.pk]), {'status': 'approved'}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            LessonRequest.objects.using('lessons_1').get(pk=lesson_request.pk).status, 'approved'
+        )
+        
+    def test_create_writes_to_tutor_shard(self):
+        """API ile oluşturulan talep öğretmenin shard'ına yazılır"""
+        self.client.force_authenticate(user=self.student)
+        response = self.client.post(reverse('lesson-request-create'), {
+            'tutor': self.tutors[0].pk,
+            'subject': self.subject.pk,
+            'message': 'Merhaba',
+            'preferred_date': (timezone.now() + timedelta(days=2)).isoformat(),
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(LessonRequest.objects.using('lessons_0').filter(pk=response.data['id']).exists())
+        self.assertEqual(TutorCapacity.objects.get(tutor=self.tutors[0]).pending_count, 4)
+        
+    def test_failed_shard_write_returns_reserved_slot(self):
+        """Shard'a yazılamayan talebin ayrılan yeri geri verilir"""
+        tutor = self.tutors[0]
+        with self.assertRaises(DatabaseError):
+            create_pending_request(tutor.pk, mock.Mock(side_effect=DatabaseError('shard kapalı')))
+        self.assertEqual(TutorCapacity.objects.get(tutor=tutor).pending_count, 3)
+        
+        stale = LessonRequest.objects.for_tutor(tutor.pk).first()
+        self.assertFalse(apply_status_change(stale, 'approved', version=stale.updated_at - timedelta(seconds=1)))
+        self.assertEqual(TutorWeeklyLoad.objects.get(tutor=tutor).booked_hours, 0)
+        
+    def test_counter_drift_only_overcounts_and_is_reconciled(self):
+        """Durum shard'a yazıldıktan sonra sayaç güncellenemezse fazla sayar; rebuild düzeltir"""
+        tutor = self.tutors[0]
+        lesson_request = LessonRequest.objects.for_tutor(tutor.pk).first()
+        reserve_pending_slot(tutor.pk)
+        with mock.patch('apiService.capacity._release_counters', side_effect=DatabaseError), \
+                self.assertRaises(DatabaseError):
+            apply_status_change(lesson_request, 'rejected')
+        self.assertEqual(LessonRequest.objects.for_tutor(tutor.pk).get(pk=lesson_request.pk).status, 'rejected')
+        self.assertEqual(TutorCapacity.objects.get(tutor=tutor).pending_count, 4)
+        
+        call_command('rebuild_tutor_capacity', stdout=StringIO())
+        self.assertEqual(TutorCapacity.objects.get(tutor=tutor).pending_count, 2)
+        self.assertEqual(TutorCapacity.objects.get(tutor=self.tutors[1]).pending_count, 2)
+        
+    def test_deleting_tutor_or_subject_removes_shard_rows(self):
+        """Silinen öğretmenin ve dersin talepleri tüm shard'lardan silinir; listeler bozulmaz"""
+        deleted = [r.pk for r in self.requests if r.tutor_id == self.tutors[1].pk]
+        self.tutors[1].delete()
+        self.assertFalse(LessonRequest.objects.using('lessons_1').exists())
+        self.assertEqual(LessonRequest.objects.using('lessons_0').count(), 3)
+        self.assertEqual(sorted(Tombstone.objects.filter(model='lesson_request').values_list(
+            'object_id', flat=True)), deleted)
+        
+        self.client.force_authenticate(user=self.student)
+        response = self.client.get(reverse('lesson-request-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 3)
+        
+        self.subject.delete()
+        self.assertFalse(LessonRequest.objects.using('lessons_0').exists())
+        
+    def test_foreign_key_constraints_only_on_default(self):
+        """Kısıtlar User/Subject tablolarının bulunduğu default'ta vardır, shard'da yoktur"""
+        def foreign_keys(alias):
+            with connections[alias].cursor() as cursor:
+                constraints = connections[alias].introspection.get_constraints(
+                    cursor, LessonRequest._meta.db_table
+                )
+            return sorted(c['columns'][0] for c in constraints.values() if c['foreign_key'])
+            
+        self.assertEqual(foreign_keys('default'), ['student_id', 'subject_id', 'tutor_id'])
+        self.assertEqual(foreign_keys('lessons_0'), [])
+        
+    def test_sync_collects_lesson_requests_across_shards(self):
+        """Senkronizasyon öğrencinin taleplerini tüm shard'lardan parça parça toplar"""
+        self.client.force_authenticate(user=self.student)
+        expected = [r.pk for r in sorted(self.requests, key=lambda r: (r.updated_at, r.pk))]
+        seen, cursor = [], None
+        with override_settings(SYNC_BATCH_SIZE=2, SYNC_SETTLE_SECONDS=0):
+            while True:
+                response = self.client.get(reverse('sync'), {'since': cursor} if cursor else {})
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                seen += [r['id'] for r in response.data['lesson_requests']]
+                cursor = response.data['cursor']
+                if not response.data['has_more']:
+                    break
+        self.assertEqual(seen, expected)
+        
+        self.requests[0].status = 'approved'
+        self.requests[0].save()
+        with override_settings(SYNC_SETTLE_SECONDS=0):
+            response = self.client.get(reverse('sync'), {'since': cursor})
+        self.assertEqual([r['id'] for r in response.data['lesson_requests']], [self.requests[0].pk])
+        self.assertEqual(response.data['lesson_requests'][0]['tutor_username'], self.tutors[0].username)
+
+
+@override_settings(LESSON_REQUEST_SHARDS=['lessons_0', 'lessons_1'])
+class ShardedIdempotencyTestCase(TransactionTestCase):
+    """
+    Shard'lı kurulumda aynı Idempotency-Key ile eşzamanlı oluşturma testleri
+
+    Talep shard'a, anahtar default'a yazıldığı için anahtar işten önce
+    alınmazsa iki tekrar denemesi de shard'a satır yazabilir.
+    """
+    databases = {'default', 'lessons_0', 'lessons_1'}
+    
+    def setUp(self):
+        self.subject = make_subject()
+        self.tutor = make_tutor(subjects=[self.subject])
+        self.student = make_student()
+        self.data = {
+            'tutor': self.tutor.pk,
+            'subject': self.subject.pk,
+            'message': 'Merhaba',
+            'preferred_date': (timezone.now() + timedelta(days=1)).isoformat(),
+        }
+        
+    def create(self, barrier, results):
+        view = LessonRequestCreateView.as_view()
+        factory = APIRequestFactory()
+        if barrier is not None:
+            barrier.wait()
+        try:
+            # Paylaşılan SQLite test veritabanında kilitlenen yazma tekrar denenir
+            for _ in range(100):
+                request = factory.post(
+                    reverse('lesson-request-create'), self.data, HTTP_IDEMPOTENCY_KEY='ayni-istek'
+                )
+                force_authenticate(request, user=self.student)
+                try:
+                    response = view(request)
+                    results.append((response.status_code, response.data))
+                    break
+                except OperationalError:
+                    time.sleep(0.005)
+        finally:
+            if barrier is not None:
+                connections.close_all()
+        
+    def test_concurrent_retries_write_one_row(self):
+        """Anahtarı alamayan eşzamanlı istek 409 alır; shard'larda tek satır oluşur"""
+        real_reserve = reserve_pending_slot
+        
+        def slow_reserve(tutor_id):
+            # İlk istek anahtarı aldıktan sonra yavaşlar; ikincisi bu sırada gelir
+            time.sleep(0.2)
+            return real_reserve(tutor_id)
+            
+        barrier = threading.Barrier(2)
+        results = []
+        with mock.patch('apiService.capacity.reserve_pending_slot', side_effect=slow_reserve):
+            threads = [threading.Thread(target=self.create, args=(barrier, results)) for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        self.assertEqual(sorted(code for code, _ in results), [201, 409])
+        rows = [
+            pk for alias in ('lessons_0', 'lessons_1')
+            for pk in LessonRequest.objects.using(alias).values_list('pk', flat=True)
+        ]
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(TutorCapacity.objects.get(tutor=self.tutor).pending_count, 1)
+        
+        # İlk istek bittikten sonraki tekrar deneme onun yanıtını alır
+        retry = []
+        self.create(None, retry)
+        self.assertEqual(retry[0], (201, {**retry[0][1], 'id': rows[0]}))
+        
+    def test_failed_request_releases_key(self):
+        """Hata veren istek anahtarı bırakır; aynı anahtarla tekrar denenebilir"""
+        results = []
+        with override_settings(TUTOR_MAX_PENDING_REQUESTS=0):
+            self.create(None, results)
+        self.assertEqual(results[0][0], status.HTTP_409_CONFLICT)
+        self.assertFalse(IdempotencyKey.objects.exists())
+        
+        self.create(None, results)
+        self.assertEqual(results[1][0], status.HTTP_201_CREATED)
+        self.assertIsNotNone(IdempotencyKey.objects.get(key='ayni-istek').response_status)
+
+
+class OpenLessonRequestTestCase(APITestCase):
+    """Açık ders talepleri ve talep alma testleri"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.subject = make_subject(name='Kimya')
+        cls.other_subject = make_subject(name='Tarih')
+        cls.student = make_student()
+        cls.tutor = make_tutor(subjects=[cls.subject], rating=4.5, grade_level=12)
+        cls.rival = make_tutor(subjects=[cls.subject], rating=4.8)
+        cls.low_rated = make_tutor(subjects=[cls.subject], rating=3.0)
+        cls.low_grade = make_tutor(subjects=[cls.subject], rating=5.0, grade_level=8)
+        cls.other_tutor = make_tutor(subjects=[cls.other_subject], rating=5.0)
+        
+    def create_open_request(self):
+        self.client.force_authenticate(user=self.student)
+        response = self.client.post(reverse('open-lesson-request-create'), {
+            'subject': self.subject.pk,
+            'grade_level': 11,
+            'min_rating': 4.0,
+            'message': 'Organik kimya',
+            'preferred_date': (timezone.now() + timedelta(days=1)).isoformat(),
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data
+        
+    def open_ids(self, tutor):
+        self.client.force_authenticate(user=tutor)
+        return [r['id'] for r in self.client.get(reverse('open-lesson-request-list')).data['results']]
+        
+    def test_open_request_visible_to_matching_tutors_only(self):
+        """Açık talep yalnızca ders, sınıf ve puan kriterine uyan öğretmenlere görünür"""
+        data = self.create_open_request()
+        self.assertIsNone(data['tutor'])
+        self.assertIsNone(data['tutor_username'])
+        
+        self.assertEqual(self.open_ids(self.tutor), [data['id']])
+        self.assertEqual(self.open_ids(self.rival), [data['id']])
+        for tutor in (self.low_rated, self.low_grade, self.other_tutor):
+            self.assertEqual(self.open_ids(tutor), [])
+            
+    def test_first_claim_wins(self):
+        """Talebi ilk alan öğretmen kazanır; talep artık açık listede görünmez"""
+        data = self.create_open_request()
+        url = reverse('lesson-request-claim', args=[data['id']])
+        
+        self.client.force_authenticate(user=self.tutor)
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['tutor'], self.tutor.pk)
+        self.assertEqual(response.data['status'], 'approved')
+        
+        self.client.force_authenticate(user=self.rival)
+        self.assertEqual(self.client.post(url).status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.open_ids(self.rival), [])
+        
+        # Puan kriterine uymayan öğretmen talebi alamaz
+        data = self.create_open_request()
+        self.client.force_authenticate(user=self.low_rated)
+        response = self.client.post(reverse('lesson-request-claim', args=[data['id']]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class OpenLessonRequestClaimStressTestCase(TransactionTestCase):
+    """
+    Aynı açık talebi çok sayıda öğretmen aynı anda almaya çalışır; yalnızca
+    biri kazanmalıdır
+    """
+    
+    CLAIMERS = 12
+    
+    def setUp(self):
+        self.subject = make_subject()
+        self.tutors = [make_tutor(subjects=[self.subject], rating=5.0) for _ in range(self.CLAIMERS)]
+        self.lesson_request = LessonRequest.objects.create(
+            student=make_student(), subject=self.subject, message='Açık talep',
+            preferred_date=timezone.now() + timedelta(days=1)
+        )
+        
+    def claim(self, tutor, barrier, results):
+        view = LessonRequestClaimView.as_view()
+        factory = APIRequestFactory()
+        barrier.wait()
+        try:
+            # Paylaşılan SQLite test veritabanında kilitlenen yazma tekrar denenir
+            for _ in range(100):
+                request = factory.post(reverse('lesson-request-claim', args=[self.lesson_request.pk]))
+                force_authenticate(request, user=tutor)
+                try:
+                    results.append((tutor.pk, view(request, pk=self.lesson_request.pk).status_code))
+                    break
+                except OperationalError:
+                    time.sleep(0.005)
+        finally:
+            connection.close()
+        
+    def test_exactly_one_claimer_wins(self):
+        barrier = threading.Barrier(self.CLAIMERS)
+        results = []
+        threads = [
+            threading.Thread(target=self.claim, args=(tutor, barrier, results))
+            for tutor in self.tutors
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(len(results), self.CLAIMERS)
+        winners = [tutor_id for tutor_id, code in results if code == status.HTTP_200_OK]
+        self.assertEqual(len(winners), 1)
+        self.assertTrue(all(
+            code in (status.HTTP_404_NOT_FOUND, status.HTTP_409_CONFLICT)
+            for _, code in results if code != status.HTTP_200_OK
+        ))
+        self.lesson_request.refresh_from_db()
+        self.assertEqual(self.lesson_request.tutor_id, winners[0])
+        self.assertEqual(TutorWeeklyLoad.objects.filter(booked_hours__gt=0).count(), 1)
+
+
+class AutocompleteTestCase(APITestCase):
+    """Bellek içi önek araması testleri"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.tutor = make_tutor(username='ismail_hoca', first_name='İsmail', last_name='Işık')
+        cls.subject = make_subject(name='İngilizce Dil Bilgisi')
+        make_student(username='ismail_ogrenci')
+        
+    def setUp(self):
+        prefix_index.reset()
+        
+    def search(self, query):
+        response = self.client.get(reverse('autocomplete'), {'q': query})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [(item['type'], item['id']) for item in response.data['results']]
+        
+    def test_turkish_case_folding(self):
+        """İ/i ve I/ı Türkçe kurallarıyla eşleşir; öğrenciler aranmaz"""
+        self.assertEqual(fold('  İSMAİL  IŞIK '), 'ismail ışık')
+        self.assertEqual(self.search('is'), [('tutor', self.tutor.pk)])
+        self.assertEqual(self.search('IŞI'), [('tutor', self.tutor.pk)])
+        self.assertEqual(self.search('isi'), [])
+        self.assertEqual(self.search('bilg'), [('subject', self.subject.pk)])
+        
+    def test_search_does_not_query_after_build(self):
+        """Dizin kurulduktan sonra arama veritabanına gitmez"""
+        self.search('i')
+        with self.assertNumQueries(0):
+            self.assertEqual(len(self.search('i')), 2)
+            
+    def test_signals_update_index(self):
+        """Kayıt ve silme işlemleri commit sonrası dizine yansır"""
+        self.search('x')
+        with self.captureOnCommitCallbacks(execute=True):
+            subject = make_subject(name='Kimya')
+            self.tutor.last_name = 'Kaya'
+            self.tutor.save()
+        self.assertEqual(self.search('kim'), [('subject', subject.pk)])
+        self.assertEqual(self.search('kaya'), [('tutor', self.tutor.pk)])
+        self.assertEqual(self.search('ışık'), [])
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            subject.delete()
+        self.assertEqual(self.search('kim'), [])
+        
+    def test_stale_index_rebuilt_once_while_old_one_is_served(self):
+        """Süresi dolan dizini tek istek kurar; diğerleri beklemeden eski dizinden okur"""
+        self.search('i')
+        started, release = threading.Event(), threading.Event()
+        
+        def slow_build():
+            started.set()
+            release.wait(5)
+            prefix_index.built_at = time.monotonic()
+            
+        with override_settings(AUTOCOMPLETE_REBUILD_SECONDS=0), \
+                mock.patch.object(prefix_index, 'build', side_effect=slow_build) as build:
+            rebuild = threading.Thread(target=prefix_index.ensure_built)
+            rebuild.start()
+            self.assertTrue(started.wait(5))
+            with self.assertNumQueries(0):
+                self.assertEqual(len(self.search('i')), 2)
+                self.assertEqual(len(self.search('i')), 2)
+            release.set()
+            rebuild.join(5)
+        self.assertEqual(build.call_count, 1)
+        
+    def test_schema_documents_results(self):
+        """Yanıt şeması tahmin edilmeden serializer'dan gelir"""
+        schema = json.loads(generate_schema()['json'])
+        operation = schema['paths']['/api/autocomplete/']['get']
+        self.assertEqual(
+            operation['responses']['200']['content']['application/json']['schema'],
+            {'$ref': '#/components/schemas/Autocomplete'},
+        )
+
+
+class ImportUsersTestCase(TestCase):
+    """import_users komutu testleri"""
+    command = 'apiService.management.commands.import_users'
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        make_student(username='mevcut')
+        # `test --parallel` worker'ları daemon olduğu için süreç havuzu sahte havuzla denenir
+        process_patch = mock.patch(f'{self.command}.current_process')
+        self.process = process_patch.start()
+        self.addCleanup(process_patch.stop)
+        self.process.return_value.daemon = False
+        
+    def write(self, name, content):
+        path = Path(self.directory.name) / name
+        path.write_text(content, encoding='utf-8')
+        return path
+        
+    def run_import(self, path, *args):
+        call_command('import_users', str(path), *args, stdout=StringIO())
+        with open(f'{path}.errors.csv', encoding='utf-8') as errors:
+            return {int(row[0]): json.loads(row[2]) for row in list(csv.reader(errors))[1:]}
+            
+    def test_csv_import_reports_invalid_rows(self):
+        """Geçerli satırlar eklenir, hatalılar satır numarasıyla raporlanır"""
+        path = self.write('users.csv', (
+            'username,email,password,first_name,last_name,role,grade_level\n'
+            'ayse,ayse@example.com,Guclu.Sifre1,Ayşe,Yılmaz,student,9\n'
+            'mehmet,mehmet@example.com,Guclu.Sifre2,Mehmet,Kaya,tutor,\n'
+            'ayse,ayse2@example.com,Guclu.Sifre3,Ayşe,Demir,student,\n'
+            'mevcut,mevcut@example.com,Guclu.Sifre4,Ali,Veli,student,\n'
+            'zayif,zayif@example.com,123,Zeynep,Ak,student,\n'
+            'rolsuz,rolsuz@example.com,Guclu.Sifre5,Can,Er,admin,\n'
+        ))
+        errors = self.run_import(path, '--workers', '1', '--batch-size', '4')
+        
+        self.assertEqual(sorted(errors), [3, 4, 5, 6])
+        self.assertIn('username', errors[3])
+        self.assertIn('password', errors[5])
+        self.assertIn('role', errors[6])
+        ayse = User.objects.get(username='ayse')
+        self.assertEqual((ayse.role, ayse.grade_level, ayse.first_name), ('student', 9, 'Ayşe'))
+        self.assertTrue(ayse.check_password('Guclu.Sifre1'))
+        self.assertIsNone(User.objects.get(username='mehmet').grade_level)
+        
+    def test_resumes_from_checkpoint(self):
+        """Checkpoint'teki satıra kadar olan kayıtlar yeniden işlenmez"""
+        path = self.write('users.ndjson', '\n'.join([
+            json.dumps({'username': 'bir', 'email': 'bir@example.com', 'password': 'Guclu.Sifre1', 'role': 'student'}),
+            '{bozuk',
+            json.dumps({'username': 'iki', 'email': 'iki@example.com', 'password': 'Guclu.Sifre2', 'role': 'tutor'}),
+        ]))
+        errors = self.run_import(path, '--workers', '1', '--batch-size', '1')
+        self.assertEqual(list(errors), [2])
+        self.assertEqual(User.objects.filter(username__in=['bir', 'iki']).count(), 2)
+        
+        with open(f'{path}.checkpoint') as checkpoint:
+            state = json.load(checkpoint)
+        self.assertEqual((state['row'], state['created'], state['failed']), (3, 2, 1))
+        
+        # Aynı dosyayla tekrar çalıştırmak hiçbir satırı yeniden işlemez
+        with self.assertNumQueries(0):
+            call_command('import_users', str(path), '--workers', '1', stdout=StringIO())
+        errors = self.run_import(path, '--workers', '1', '--restart')
+        self.assertEqual(sorted(errors), [1, 2, 3])
+        
+    def write_students(self, prefix='ogrenci', count=6):
+        return self.write(f'{prefix}.csv', 'username,email,password,role\n' + ''.join(
+            f'{prefix}{index},{prefix}{index}@example.com,Guclu.Sifre{index},student\n' for index in range(count)
+        ))
+        
+    def test_parallel_hashing(self):
+        """Şifreler havuza parça parça gönderilir ve doğrulanabilir"""
+        path = self.write_students()
+        with mock.patch(f'{self.command}.ProcessPoolExecutor') as executor_class:
+            executor = executor_class.return_value
+            executor.map.side_effect = lambda function, items, chunksize: map(function, items)
+            self.assertEqual(self.run_import(path, '--workers', '2'), {})
+        self.assertEqual(executor_class.call_args.kwargs['max_workers'], 2)
+        self.assertEqual(executor.map.call_args.kwargs['chunksize'], 1)
+        executor.shutdown.assert_called_once()
+        self.assertTrue(User.objects.get(username='ogrenci5').check_password('Guclu.Sifre5'))
+        
+    def test_hashes_in_process_without_working_pool(self):
+        """daemon süreçte havuz kurulmaz; çöken havuzda aynı süreçte devam edilir"""
+        path = self.write_students()
+        self.process.return_value.daemon = True
+        with mock.patch(f'{self.command}.ProcessPoolExecutor') as executor_class:
+            self.assertEqual(self.run_import(path, '--workers', '2'), {})
+        executor_class.assert_not_called()
+        self.assertTrue(User.objects.get(username='ogrenci0').check_password('Guclu.Sifre0'))
+        
+        self.process.return_value.daemon = False
+        path = self.write_students(prefix='kursiyer')
+        with mock.patch(f'{self.command}.ProcessPoolExecutor') as executor_class:
+            executor = executor_class.return_value
+            executor.map.side_effect = BrokenProcessPool('süreç başlatılamadı')
+            self.assertEqual(self.run_import(path, '--workers', '2', '--batch-size', '1'), {})
+        # İlk batch'teki hatadan sonra havuz bir daha kullanılmaz
+        executor.map.assert_called_once()
+        executor.shutdown.assert_called_once()
+        self.assertEqual(User.objects.filter(username__startswith='kursiyer').count(), 6)
+        self.assertTrue(User.objects.get(username='kursiyer5').check_password('Guclu.Sifre5'))
+
+
+class TutorCardTestCase(APITestCase):
+    """Öğretmen kartı okuma modeli testleri"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.math = make_subject(name='Matematik')
+        cls.physics = make_subject(name='Fizik')
+        cls.chemistry = make_subject(name='Kimya')
+        cls.tutors = [
+            make_tutor(subjects=[cls.math], experience_years=2, rating=4.8, grade_level=8, total_lessons=30),
+            make_tutor(subjects=[cls.math, cls.physics], experience_years=7, rating=4.2, bio='Fizik olimpiyatı', total_lessons=5),
+            make_tutor(subjects=[cls.chemistry], experience_years=12, rating=3.9, total_lessons=12),
+            make_tutor(rating=4.5, total_lessons=1),
+        ]
+        
+    def card_ids(self, **params):
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('tutor-card-list'), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [card['id'] for card in response.data['results']]
+        
+    def test_filters_match_tutor_list(self):
+        """Kart listesi kullanıcı tablosundan okunan /tutors/ ile aynı öğretmenleri aynı sırayla döner"""
+        queries = [
+            {},
+            {'subjects': f'{self.math.pk}'},
+            {'subjects': f'{self.math.pk},{self.chemistry.pk}'},
+            {'subjects': f'{self.math.pk},{self.physics.pk}', 'subject_match': 'all'},
+            {'min_experience': 5},
+            {'subjects': f'{self.math.pk}', 'min_experience': 5},
+            {'grade_level': 10, 'min_rating': 4},
+            {'search': 'olimpiyat'},
+            {'ordering': 'total_lessons'},
+        ]
+        for params in queries:
+            with self.subTest(params=params):
+                response = self.client.get(reverse('tutor-list'), {**params, 'fields': 'id'})
+                expected = [tutor['id'] for tutor in response.data['results']]
+                self.assertEqual(self.card_ids(**params), expected)
+                
+    def test_tutor_list_is_served_from_cards(self):
+        """/tutors/ parametresiz istekte kart tablolarından aynı yanıtı döner"""
+        url = reverse('tutor-list')
+        params = {'subjects': f'{self.math.pk},{self.physics.pk}', 'min_experience': 1}
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+        # count + liste sorgusu; ders filtresi LIKE yerine indeksli ders satırlarında
+        self.assertEqual(len(queries), 2)
+        for query in queries:
+            self.assertNotIn('LIKE', query['sql'])
+            self.assertNotIn('apiService_user', query['sql'])
+            self.assertNotIn('apiService_tutorsubject', query['sql'])
+        
+        ids = [tutor['id'] for tutor in response.data['results']]
+        self.assertEqual(ids, [self.tutors[0].pk, self.tutors[1].pk])
+        from_users = self.client.get(url, {'ids': ','.join(map(str, ids))})
+        self.assertEqual(response.data['results'], from_users.data)
+        
+    def test_subject_filter_uses_posting_index(self):
+        request = APIRequestFactory().get('/', {'subjects': self.math.pk})
+        queryset = TutorCardFilter(request.GET, queryset=TutorCard.objects.all()).qs
+        # SQLite benzersiz kısıtın indeksini sqlite_autoindex_* olarak adlandırır
+        self.assertRegex(queryset.explain(), r'INDEX \S+ \(subject_id=\? AND card_id=\?\)')
+        
+    def test_card_contents(self):
+        card = TutorCard.objects.get(tutor=self.tutors[1])
+        self.assertEqual(
+            set(card.subject_postings.values_list('subject_id', 'experience_years')),
+            {(self.math.pk, 7), (self.physics.pk, 7)}
+        )
+        self.assertEqual(card.max_experience, 7)
+        self.assertEqual([item['subject']['name'] for item in card.subjects], ['Fizik', 'Matematik'])
+        
+    def test_signals_keep_cards_in_sync(self):
+        """Kullanıcı, ders ve öğretmen-ders değişiklikleri commit sonrasında karta yansır"""
+        tutor = self.tutors[0]
+        with self.captureOnCommitCallbacks(execute=True):
+            tutor.rating = 3.0
+            tutor.save()
+            self.math.name = 'İleri Matematik'
+            self.math.save()
+            TutorSubject.objects.create(tutor=tutor, subject=self.chemistry, experience_years=9)
+        card = TutorCard.objects.get(tutor=tutor)
+        self.assertEqual(card.rating, 3.0)
+        self.assertEqual(card.max_experience, 9)
+        self.assertEqual({item['subject']['name'] for item in card.subjects}, {'İleri Matematik', 'Kimya'})
+        self.assertEqual(card.subject_postings.count(), 2)
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            TutorSubject.objects.filter(tutor=tutor, subject=self.chemistry).get().delete()
+        self.assertEqual(TutorCard.objects.get(tutor=tutor).max_experience, 2)
+        
+        # Girişte yalnızca last_login değişir; kart yeniden yazılmaz
+        with self.captureOnCommitCallbacks() as callbacks:
+            tutor.last_login = timezone.now()
+            tutor.save(update_fields=['last_login'])
+        self.assertEqual(callbacks, [])
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            tutor.role = 'student'
+            tutor.save()
+            self.tutors[1].delete()
+        self.assertEqual(set(TutorCard.objects.values_list('tutor_id', flat=True)),
+                         {self.tutors[2].pk, self.tutors[3].pk})
+        
+    def test_rebuild_command(self):
+        """Sinyalleri atlayan toplu güncellemeler komutla düzeltilir"""
+        User.objects.filter(pk=self.tutors[3].pk).update(rating=1.0)
+        TutorCard.objects.filter(pk=self.tutors[2].pk).delete()
+        call_command('rebuild_tutor_cards', '--batch-size', '2', stdout=StringIO())
+        self.assertEqual(TutorCard.objects.count(), 4)
+        self.assertEqual(TutorCard.objects.get(pk=self.tutors[3].pk).rating, 1.0)
+
+
+class RequestProfilingTestCase(APITestCase):
+    """X-Profile ile istek profilleme testleri"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = make_student(is_staff=True)
+        cls.student = make_student()
+        make_tutor(subjects=[make_subject()])
+        
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        override = override_settings(PROFILING={'DIRECTORY': self.directory})
+        override.enable()
+        self.addCleanup(override.disable)
+        
+    def get_tutors(self, user=None, **headers):
+        if user is not None:
+            headers['HTTP_AUTHORIZATION'] = f'Bearer {AccessToken.for_user(user)}'
+        return self.client.get(reverse('tutor-list'), **headers)
+        
+    def test_staff_request_is_profiled(self):
+        response = self.get_tutors(self.staff, HTTP_X_PROFILE='1')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        profile_id = response['X-Profile-Id']
+        
+        with open(self.directory / f'{profile_id}.json', encoding='utf-8') as summary:
+            summary = json.load(summary)
+        self.assertEqual((summary['route'], summary['status']), ('tutor-list', 200))
+        self.assertEqual(summary['sql_count'], len(summary['sql']))
+        self.assertTrue(any('apiService_tutorcard' in query['sql'] for query in summary['sql']))
+        stats = pstats.Stats(str(self.directory / f'{profile_id}.prof'))
+        self.assertTrue(any(name == 'get' for _, _, name in stats.stats))
+        
+        output = StringIO()
+        call_command('request_profiles', stdout=output)
+        self.assertIn(profile_id, output.getvalue())
+        call_command('request_profiles', '--show', profile_id, '--top', '5', stdout=output)
+        self.assertIn('SQL', output.getvalue())
+        
+    def test_header_ignored_without_staff(self):
+        """Başlık yoksa veya kullanıcı staff değilse profil alınmaz"""
+        for response in (
+            self.get_tutors(self.staff),
+            self.get_tutors(self.student, HTTP_X_PROFILE='1'),
+            self.get_tutors(HTTP_X_PROFILE='1'),
+        ):
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertFalse(response.has_header('X-Profile-Id'))
+        self.assertEqual(list(self.directory.iterdir()), [])
+        
+    def test_prune(self):
+        profile_ids = [self.get_tutors(self.staff, HTTP_X_PROFILE='1')['X-Profile-Id'] for _ in range(3)]
+        call_command('request_profiles', '--keep', '1', stdout=StringIO())
+        remaining = sorted(path.name for path in self.directory.iterdir())
+        self.assertEqual(len(remaining), 2)
+        self.assertIn(f'{profile_ids[-1]}.prof', remaining)
+        
+        call_command('request_profiles', '--older-than-days', '0', stdout=StringIO())
+        self.assertEqual(list(self.directory.iterdir()), [])
+
+
+class SoakTestCommandTestCase(TestCase):
+    """soak_test komutu testleri"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        subject = make_subject(name='Matematik')
+        tutor = make_tutor(subjects=[subject], first_name='Ayşe')
+        student = make_student()
+        make_lesson_request(student, tutor, subject)
+        
+    def setUp(self):
+        prefix_index.reset()
+        
+    def soak(self, *args):
+        output = StringIO()
+        call_command(
+            'soak_test', '--iterations', '40', '--warmup', '10', '--snapshot-every', '20',
+            *args, stdout=output
+        )
+        return output.getvalue()
+        
+    def test_reports_growth_and_streaming_peaks(self):
+        output = self.soak('--threshold-kb', '100000')
+        self.assertIn('lesson-requests-tutor: 200:', output)
+        self.assertIn('tutors (1 satır', output)
+        self.assertIn('lesson_requests (1 satır', output)
+        self.assertNotIn(': 500', output)
+        
+    def test_fails_when_growth_exceeds_threshold(self):
+        leaked = []
+        search = prefix_index.search
+        
+        def leaky_search(*args, **kwargs):
+            leaked.append(bytearray(256 * 1024))
+            return search(*args, **kwargs)
+            
+        with mock.patch.object(prefix_index, 'search', side_effect=leaky_search):
+            with self.assertRaisesMessage(CommandError, 'Net bellek artışı'):
+                self.soak('--threshold-kb', '128', '--skip-streaming')
+        self.assertTrue(leaked)
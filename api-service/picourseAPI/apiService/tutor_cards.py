@@ -0,0 +1,112 @@
+"""
+TutorCard okuma modelinin güncellenmesi
+
+Kaynak tablolar (User, TutorSubject, Subject) değiştiğinde ilgili
+öğretmenlerin kartı commit sonrasında kaynak tablolardan yeniden
+hesaplanıp tek bir upsert ile yazılır; kartın ders satırları
+(TutorCardSubject) aynı işlemde silinip yeniden eklenir. Hesaplama her
+seferinde baştan yapıldığından sinyallerin sırası önemli değildir. Öğretmen olmayan veya
+silinmiş kullanıcıların kartları silinir.
+
+Sinyalleri atlayan toplu işlemlerden (bulk_create, update()) sonra
+`python manage.py rebuild_tutor_cards` ile tüm kartlar yeniden kurulur.
+"""
+from django.db import transaction
+from django.db.models import Prefetch
+
+from .models import TutorCard, TutorCardSubject, TutorSubject, User
+from .serializers import TutorSubjectSerializer
+
+CARD_FIELDS = [
+    'username', 'first_name', 'last_name', 'bio', 'grade_level', 'rating',
+    'total_lessons', 'date_joined', 'subjects', 'max_experience',
+]
+
+# Bu alanlardan biri değişmeyen kayıtlar (ör. girişte last_login) kartı etkilemez
+CARD_USER_FIELDS = {
+    'username', 'first_name', 'last_name', 'bio', 'grade_level', 'rating',
+    'total_lessons', 'date_joined', 'role',
+}
+
+
+def build_card(user):
+    """
+    Öğretmenin kartı; tutor_subjects (subject ile) önceden yüklenmiş olmalı
+
+    Dersler /tutors/ yanıtındaki biçimde (TutorSubjectSerializer) saklanır.
+    """
+    postings = sorted(user.tutor_subjects.all(), key=lambda posting: posting.subject.name)
+    return TutorCard(
+        tutor_id=user.pk,
+        username=user.username,
+        first_name=user.first_name,
+        last_name=user.last_name,
+        bio=user.bio,
+        grade_level=user.grade_level,
+        rating=user.rating,
+        total_lessons=user.total_lessons,
+        date_joined=user.date_joined,
+        subjects=TutorSubjectSerializer(postings, many=True).data,
+        max_experience=max((posting.experience_years for posting in postings), default=0),
+    )
+
+
+def build_card_subjects(user):
+    # Kartın ders filtresinde kullanılan (subject, card) satırları
+    return [
+        TutorCardSubject(card_id=user.pk, subject_id=posting.subject_id, experience_years=posting.experience_years)
+        for posting in user.tutor_subjects.all()
+    ]
+
+
+def tutors_with_subjects():
+    return User.objects.filter(role='tutor').prefetch_related(
+        Prefetch('tutor_subjects', queryset=TutorSubject.objects.select_related('subject'))
+    )
+
+
+def refresh_tutor_cards(tutor_ids):
+    """
+    Verilen kullanıcıların kartlarını kaynak tablolardan yeniden yazar
+    """
+    tutor_ids = set(tutor_ids)
+    if not tutor_ids:
+        return
+    tutors = list(tutors_with_subjects().filter(pk__in=tutor_ids))
+    with transaction.atomic():
+        TutorCard.objects.filter(tutor_id__in=tutor_ids - {tutor.pk for tutor in tutors}).delete()
+        TutorCard.objects.bulk_create(
+            [build_card(tutor) for tutor in tutors],
+            update_conflicts=True, unique_fields=['tutor'], update_fields=CARD_FIELDS,
+        )
+        TutorCardSubject.objects.filter(card_id__in=tutor_ids).delete()
+        TutorCardSubject.objects.bulk_create(
+            [posting for tutor in tutors for posting in build_card_subjects(tutor)]
+        )
+
+
+def schedule_refresh(tutor_ids):
+    """
+    Kartları commit sonrasında yeniler; geri alınan değişiklikler karta yansımaz
+    """
+    tutor_ids = set(tutor_ids)
+    transaction.on_commit(lambda: refresh_tutor_cards(tutor_ids))
+
+
+def rebuild_tutor_cards(batch_size=500):
+    """
+    Tüm kartları yeniden kurar; öğretmen olmayanların kartlarını siler
+    """
+    TutorCard.objects.exclude(tutor__role='tutor').delete()
+    rebuilt, last_pk = 0, 0
+    while True:
+        tutor_ids = list(
+            User.objects.filter(role='tutor', pk__gt=last_pk)
+            .order_by('pk')
+            .values_list('pk', flat=True)[:batch_size]
+        )
+        if not tutor_ids:
+            return rebuilt
+        refresh_tutor_cards(tutor_ids)
+        rebuilt += len(tutor_ids)
+        last_pk = tutor_ids[-1]
@@ -12,12 +12,23 @@ urlpatterns = [
     # Subject endpoints
     path('subjects/', views.SubjectListView.as_view(), name='subject-list'),
     
+    # Yazarken arama (öğretmen ve ders adları)
+    path('autocomplete/', views.autocomplete, name='autocomplete'),
+    
     # Tutor endpoints
     path('tutors/', views.TutorListView.as_view(), name='tutor-list'),
+    path('tutors/cards/', views.TutorCardListView.as_view(), name='tutor-card-list'),
     path('tutors/<int:pk>/', views.TutorDetailView.as_view(), name='tutor-detail'),
+    path('tutors/<int:pk>/page/', views.TutorPageView.as_view(), name='tutor-page'),
     
     # Lesson request endpoints
     path('lesson-requests/', views.LessonRequestListView.as_view(), name='lesson-request-list'),
     path('lesson-requests/create/', views.LessonRequestCreateView.as_view(), name='lesson-request-create'),
     path('lesson-requests/<int:pk>/', views.LessonRequestUpdateView.as_view(), name='lesson-request-update'),
+    path('lesson-requests/open/', views.OpenLessonRequestListView.as_view(), name='open-lesson-request-list'),
+    path('lesson-requests/open/create/', views.OpenLessonRequestCreateView.as_view(), name='open-lesson-request-create'),
+    path('lesson-requests/<int:pk>/claim/', views.LessonRequestClaimView.as_view(), name='lesson-request-claim'),
+    
+    # Offline-first istemciler için delta senkronizasyonu
+    path('sync/', views.SyncView.as_view(), name='sync'),
 ]
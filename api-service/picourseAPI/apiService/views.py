@@ -1,20 +1,187 @@
 from rest_framework import generics, status, permissions, filters
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
+from django.conf import settings
 from django.contrib.auth import authenticate
+from django.db.models import (
+    F, FilteredRelation, OuterRef, Prefetch, Q, Subquery, prefetch_related_objects
+)
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
 
-from .models import User, Subject, LessonRequest
+from .models import User, Subject, TutorSubject, TutorCard, LessonRequest, ArchivedLessonRequest
 from .serializers import (
     UserRegistrationSerializer, UserLoginSerializer, UserProfileSerializer,
-    UserUpdateSerializer, SubjectSerializer, TutorListSerializer, 
-    TutorDetailSerializer, LessonRequestCreateSerializer, 
-    LessonRequestSerializer, LessonRequestUpdateSerializer
+    UserUpdateSerializer, SubjectSerializer, TutorListSerializer, TutorListCardSerializer,
+    TutorCardSerializer, TutorDetailSerializer, TutorPageSerializer, LessonRequestCreateSerializer, 
+    LessonRequestSerializer, LessonRequestUpdateSerializer, OpenLessonRequestCreateSerializer,
+    SyncSerializer, AutocompleteSerializer
+)
+from .permissions import (
+    IsStudentOrReadOnly, IsTutorOrReadOnly, IsOwnerOrTutorForLessonRequest, IsOwner, request_role
 )
-from .permissions import IsStudentOrReadOnly, IsOwnerOrTutorForLessonRequest, IsOwner
+from .filters import TutorCardFilter, TutorFilter
+from .concurrency import idempotent_create, make_version_etag, parse_version_etag
+from .capacity import CapacityExceeded, apply_status_change, create_pending_request
+from .sync import DELETED_KEYS, ExpiredCursor, InvalidCursor, collect_changes, decode_cursor
+from .sharding import ShardedQuery, shard_for_tutor, sharding_enabled
+from .open_requests import claim_open_request, matching_open_requests
+from .autocomplete import MAX_RESULTS as AUTOCOMPLETE_MAX_RESULTS, prefix_index
+
+
+def tutor_subjects_prefetch(expanded):
+    """
+    Öğretmen derslerini tek sorguda (Subject JOIN ile) ön yükler
+
+    Dersler karttaki gibi ada göre sıralanır.
+    """
+    queryset = TutorSubject.objects.select_related('subject').order_by('subject__name')
+    if not expanded:
+        queryset = queryset.only('tutor', 'subject', 'experience_years', 'subject__name')
+    return Prefetch('tutor_subjects', queryset=queryset)
+
+
+# Serializer alanı -> ihtiyaç duyduğu model alanları (.only() için)
+TUTOR_FIELD_SOURCES = {
+    'id': ('id',),
+    'username': ('username',),
+    'first_name': ('first_name',),
+    'last_name': ('last_name',),
+    'email': ('email',),
+    'role': ('role',),
+    'role_display': ('role',),
+    'bio': ('bio',),
+    'grade_level': ('grade_level',),
+    'grade_level_display': ('grade_level',),
+    'rating': ('rating',),
+    'total_lessons': ('total_lessons',),
+    'date_joined': ('date_joined',),
+    'subjects': (),
+}
+
+LESSON_REQUEST_FIELD_SOURCES = {
+    'id': ('id',),
+    'student': ('student',),
+    'student_name': ('student', 'student__first_name', 'student__last_name'),
+    'student_username': ('student', 'student__username'),
+    'tutor': ('tutor',),
+    'tutor_name': ('tutor', 'tutor__first_name', 'tutor__last_name'),
+    'tutor_username': ('tutor', 'tutor__username'),
+    'subject': ('subject',),
+    'subject_name': ('subject', 'subject__name'),
+    'status': ('status',),
+    'status_display': ('status',),
+    'message': ('message',),
+    'preferred_date': ('preferred_date',),
+    'duration_hours': ('duration_hours',),
+    'grade_level': ('grade_level',),
+    'min_rating': ('min_rating',),
+    'created_at': ('created_at',),
+    'updated_at': ('updated_at',),
+}
+
+
+class SparseFieldsetViewMixin:
+    """
+    ?fields= ve ?expand= parametreleriyle hem yanıtı hem de SQL sorgusunu
+    istenen alanlara daraltır
+    """
+    sparse_field_sources = {}
+    sparse_prefetches = {}
+    
+    def _split_param(self, name):
+        value = self.request.query_params.get(name)
+        if value is None:
+            return None
+        return [item.strip() for item in value.split(',') if item.strip()]
+    
+    def get_requested_fields(self):
+        return self._split_param('fields')
+    
+    def get_expanded_fields(self):
+        return self._split_param('expand') or []
+    
+    def get_serializer(self, *args, **kwargs):
+        fields = self.get_requested_fields()
+        if fields is not None:
+            kwargs.setdefault('fields', fields)
+            kwargs.setdefault('expand', self.get_expanded_fields())
+        return super().get_serializer(*args, **kwargs)
+    
+    def narrow_queryset(self, queryset):
+        requested = self.get_requested_fields()
+        names = self.sparse_field_sources if requested is None else requested
+        # Alan listesi verilmediğinde iç içe alanlar tam gösterilir
+        expanded = None if requested is None else set(self.get_expanded_fields())
+        
+        columns = {queryset.model._meta.pk.name}
+        for name in names:
+            columns.update(self.sparse_field_sources.get(name, ()))
+        
+        related = sorted({column.split('__')[0] for column in columns if '__' in column})
+        if related:
+            queryset = queryset.select_related(*related)
+        for name, prefetch in self.sparse_prefetches.items():
+            if name in names:
+                queryset = queryset.prefetch_related(prefetch(expanded is None or name in expanded))
+        if requested is not None:
+            queryset = queryset.only(*columns)
+        return queryset
+
+
+class BatchLookupMixin:
+    """
+    ?ids=1,2,3 ile kayıtları tek IN sorgusunda toplu getirir
+
+    Toplu modda sayfalama (ve COUNT sorgusu) yapılmaz, sonuçlar istenen id
+    sırasıyla düz liste olarak döner. Kullanıcının göremediği ya da var
+    olmayan id'ler hata vermeden atlanır; yetki kontrolü get_queryset'teki
+    satır bazlı kısıtlamayla yapılır.
+    """
+    def get_batch_ids(self):
+        try:
+            return self._batch_ids
+        except AttributeError:
+            pass
+        
+        value = self.request.query_params.get('ids')
+        ids = None
+        if value is not None:
+            try:
+                ids = list(dict.fromkeys(int(item) for item in value.split(',') if item.strip()))
+            except ValueError:
+                raise ValidationError({'ids': ['Virgülle ayrılmış sayısal id listesi bekleniyor.']}) from None
+            limit = settings.BATCH_LOOKUP_MAX_IDS
+            if len(ids) > limit:
+                raise ValidationError({'ids': [f'Tek istekte en fazla {limit} id istenebilir.']})
+        self._batch_ids = ids
+        return ids
+    
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        ids = self.get_batch_ids()
+        if ids is not None:
+            queryset = queryset.filter(pk__in=ids)
+        return queryset
+    
+    def load_batch(self, rows):
+        """
+        Toplu sonuçlar için ek ilişki yükleme kancası
+        """
+        return rows
+    
+    def list(self, request, *args, **kwargs):
+        ids = self.get_batch_ids()
+        if ids is None:
+            return super().list(request, *args, **kwargs)
+        
+        position = {pk: index for index, pk in enumerate(ids)}
+        rows = sorted(self.filter_queryset(self.get_queryset()), key=lambda row: position[row.pk])
+        serializer = self.get_serializer(self.load_batch(rows), many=True)
+        return Response(serializer.data)
 
 
 @extend_schema(
@@ -67,6 +234,28 @@ def login(request):
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+@extend_schema(
+    summary="Otomatik Tamamlama",
+    description="Öğretmen adı/kullanıcı adı ve ders adında önek araması (Türkçe büyük/küçük harf duyarsız)",
+    parameters=[
+        OpenApiParameter('q', OpenApiTypes.STR, description='Aranan önek'),
+        OpenApiParameter('limit', OpenApiTypes.INT, description=f'En fazla sonuç (varsayılan 10, üst sınır {AUTOCOMPLETE_MAX_RESULTS})'),
+    ],
+    responses=AutocompleteSerializer,
+)
+@api_view(['GET'])
+@permission_classes([permissions.AllowAny])
+def autocomplete(request):
+    """
+    Yazarken arama: sonuçlar süreç içi önek dizininden, sorgusuz döner
+    """
+    try:
+        limit = min(max(int(request.query_params.get('limit', 10)), 1), AUTOCOMPLETE_MAX_RESULTS)
+    except ValueError:
+        limit = 10
+    return Response({'results': prefix_index.search(request.query_params.get('q', ''), limit)})
+
+
 class UserProfileView(generics.RetrieveUpdateAPIView):
     """
     Kullanıcı profil görüntüleme ve güncelleme
@@ -92,40 +281,114 @@ class SubjectListView(generics.ListAPIView):
     permission_classes = [permissions.AllowAny]
 
 
-class TutorListView(generics.ListAPIView):
+# Öğretmen listesi ve öğretmen kartları için ortak filtre parametreleri
+TUTOR_FILTER_PARAMETERS = [
+    OpenApiParameter(
+        name='subjects',
+        type=OpenApiTypes.STR,
+        location=OpenApiParameter.QUERY,
+        description='Virgülle ayrılmış ders ID listesi ile filtreleme (ör. 1,2)'
+    ),
+    OpenApiParameter(
+        name='subject_match',
+        type=OpenApiTypes.STR,
+        location=OpenApiParameter.QUERY,
+        description='any: derslerden herhangi biri, all: derslerin tümü',
+        enum=['any', 'all']
+    ),
+    OpenApiParameter(
+        name='min_experience',
+        type=OpenApiTypes.INT,
+        location=OpenApiParameter.QUERY,
+        description='Minimum deneyim yılı'
+    ),
+    OpenApiParameter(
+        name='min_rating',
+        type=OpenApiTypes.FLOAT,
+        location=OpenApiParameter.QUERY,
+        description='Minimum puan'
+    ),
+    OpenApiParameter(
+        name='max_rating',
+        type=OpenApiTypes.FLOAT,
+        location=OpenApiParameter.QUERY,
+        description='Maksimum puan'
+    ),
+    OpenApiParameter(
+        name='grade_level',
+        type=OpenApiTypes.INT,
+        location=OpenApiParameter.QUERY,
+        description='Öğrencinin sınıf seviyesine uygun öğretmenler'
+    ),
+    OpenApiParameter(
+        name='search',
+        type=OpenApiTypes.STR,
+        location=OpenApiParameter.QUERY,
+        description='Öğretmen adı, soyadı veya biyografide arama'
+    ),
+    OpenApiParameter(
+        name='ordering',
+        type=OpenApiTypes.STR,
+        location=OpenApiParameter.QUERY,
+        description='Sıralama: rating, -rating, total_lessons, -total_lessons'
+    ),
+]
+
+
+class TutorListView(BatchLookupMixin, SparseFieldsetViewMixin, generics.ListAPIView):
     """
     Öğretmen listesi - filtreleme ve arama destekli
+    
+    ?fields=, ?expand= ve ?ids= verilmediğinde liste aynı yanıt biçimiyle
+    TutorCard tablolarından JOIN ve prefetch olmadan okunur.
     """
     serializer_class = TutorListSerializer
+    sparse_field_sources = TUTOR_FIELD_SOURCES
+    sparse_prefetches = {'subjects': tutor_subjects_prefetch}
     permission_classes = [permissions.AllowAny]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['tutor_subjects__subject']
     search_fields = ['username', 'first_name', 'last_name', 'bio']
     ordering_fields = ['rating', 'total_lessons', 'date_joined']
     ordering = ['-rating']
     
+    def serves_cards(self):
+        # Şema üretimi kullanıcı tablosuna dayalı serializer ile yapılır
+        if getattr(self, 'swagger_fake_view', False):
+            return False
+        params = self.request.query_params
+        return not any(name in params for name in ('fields', 'expand', 'ids'))
+    
+    @property
+    def filterset_class(self):
+        return TutorCardFilter if self.serves_cards() else TutorFilter
+    
+    def get_serializer_class(self):
+        return TutorListCardSerializer if self.serves_cards() else TutorListSerializer
+    
     def get_queryset(self):
-        return User.objects.filter(role='tutor').prefetch_related('tutor_subjects__subject')
+        if self.serves_cards():
+            return TutorCard.objects.all()
+        return self.narrow_queryset(User.objects.filter(role='tutor'))
     
     @extend_schema(
-        parameters=[
+        parameters=TUTOR_FILTER_PARAMETERS + [
             OpenApiParameter(
-                name='subject',
-                type=OpenApiTypes.INT,
+                name='fields',
+                type=OpenApiTypes.STR,
                 location=OpenApiParameter.QUERY,
-                description='Ders konusu ID ile filtreleme'
+                description='Virgülle ayrılmış alan listesi (ör. id,first_name,rating,subjects)'
             ),
             OpenApiParameter(
-                name='search',
+                name='expand',
                 type=OpenApiTypes.STR,
                 location=OpenApiParameter.QUERY,
-                description='Öğretmen adı, soyadı veya biyografide arama'
+                description='fields ile birlikte tam gösterilecek iç içe alanlar (ör. subjects)'
             ),
             OpenApiParameter(
-                name='ordering',
+                name='ids',
                 type=OpenApiTypes.STR,
                 location=OpenApiParameter.QUERY,
-                description='Sıralama: rating, -rating, total_lessons, -total_lessons'
+                description='Virgülle ayrılmış öğretmen ID listesi; sayfalamasız toplu getirme'
             ),
         ]
     )
@@ -133,20 +396,117 @@ class TutorListView(generics.ListAPIView):
         return super().get(request, *args, **kwargs)
 
 
-class TutorDetailView(generics.RetrieveAPIView):
+class TutorCardListView(generics.ListAPIView):
+    """
+    Öğretmen listesi, denormalize öğretmen kartlarından
+    
+    /tutors/ ile aynı filtre, arama ve sıralamayı destekler; yanıt
+    TutorCard tablosundan JOIN ve prefetch olmadan tek sorguyla gelir.
+    Kartlar sinyallerle commit sonrasında güncellenir.
+    """
+    serializer_class = TutorCardSerializer
+    permission_classes = [permissions.AllowAny]
+    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filterset_class = TutorCardFilter
+    search_fields = ['username', 'first_name', 'last_name', 'bio']
+    ordering_fields = ['rating', 'total_lessons', 'date_joined']
+    ordering = ['-rating', 'tutor']
+    queryset = TutorCard.objects.all()
+    
+    @extend_schema(parameters=TUTOR_FILTER_PARAMETERS)
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+
+class TutorDetailView(SparseFieldsetViewMixin, generics.RetrieveAPIView):
     """
     Öğretmen detay bilgileri
     """
     serializer_class = TutorDetailSerializer
     permission_classes = [permissions.AllowAny]
+    sparse_field_sources = TUTOR_FIELD_SOURCES
+    sparse_prefetches = {'subjects': tutor_subjects_prefetch}
+    
+    def get_queryset(self):
+        return self.narrow_queryset(User.objects.filter(role='tutor'))
+
+
+class TutorPageView(generics.GenericAPIView):
+    """
+    Öğretmen sayfası: öğretmen detayı, ders listesi ve kullanıcının bu
+    öğretmenle son talebi tek istekte
+    
+    Mobil uygulama üç ayrı istek yerine bunu kullanır. Veriler iki SQL
+    sorgusuyla gelir: kullanıcının son talebi öğretmen sorgusuna subquery
+    olarak eklenir, öğretmenin dersleri ise ders listesi sorgusunda
+    LEFT JOIN ile işaretlenir.
+    """
+    serializer_class = TutorPageSerializer
+    permission_classes = [permissions.AllowAny]
     
     def get_queryset(self):
-        return User.objects.filter(role='tutor').prefetch_related('tutor_subjects__subject')
+        queryset = User.objects.filter(role='tutor')
+        user = self.request.user
+        if not user.is_authenticated or sharding_enabled():
+            return queryset
+        
+        latest_request = LessonRequest.objects.filter(
+            tutor_id=OuterRef('pk'), student_id=user.pk
+        ).order_by('-created_at')
+        return queryset.annotate(
+            latest_request_id=Subquery(latest_request.values('id')[:1]),
+            latest_request_status=Subquery(latest_request.values('status')[:1]),
+        )
+    
+    def get_subjects(self, tutor):
+        """
+        Tüm dersler; öğretmenin verdiği dersler deneyim yılıyla işaretlenir
+        """
+        return Subject.objects.annotate(
+            tutor_link=FilteredRelation('tutorsubject', condition=Q(tutorsubject__tutor_id=tutor.pk)),
+            tutor_experience=F('tutor_link__experience_years'),
+        )
+    
+    @extend_schema(
+        summary="Öğretmen Sayfası",
+        description="Öğretmen detayı, ders listesi ve kullanıcının bu öğretmene son talebi",
+    )
+    def get(self, request, *args, **kwargs):
+        tutor = self.get_object()
+        subjects = list(self.get_subjects(tutor))
+        
+        # Öğretmenin dersleri ayrı bir prefetch sorgusu yerine ders listesinden alınır
+        tutor_subjects = [
+            {'subject': subject, 'experience_years': subject.tutor_experience}
+            for subject in subjects
+            if subject.tutor_experience is not None
+        ]
+        
+        lesson_request = None
+        if sharding_enabled() and request.user.is_authenticated:
+            # Talepler başka veritabanında; subquery yerine öğretmenin shard'ına tek sorgu
+            lesson_request = LessonRequest.objects.for_tutor(tutor.pk).filter(
+                student_id=request.user.pk
+            ).only('id', 'status').first()
+        elif getattr(tutor, 'latest_request_id', None) is not None:
+            lesson_request = LessonRequest(
+                id=tutor.latest_request_id, status=tutor.latest_request_status
+            )
+        
+        serializer = self.get_serializer({
+            'tutor': tutor,
+            'subjects': subjects,
+            'lesson_request': lesson_request,
+        }, context={**self.get_serializer_context(), 'tutor_subjects': tutor_subjects})
+        return Response(serializer.data)
 
 
 class LessonRequestCreateView(generics.CreateAPIView):
     """
     Ders talebi oluşturma (sadece öğrenciler)
+    
+    Idempotency-Key başlığı gönderilirse aynı anahtarla yapılan tekrar
+    denemeleri yeni kayıt oluşturmaz, ilk yanıtı tekrar döner.
     """
     serializer_class = LessonRequestCreateSerializer
     permission_classes = [permissions.IsAuthenticated, IsStudentOrReadOnly]
@@ -155,40 +515,101 @@ class LessonRequestCreateView(generics.CreateAPIView):
         serializer.save(student=self.request.user)
     
     def create(self, request, *args, **kwargs):
-        serializer = self.get_serializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-        lesson_request = serializer.save(student=request.user)
-        return Response(
-            LessonRequestSerializer(lesson_request).data,
-            status=status.HTTP_201_CREATED
-        )
+        def perform():
+            serializer = self.get_serializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            lesson_request = create_pending_request(
+                serializer.validated_data['tutor'].pk,
+                lambda: serializer.save(student=request.user)
+            )
+            return status.HTTP_201_CREATED, LessonRequestSerializer(lesson_request).data
+        
+        try:
+            return idempotent_create(request, perform)
+        except CapacityExceeded as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_409_CONFLICT)
 
 
-class LessonRequestListView(generics.ListAPIView):
+class LessonRequestListView(BatchLookupMixin, SparseFieldsetViewMixin, generics.ListAPIView):
     """
     Ders talepleri listesi - rol bazlı filtreleme
+    
+    Varsayılan olarak yalnızca aktif tablo sorgulanır; ?include_archived=1
+    ile arşiv tablosu UNION ALL ile eklenir.
     """
     serializer_class = LessonRequestSerializer
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['status']
+    sparse_field_sources = LESSON_REQUEST_FIELD_SOURCES
     
-    def get_queryset(self):
-        user = self.request.user
+    def get_owner_lookup(self):
+        user_id = self.request.user.pk
+        user_role = request_role(self.request)
         role = self.request.query_params.get('role')
         
-        if role == 'student' and user.role == 'student':
-            return LessonRequest.objects.filter(student=user)
-        elif role == 'tutor' and user.role == 'tutor':
-            return LessonRequest.objects.filter(tutor=user)
-        else:
-            # Varsayılan: kullanıcının kendi talepleri
-            if user.role == 'student':
-                return LessonRequest.objects.filter(student=user)
-            elif user.role == 'tutor':
-                return LessonRequest.objects.filter(tutor=user)
+        if role == 'student' and user_role == 'student':
+            return {'student_id': user_id}
+        elif role == 'tutor' and user_role == 'tutor':
+            return {'tutor_id': user_id}
+        # Varsayılan: kullanıcının kendi talepleri
+        elif user_role == 'student':
+            return {'student_id': user_id}
+        elif user_role == 'tutor':
+            return {'tutor_id': user_id}
+        return None
+    
+    def include_archived(self):
+        return self.request.query_params.get('include_archived') in ('1', 'true')
+    
+    def load_related_later(self):
+        """
+        UNION alt sorgularında ve shard'larda (User/Subject başka veritabanında)
+        JOIN yapılamaz; ilişkiler sayfalamadan sonra toplu olarak yüklenir
+        """
+        return self.include_archived() or sharding_enabled()
+    
+    def get_queryset(self):
+        lookup = self.get_owner_lookup()
+        if lookup is None:
+            return LessonRequest.objects.none()
         
-        return LessonRequest.objects.none()
+        queryset = LessonRequest.objects.filter(**lookup)
+        if self.load_related_later():
+            return queryset
+        return self.narrow_queryset(queryset)
+    
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        lookup = self.get_owner_lookup()
+        if lookup is None:
+            return queryset
+        
+        archived = []
+        if self.include_archived():
+            archived.append(super().filter_queryset(
+                ArchivedLessonRequest.objects.filter(**lookup).defer('archived_at')
+            ))
+        if sharding_enabled():
+            # Öğretmen listesi tek shard'dan, öğrenci listesi tüm shard'lardan birleştirilir
+            if 'tutor_id' in lookup:
+                queryset = queryset.using(shard_for_tutor(lookup['tutor_id']))
+                return ShardedQuery([queryset] + archived, ('-created_at', '-pk')) if archived else queryset
+            return queryset.across_shards(extra=archived)
+        if not archived:
+            return queryset
+        return queryset.order_by().union(archived[0].order_by(), all=True).order_by('-created_at')
+    
+    def load_batch(self, rows):
+        if self.load_related_later():
+            prefetch_related_objects(rows, 'student', 'tutor', 'subject')
+        return rows
+    
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+        if page is not None:
+            page = self.load_batch(page)
+        return page
     
     @extend_schema(
         parameters=[
@@ -206,6 +627,24 @@ class LessonRequestListView(generics.ListAPIView):
                 description='Durum bazlı filtreleme',
                 enum=['pending', 'approved', 'rejected']
             ),
+            OpenApiParameter(
+                name='fields',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description='Virgülle ayrılmış alan listesi (ör. id,tutor_name,status)'
+            ),
+            OpenApiParameter(
+                name='include_archived',
+                type=OpenApiTypes.BOOL,
+                location=OpenApiParameter.QUERY,
+                description='1 ise arşivlenmiş (eski, sonuçlanmış) talepler de listelenir'
+            ),
+            OpenApiParameter(
+                name='ids',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description='Virgülle ayrılmış talep ID listesi; sayfalamasız toplu getirme'
+            ),
         ]
     )
     def get(self, request, *args, **kwargs):
@@ -215,25 +654,177 @@ class LessonRequestListView(generics.ListAPIView):
 class LessonRequestUpdateView(generics.UpdateAPIView):
     """
     Ders talebi durum güncelleme (sadece öğretmenler)
+    
+    Durum her zaman okunduğu değerden koşullu UPDATE ile değiştirilir ve
+    öğretmen kapasite sayaçlarıyla aynı transaction'da yazılır. If-Match
+    başlığında talebin updated_at değeri gönderilirse talep arada
+    değiştiyse 412 döner; haftalık saat sınırı doluysa 409 döner.
     """
     serializer_class = LessonRequestUpdateSerializer
     permission_classes = [permissions.IsAuthenticated, IsOwnerOrTutorForLessonRequest]
     
     def get_queryset(self):
-        return LessonRequest.objects.filter(tutor=self.request.user)
+        # Güncellemeyi yalnızca öğretmen yapabildiği için talep öğretmenin shard'ındadır
+        queryset = LessonRequest.objects.using(shard_for_tutor(self.request.user.pk))
+        return IsOwnerOrTutorForLessonRequest.scope_queryset(self.request, queryset)
     
-    def perform_update(self, serializer):
-        if self.request.user.role != 'tutor':
-            return Response(
-                {'error': 'Sadece öğretmenler ders taleplerini güncelleyebilir.'},
-                status=status.HTTP_403_FORBIDDEN
-            )
+    def update(self, request, *args, **kwargs):
+        partial = kwargs.pop('partial', False)
+        lesson_request = self.get_object()
+        serializer = self.get_serializer(lesson_request, data=request.data, partial=partial)
+        serializer.is_valid(raise_exception=True)
+        new_status = serializer.validated_data.get('status', lesson_request.status)
+        
+        version = None
+        if_match = request.headers.get('If-Match', '').strip()
+        if if_match and if_match != '*':
+            version = parse_version_etag(if_match)
+            if version is None:
+                return self.precondition_failed()
+        
+        try:
+            changed = apply_status_change(lesson_request, new_status, version)
+            # If-Match yoksa arada değişen talep güncel haliyle bir kez daha denenir
+            if not changed and version is None:
+                lesson_request.refresh_from_db()
+                changed = apply_status_change(lesson_request, new_status)
+        except CapacityExceeded as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_409_CONFLICT)
+        if not changed:
+            return self.precondition_failed()
+        
+        response = Response(serializer.data)
+        response['ETag'] = make_version_etag(lesson_request.updated_at)
+        return response
+    
+    def precondition_failed(self):
+        return Response(
+            {'error': 'Talep başka bir istek tarafından değiştirildi.'},
+            status=status.HTTP_412_PRECONDITION_FAILED
+        )
+
+
+def open_requests_unsupported():
+    # Öğretmeni olmayan talebin shard'ı belirlenemez
+    return Response(
+        {'error': 'Açık talepler shard\'lı kurulumda desteklenmiyor.'},
+        status=status.HTTP_400_BAD_REQUEST
+    )
+
+
+class OpenLessonRequestCreateView(generics.CreateAPIView):
+    """
+    Açık ders talebi oluşturma (sadece öğrenciler)
+    
+    Talep belirli bir öğretmene değil; ders, sınıf seviyesi ve en düşük
+    puan kriterine uyan tüm öğretmenlere gösterilir.
+    """
+    serializer_class = OpenLessonRequestCreateSerializer
+    permission_classes = [permissions.IsAuthenticated, IsStudentOrReadOnly]
+    
+    def create(self, request, *args, **kwargs):
+        if sharding_enabled():
+            return open_requests_unsupported()
+        
+        def perform():
+            serializer = self.get_serializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            lesson_request = serializer.save()
+            return status.HTTP_201_CREATED, LessonRequestSerializer(lesson_request).data
+        
+        return idempotent_create(request, perform)
+
+
+class OpenLessonRequestListView(generics.ListAPIView):
+    """
+    Öğretmenin alabileceği açık talepler (kriterlere uyanlar, en yeni önce)
+    """
+    serializer_class = LessonRequestSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    
+    def get_queryset(self):
+        if request_role(self.request) != 'tutor':
+            return LessonRequest.objects.none()
+        return matching_open_requests(self.request.user).select_related('student', 'subject')
+
+
+class LessonRequestClaimView(generics.GenericAPIView):
+    """
+    Açık talebi alma (sadece öğretmenler); ilk alan öğretmen kazanır
+    
+    Talep öğretmene koşullu UPDATE ile verilir ve onaylanır. Başka bir
+    öğretmen önce aldıysa 409 döner.
+    """
+    serializer_class = LessonRequestSerializer
+    permission_classes = [permissions.IsAuthenticated, IsTutorOrReadOnly]
+    
+    def get_queryset(self):
+        return matching_open_requests(self.request.user)
+    
+    @extend_schema(request=None, summary="Açık Talebi Al")
+    def post(self, request, *args, **kwargs):
+        if sharding_enabled():
+            return open_requests_unsupported()
         
         lesson_request = self.get_object()
-        if lesson_request.tutor != self.request.user:
+        try:
+            claimed = claim_open_request(lesson_request, request.user)
+        except CapacityExceeded as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_409_CONFLICT)
+        if not claimed:
+            return Response(
+                {'error': 'Talep başka bir öğretmen tarafından alındı.'},
+                status=status.HTTP_409_CONFLICT
+            )
+        return Response(self.get_serializer(lesson_request).data)
+
+
+class SyncView(generics.GenericAPIView):
+    """
+    Offline-first istemciler için delta senkronizasyonu
+    
+    İlk istek imleçsiz yapılır ve tüm veriyi parça parça döner; sonraki
+    isteklerde bir önceki yanıttaki cursor gönderilir. has_more true ise
+    istemci hemen yeni imleçle tekrar istemelidir.
+    """
+    serializer_class = SyncSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    
+    @extend_schema(
+        summary="Delta Senkronizasyonu",
+        description="İmleçten sonra değişen ve silinen kayıtlar. İmleç süresi dolduysa "
+                    "410 döner; istemci yerel verisini silip imleçsiz baştan başlamalıdır.",
+        parameters=[
+            OpenApiParameter(
+                'since', OpenApiTypes.STR,
+                description='Bir önceki senkronizasyon yanıtındaki cursor'
+            ),
+        ],
+    )
+    def get(self, request, *args, **kwargs):
+        since = request.query_params.get('since')
+        try:
+            positions = decode_cursor(since) if since else {}
+            changes, cursor, has_more = collect_changes(request.user, positions)
+        except InvalidCursor:
+            return Response({'error': 'Geçersiz senkronizasyon imleci.'}, status=status.HTTP_400_BAD_REQUEST)
+        except ExpiredCursor:
             return Response(
-                {'error': 'Bu talebi güncelleme yetkiniz yok.'},
-                status=status.HTTP_403_FORBIDDEN
+                {'error': 'Senkronizasyon imlecinin süresi doldu, tam senkronizasyon gerekli.'},
+                status=status.HTTP_410_GONE
             )
         
-        serializer.save()
+        deleted = {key: [] for key in DELETED_KEYS.values()}
+        for tombstone in changes['deleted']:
+            deleted[DELETED_KEYS[tombstone.model]].append(tombstone.object_id)
+        
+        serializer = self.get_serializer({
+            'cursor': cursor,
+            'has_more': has_more,
+            'lesson_requests': changes['lesson_requests'],
+            'subjects': changes['subjects'],
+            'tutors': changes['tutors'],
+            'tutor_subjects': changes['tutor_subjects'],
+            'deleted': deleted,
+        })
+        return Response(serializer.data)
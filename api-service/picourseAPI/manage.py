@@ -6,6 +6,9 @@ import sys
 
 def main():
     """Run administrative tasks."""
+    # Testler hızlı parola hash'i ve zamanlama raporu için ayrı ayarlarla çalışır
+    if len(sys.argv) > 1 and sys.argv[1] == 'test':
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'picourseAPI.test_settings')
     os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'picourseAPI.settings')
     try:
         from django.core.management import execute_from_command_line
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -37,8 +38,11 @@ ALLOWED_HOSTS = [
 
 # Application definition
 
+# Yalnızca API sunan worker'larda admin kapatılabilir (PICOURSE_ENABLE_ADMIN=0);
+# böylece admin modülleri açılışta yüklenmez.
+ENABLE_ADMIN = os.environ.get('PICOURSE_ENABLE_ADMIN', '1') == '1'
+
 INSTALLED_APPS = [
-    'django.contrib.admin',
     'django.contrib.auth',
     'django.contrib.contenttypes',
     'django.contrib.sessions',
@@ -50,12 +54,18 @@ INSTALLED_APPS = [
     'apiService',
 ]
 
+if ENABLE_ADMIN:
+    INSTALLED_APPS.insert(0, 'django.contrib.admin')
+
 MIDDLEWARE = [
+    'apiService.log.RequestLogMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'apiService.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'apiService.profiling.ProfilingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -90,6 +100,20 @@ DATABASES = {
     }
 }
 
+# LessonRequest shard'ları (apiService/sharding.py). PICOURSE_LESSON_REQUEST_SHARDS=N
+# ile N ayrı SQLite dosyası tanımlanır; 0 (varsayılan) ise talepler default'ta kalır.
+# Shard'lar "python manage.py migrate --database lessons_0" ile kurulur.
+LESSON_REQUEST_SHARDS = [
+    f'lessons_{index}' for index in range(int(os.environ.get('PICOURSE_LESSON_REQUEST_SHARDS', '0')))
+]
+for alias in LESSON_REQUEST_SHARDS:
+    DATABASES[alias] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / f'{alias}.sqlite3',
+    }
+
+DATABASE_ROUTERS = ['apiService.sharding.LessonRequestRouter']
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -138,7 +162,7 @@ AUTH_USER_MODEL = 'apiService.User'
 # REST Framework Configuration
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apiService.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
@@ -155,6 +179,101 @@ SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(hours=24),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
     'ROTATE_REFRESH_TOKENS': True,
+    # Döndürülen refresh token'lar iptal edilir (apiService/revocation.py)
+    'TOKEN_REFRESH_SERIALIZER': 'apiService.revocation.RevokingTokenRefreshSerializer',
+    'TOKEN_VERIFY_SERIALIZER': 'apiService.revocation.RevokingTokenVerifySerializer',
+}
+
+# Süreç başına önbelleğe alınan doğrulanmış erişim token'ı sayısı (0: kapalı)
+JWT_VERIFICATION_CACHE_SIZE = 10000
+
+# İptal edilmiş token'ların Bloom filtresi: beklenen kayıt sayısı, yanlış
+# pozitif oranı ve diğer süreçlerdeki iptalleri almak için yenileme süresi (sn)
+REVOCATION_BLOOM_CAPACITY = 100000
+REVOCATION_BLOOM_ERROR_RATE = 0.001
+REVOCATION_BLOOM_REFRESH_SECONDS = 30
+
+# Idempotency-Key ile saklanan yanıtların geçerlilik süresi ve işlenirken
+# yarıda kalan (yanıtı yazılmamış) anahtarın yeniden kullanılabileceği süre
+IDEMPOTENCY_KEY_TTL = timedelta(hours=24)
+IDEMPOTENCY_CLAIM_TIMEOUT = timedelta(seconds=30)
+
+# archive_lesson_requests: sonuçlanmış talepler bu kadar gün sonra arşivlenir
+LESSON_REQUEST_ARCHIVE_AFTER_DAYS = 90
+
+# ?ids= ile tek istekte getirilebilecek en fazla kayıt sayısı
+BATCH_LOOKUP_MAX_IDS = 100
+
+# Subject süreç önbelleğinin en uzun ömrü (sn); bu süreçteki değişiklikler
+# sinyallerle anında, diğer süreçlerdekiler en geç bu süre sonunda görünür
+SUBJECT_CACHE_TIMEOUT = 300
+
+# Otomatik tamamlama dizininin yeniden kurulma aralığı (sn); bu süreçteki
+# değişiklikler sinyallerle anında, diğer süreçlerdekiler en geç bu sürede görünür
+AUTOCOMPLETE_REBUILD_SECONDS = 600
+
+# Öğretmen kapasite sınırları (capacity.py): bekleyen talep sayısı ve
+# bir haftada onaylanabilecek toplam ders saati
+TUTOR_MAX_PENDING_REQUESTS = 20
+TUTOR_MAX_WEEKLY_HOURS = 40
+
+# Delta senkronizasyonu (sync.py): akış başına bir yanıttaki en fazla satır,
+# commit'i gecikebilecek transaction'lar için beklenen süre (sn) ve silme
+# kayıtlarının saklanma süresi (daha eski imleçler tam senkronizasyon yapar)
+SYNC_BATCH_SIZE = 500
+SYNC_SETTLE_SECONDS = 2
+SYNC_TOMBSTONE_TTL = timedelta(days=30)
+
+# Logging
+# Kayıtlar JSON olarak arka plan iş parçacığında yazılır (apiService/log.py);
+# request id (X-Request-ID) aynı istekteki tüm kayıtlara eklenir.
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'filters': {
+        'request_id': {'()': 'apiService.log.RequestIdFilter'},
+    },
+    'handlers': {
+        'json': {
+            'class': 'apiService.log.QueueJsonHandler',
+            'filters': ['request_id'],
+            'filename': os.environ.get('PICOURSE_LOG_FILE') or None,
+        },
+    },
+    'loggers': {
+        'apiService': {'handlers': ['json'], 'level': 'INFO', 'propagate': False},
+        'django.request': {'handlers': ['json'], 'level': 'ERROR', 'propagate': False},
+    },
+}
+
+# İstek logu: URL adı bazında örnekleme oranı; yavaş (ms) ve 5xx istekler
+# her zaman loglanır, SLOW_QUERY_MS'i aşan sorgular ayrıca loglanır
+REQUEST_LOG = {
+    'SAMPLE_RATES': {
+        'tutor-list': 0.01,
+        'tutor-detail': 0.05,
+        'subject-list': 0.01,
+    },
+    'DEFAULT_SAMPLE_RATE': 1.0,
+    'SLOW_REQUEST_MS': 500,
+    'SLOW_QUERY_MS': 100,
+}
+
+# İstek profilleme (apiService/profiling.py): staff kullanıcıların
+# `X-Profile: 1` başlıklı istekleri cProfile ile bu dizine kaydedilir
+PROFILING = {
+    'DIRECTORY': os.environ.get('PICOURSE_PROFILE_DIR') or BASE_DIR / 'profiles',
+    'MAX_QUERIES': 1000,
+}
+
+# Response Compression
+# br ve zstd için opsiyonel 'brotli' ve 'zstandard' paketleri gerekir; kurulu
+# değillerse yalnızca gzip kullanılır.
+COMPRESSION = {
+    'ENCODINGS': ['br', 'zstd', 'gzip'],
+    'MIN_SIZE': 500,
+    'CACHE_ALIAS': 'default',
+    'CACHE_TIMEOUT': 300,
 }
 
 # Spectacular Configuration (Swagger)
@@ -164,3 +283,8 @@ SPECTACULAR_SETTINGS = {
     'VERSION': '1.0.0',
     'SERVE_INCLUDE_SCHEMA': False,
 }
+
+# Önceden üretilen OpenAPI şeması (yanında .json ve kaynak özeti .sha256 tutulur).
+# Build sırasında `python manage.py build_openapi_schema` ile üretilir; kaynaklar
+# değiştiyse /api/schema/ ilk istekte şemayı yeniden üretip dosyaları günceller.
+OPENAPI_SCHEMA_FILE = BASE_DIR / 'openapi-schema.yaml'
@@ -0,0 +1,30 @@
+"""
+Test ayarları
+
+`python manage.py test` bu modülü otomatik kullanır. PBKDF2 yerine MD5
+hasher ile kullanıcı oluşturma maliyeti düşer; TimedTestRunner test
+sonunda en yavaş testleri raporlar. --parallel ile her işlem kendi
+SQLite test veritabanı kopyasını kullanır.
+"""
+from .settings import *  # noqa: F401,F403
+
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+TEST_RUNNER = 'apiService.test_runner.TimedTestRunner'
+
+# Testler kaynak ağacına şema dosyası yazmaz
+OPENAPI_SCHEMA_FILE = None
+
+# Test çıktısını istek loglarıyla doldurmamak için yalnızca hatalar loglanır
+LOGGING['loggers']['apiService']['level'] = 'ERROR'
+
+# Sharding testleri için iki ayrı (bellek içi) SQLite veritabanı; sharding
+# yalnızca LESSON_REQUEST_SHARDS override edilen testlerde açılır
+LESSON_REQUEST_SHARDS = []
+for alias in ('lessons_0', 'lessons_1'):
+    DATABASES[alias] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / f'test_{alias}.sqlite3',
+    }
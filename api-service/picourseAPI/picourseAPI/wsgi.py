@@ -10,7 +10,20 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/wsgi/
 import os
 
 from django.core.wsgi import get_wsgi_application
+from django.db import DatabaseError, connections
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'picourseAPI.settings')
 
 application = get_wsgi_application()
+
+# Otomatik tamamlama dizini ilk istekten önce kurulur; veritabanı hazır
+# değilse ilk aramada kurulur
+from apiService.autocomplete import prefix_index  # noqa: E402
+
+try:
+    prefix_index.build()
+except DatabaseError:
+    pass
+finally:
+    # Süreç fork edilirse (gunicorn --preload) bağlantı paylaşılmasın
+    connections.close_all()